@@ -25,11 +25,7 @@ class AssignmentAdmin(BaseModelAdmin):
         Returns:
             int or None: 연결된 lecture_chapter의 ID, 존재하지 않으면 None.
         """
-        return (
-            obj.chapter_video.lecture_chapter.id
-            if obj.chapter_video and hasattr(obj.chapter_video, "lecture_chapter")
-            else None
-        )
+        return obj.lecture_chapter_id
 
     get_lecture_chapter_id.short_description = "Lecture Chapter ID"
 
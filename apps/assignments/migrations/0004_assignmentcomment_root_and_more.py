@@ -0,0 +1,63 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_comment_root(apps, schema_editor):
+    """기존 대댓글의 최상위 댓글을 parent를 따라가며 계산해서 채움"""
+    AssignmentComment = apps.get_model("assignments", "AssignmentComment")
+
+    parents = dict(AssignmentComment.objects.filter(parent__isnull=False).values_list("id", "parent_id"))
+
+    def find_root(comment_id):
+        while comment_id in parents:
+            comment_id = parents[comment_id]
+        return comment_id
+
+    AssignmentComment.objects.bulk_update(
+        [AssignmentComment(id=comment_id, root_id=find_root(comment_id)) for comment_id in parents],
+        ["root"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assignments", "0003_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assignmentcomment",
+            name="root",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="thread_replies",
+                to="assignments.assignmentcomment",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assignmentcomment",
+            index=models.Index(
+                condition=models.Q(("parent__isnull", True)),
+                fields=["assignment", "created_at", "id"],
+                name="assignment_comment_roots_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assignmentcomment",
+            index=models.Index(
+                condition=models.Q(("parent__isnull", True)),
+                fields=["user", "assignment", "created_at", "id"],
+                name="assignment_comment_user_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_comment_root, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_assignment_ancestors(apps, schema_editor):
+    """기존 과제에 강의 영상의 챕터/과목/과정 ID를 UPDATE 한 번으로 채움"""
+    Assignment = apps.get_model("assignments", "Assignment")
+    ChapterVideo = apps.get_model("courses", "ChapterVideo")
+
+    videos = ChapterVideo.objects.filter(pk=OuterRef("chapter_video_id"))
+    Assignment.objects.update(
+        lecture_chapter_id=Subquery(videos.values("lecture_chapter_id")[:1]),
+        lecture_id=Subquery(videos.values("lecture_chapter__lecture_id")[:1]),
+        course_id=Subquery(videos.values("lecture_chapter__lecture__course_id")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assignments", "0004_assignmentcomment_root_and_more"),
+        ("courses", "0006_chaptervideo_lecture_course"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assignment",
+            name="course",
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, to="courses.course"
+            ),
+        ),
+        migrations.AddField(
+            model_name="assignment",
+            name="lecture",
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, to="courses.lecture"
+            ),
+        ),
+        migrations.AddField(
+            model_name="assignment",
+            name="lecture_chapter",
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, to="courses.lecturechapter"
+            ),
+        ),
+        migrations.RunPython(backfill_assignment_ancestors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assignments", "0005_assignment_lecture_chapter_lecture_course"),
+        ("courses", "0007_alter_chaptervideo_course_alter_chaptervideo_lecture"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="assignment",
+            name="course",
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, to="courses.course"),
+        ),
+        migrations.AlterField(
+            model_name="assignment",
+            name="lecture",
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, to="courses.lecture"),
+        ),
+        migrations.AlterField(
+            model_name="assignment",
+            name="lecture_chapter",
+            field=models.ForeignKey(
+                editable=False, on_delete=django.db.models.deletion.CASCADE, to="courses.lecturechapter"
+            ),
+        ),
+    ]
@@ -1,12 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 
 from apps.common.models import BaseModel
-from apps.common.utils import (
-    assignment_comment_file_path,
-    assignment_material_path,
-    delete_file_from_ncp,
-)
-from apps.courses.models import ChapterVideo
+from apps.common.storage_outbox import enqueue_file_deletion
+from apps.common.utils import assignment_comment_file_path, assignment_material_path
+from apps.courses.models import ChapterVideo, Course, Lecture, LectureChapter
 from apps.users.models import User
 
 
@@ -14,10 +11,15 @@ class Assignment(BaseModel):
     """강의 과제 모델.
 
     강의의 특정 ChapterVideo에 연결된 과제 정보를 저장하며
-    파일이 변경되거나 삭제될 때 NCP Object Storage에서 파일 삭제를 처리.
+    파일이 변경되거나 삭제될 때 NCP Object Storage 파일 삭제를 outbox에 기록.
+    chapter_video의 챕터/과목/과정을 복사해 두고 챕터별 과제 조회, 파일 경로 생성, 캐시 무효화에 JOIN 없이 사용.
     """
 
     chapter_video = models.ForeignKey(ChapterVideo, on_delete=models.CASCADE)
+    # chapter_video의 챕터/과목/과정 (save에서 복사, 상위 객체가 옮겨지면 상위 객체의 save에서 갱신)
+    lecture_chapter = models.ForeignKey(LectureChapter, on_delete=models.CASCADE, editable=False)
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, editable=False)
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, editable=False)
     title = models.CharField(max_length=50)
     content = models.CharField(max_length=1000)
     file_url = models.FileField(upload_to=assignment_material_path, null=True, blank=True)
@@ -25,44 +27,38 @@ class Assignment(BaseModel):
     def save(self, *args, **kwargs):
         """과제 인스턴스를 저장.
 
-        기존 인스턴스인 경우 파일이 변경되었으면 이전 파일을 삭제하며
+        기존 인스턴스인 경우 파일이 변경되었으면 이전 파일 삭제를 outbox에 기록하며
         새 인스턴스에서 파일이 업로드되면 pk값을 생성하기 위해 두 번 저장.
+        새 과제이거나 chapter_video가 바뀌면 강의 영상의 챕터/과목/과정 ID를 복사.
 
         Args:
             *args: 부모 클래스의 save 메서드에 전달될 위치 인자.
             **kwargs: 부모 클래스의 save 메서드에 전달될 키워드 인자.
         """
-
-        if self.pk:
-            try:
-                old_instance = Assignment.objects.get(pk=self.pk)
-                # 파일이 존재하고 새 파일이 기존 파일과 다르면 기존 파일 삭제
-                if old_instance.file_url and old_instance.file_url != self.file_url:
-                    delete_file_from_ncp(old_instance.file_url.name)
-            except Assignment.DoesNotExist:
-                pass
-
-        if not self.pk and self.file_url:
-            temp_file = self.file_url
-            self.file_url = None
-            super().save(*args, **kwargs)
-            self.file_url = temp_file
-            super().save(*args, **kwargs)
-        else:
-            super().save(*args, **kwargs)
-
-    def delete(self, *args, **kwargs):
-        """과제 인스턴스를 삭제.
-
-        NCP Object Storage에서도 파일을 삭제.
-
-        Args:
-            *args: 부모 클래스의 delete 메서드에 전달될 위치 인자.
-            **kwargs: 부모 클래스의 delete 메서드에 전달될 키워드 인자.
-        """
-        if self.file_url:
-            delete_file_from_ncp(self.file_url.name)
-        super().delete(*args, **kwargs)
+        with transaction.atomic():
+            old_instance = (
+                Assignment.objects.filter(pk=self.pk).only("file_url", "chapter_video").first() if self.pk else None
+            )
+            # 파일이 존재하고 새 파일이 기존 파일과 다르면 기존 파일 삭제 예약
+            if old_instance and old_instance.file_url and old_instance.file_url != self.file_url:
+                enqueue_file_deletion(old_instance.file_url.name)
+
+            # 파일 경로(assignment_material_path)가 과정 ID를 사용하므로 저장 전에 복사 (강의 영상 테이블만 조회)
+            if old_instance is None or old_instance.chapter_video_id != self.chapter_video_id:
+                self.lecture_chapter_id, self.lecture_id, self.course_id = (
+                    ChapterVideo.objects.filter(pk=self.chapter_video_id)
+                    .values_list("lecture_chapter_id", "lecture_id", "course_id")
+                    .get()
+                )
+
+            if not self.pk and self.file_url:
+                temp_file = self.file_url
+                self.file_url = None
+                super().save(*args, **kwargs)
+                self.file_url = temp_file
+                super().save(*args, **kwargs)
+            else:
+                super().save(*args, **kwargs)
 
     def __str__(self):
         """과제 제목을 문자열로 반환.
@@ -80,27 +76,53 @@ class AssignmentComment(BaseModel):
     """과제 댓글 모델.
 
     과제에 대한 학생의 제출 및 강사의 피드백을 저장하며
-    파일이 첨부된 경우 NCP Object Storage에서 삭제를 처리.
+    삭제 시 첨부 파일은 signals에서 등록한 post_delete 핸들러가 outbox에 기록.
     """
 
     assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     parent = models.ForeignKey("self", on_delete=models.CASCADE, null=True, blank=True, related_name="replies")
+    # 대댓글이 속한 최상위 댓글 (최상위 댓글 페이지의 대댓글 전체를 한 번에 조회하기 위함, 최상위 댓글은 None)
+    root = models.ForeignKey(
+        "self", on_delete=models.CASCADE, null=True, blank=True, related_name="thread_replies", editable=False
+    )
     file_url = models.FileField(upload_to=assignment_comment_file_path, null=True, blank=True)
     content = models.CharField(max_length=500)
 
-    def delete(self, *args, **kwargs):
-        """과제 댓글 인스턴스를 삭제.
+    def save(self, *args, **kwargs):
+        """댓글을 저장. 대댓글이면 부모 댓글의 최상위 댓글을 root로 지정.
 
-        NCP Object Storage에서도 파일을 삭제.
+        부모 댓글이 바뀐 경우 root를 다시 계산하고, 하위 대댓글의 root도 함께 갱신.
 
         Args:
-            *args: 부모 클래스의 delete 메서드에 전달될 위치 인자.
-            **kwargs: 부모 클래스의 delete 메서드에 전달될 키워드 인자.
+            *args: 부모 클래스의 save 메서드에 전달될 위치 인자.
+            **kwargs: 부모 클래스의 save 메서드에 전달될 키워드 인자.
         """
-        if self.file_url:
-            delete_file_from_ncp(self.file_url.name)
-        super().delete(*args, **kwargs)
+        with transaction.atomic():
+            previous = (
+                AssignmentComment.objects.filter(pk=self.pk).values_list("parent_id", "root_id").first()
+                if self.pk
+                else None
+            )
+            if self.parent_id is None:
+                self.root = None
+            elif self.root_id is None or (previous and previous[0] != self.parent_id):
+                self.root_id = self.parent.root_id or self.parent_id
+            super().save(*args, **kwargs)
+
+            if previous and previous[1] != self.root_id:
+                self._update_descendant_roots()
+
+    def _update_descendant_roots(self):
+        """하위 대댓글 전체의 root를 이 댓글의 최상위 댓글로 갱신 (깊이마다 쿼리 두 번)."""
+        root_id = self.root_id or self.pk
+        visited = {self.pk}
+        parent_ids = [self.pk]
+        while parent_ids:
+            children = AssignmentComment.objects.filter(parent_id__in=parent_ids).exclude(id__in=visited)
+            parent_ids = list(children.values_list("id", flat=True))
+            visited.update(parent_ids)
+            AssignmentComment.objects.filter(id__in=parent_ids).update(root_id=root_id)
 
     def __str__(self):
         """댓글 작성자의 닉네임 또는 username을 문자열로 반환.
@@ -112,3 +134,16 @@ class AssignmentComment(BaseModel):
 
     class Meta:
         db_table = "assignment_comment"
+        # 과제별 최상위 댓글 keyset 페이지네이션 (강사: 전체, 학생: 본인 댓글)
+        indexes = [
+            models.Index(
+                fields=["assignment", "created_at", "id"],
+                condition=models.Q(parent__isnull=True),
+                name="assignment_comment_roots_idx",
+            ),
+            models.Index(
+                fields=["user", "assignment", "created_at", "id"],
+                condition=models.Q(parent__isnull=True),
+                name="assignment_comment_user_idx",
+            ),
+        ]
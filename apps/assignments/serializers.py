@@ -1,10 +1,9 @@
 import os
 import re
 
-import boto3
 from rest_framework import serializers
 
-from apps.common.utils import generate_download_signed_url
+from apps.common.utils import generate_signed_urls
 
 from .models import Assignment, AssignmentComment
 
@@ -23,7 +22,7 @@ class AssignmentSerializer(serializers.ModelSerializer):
         download_info (dict or None): 파일이 존재할 경우 다운로드 정보를 담은 딕셔너리.
             - file_name (str): UUID 및 구분자가 제거된 원래 파일명.
             - object_key (str): 실제 파일 저장 경로.
-            - download_url (str): 서명된 다운로드 URL.
+            - download_url (str): 서명된 다운로드 URL (뷰에서 attach_download_urls로 일괄 생성).
     """
 
     download_info = serializers.SerializerMethodField()
@@ -35,6 +34,8 @@ class AssignmentSerializer(serializers.ModelSerializer):
     def get_download_info(self, obj):
         """파일이 존재하면 다운로드 정보를 담은 딕셔너리를 반환.
 
+        download_url은 응답 직전에 뷰에서 목록 전체를 한 번에 서명해서 채움.
+
         Args:
             obj (Assignment): 직렬화할 Assignment 인스턴스.
 
@@ -44,14 +45,9 @@ class AssignmentSerializer(serializers.ModelSerializer):
         if obj.file_url:
             original_file_name = os.path.basename(obj.file_url.name)
             processed_filename = self.extract_original_filename(original_file_name)
-            signed_url = generate_download_signed_url(
-                object_key=obj.file_url.name,
-                original_filename=processed_filename,
-            )
             return {
                 "file_name": processed_filename,
                 "object_key": obj.file_url.name,
-                "download_url": signed_url,
             }
         return None
 
@@ -78,16 +74,21 @@ class AssignmentCommentSerializer(serializers.ModelSerializer):
 
     댓글의 기본 정보와 함께 대댓글(replies) 및 파일 다운로드 정보(download_info)를 제공.
 
+    context에 "comment_tree"가 있으면 serialize_comment_tree가 미리 조회한 댓글 목록으로 동작하므로
+    replies는 빈 목록으로 두고(트리 조립 시 채움) file_url은 미리 서명한 URL을 사용.
+
     Attributes:
         replies (list): 해당 댓글에 대한 대댓글들을 재귀적으로 직렬화한 목록.
+        file_url (str or None): 첨부 파일의 Signed URL.
         nickname (str): 작성자의 닉네임 (읽기 전용).
         download_info (dict or None): 첨부 파일이 있을 경우 다운로드 정보를 담은 딕셔너리.
             - file_name (str): UUID 및 구분자가 제거된 원래 파일명.
             - object_key (str): 실제 파일 저장 경로.
-            - download_url (str): 서명된 다운로드 URL.
+            - download_url (str): 서명된 다운로드 URL (뷰에서 attach_download_urls로 일괄 생성).
     """
 
     replies = serializers.SerializerMethodField()
+    file_url = serializers.SerializerMethodField()
     nickname = serializers.CharField(source="user.nickname", read_only=True)
     download_info = serializers.SerializerMethodField()
 
@@ -115,12 +116,32 @@ class AssignmentCommentSerializer(serializers.ModelSerializer):
         Returns:
             list: 직렬화된 대댓글 목록.
         """
+        if "comment_tree" in self.context:
+            return []
         qs = obj.replies.all()
-        return AssignmentCommentSerializer(qs, many=True).data
+        return AssignmentCommentSerializer(qs, many=True, context=self.context).data
+
+    def get_file_url(self, obj):
+        """첨부 파일의 Signed URL을 반환 (트리 조회 시 미리 한 번에 서명한 URL 사용).
+
+        Args:
+            obj (AssignmentComment): 댓글 인스턴스.
+
+        Returns:
+            str or None: Signed URL. 첨부 파일이 없으면 None.
+        """
+        if not obj.file_url:
+            return None
+        file_urls = self.context.get("file_urls")
+        if file_urls is not None:
+            return file_urls[obj.file_url.name]
+        return obj.file_url.url
 
     def get_download_info(self, obj):
         """첨부 파일이 있을 경우, 다운로드 정보를 담은 딕셔너리를 반환.
 
+        download_url은 응답 직전에 뷰에서 댓글 트리 전체를 한 번에 서명해서 채움.
+
         Args:
             obj (AssignmentComment): 직렬화할 댓글 인스턴스.
 
@@ -130,13 +151,9 @@ class AssignmentCommentSerializer(serializers.ModelSerializer):
         if obj.file_url:
             original_file_name = os.path.basename(obj.file_url.name)
             processed_filename = self.extract_original_filename(original_file_name)
-            signed_url = generate_download_signed_url(
-                object_key=obj.file_url.name, original_filename=processed_filename, expiration=3600
-            )
             return {
                 "file_name": processed_filename,
                 "object_key": obj.file_url.name,
-                "download_url": signed_url,
             }
         return None
 
@@ -158,6 +175,38 @@ class AssignmentCommentSerializer(serializers.ModelSerializer):
         return file_name
 
 
+def serialize_comment_tree(comments, context=None, expiration=3600):
+    """미리 조회한 댓글 목록을 직렬화하고 parent 기준으로 트리를 조립.
+
+    댓글마다 대댓글을 다시 조회하고 첨부 파일을 따로 서명하는 대신,
+    Signed URL 캐시에 없는 첨부 파일만 한 번에 서명하고 직렬화한 댓글을 부모의 replies에 붙임.
+
+    Args:
+        comments (Iterable[AssignmentComment]): 최상위 댓글과 그 대댓글 전체
+            (대댓글은 created_at 순, user select_related).
+        context (dict, optional): 직렬화에 사용할 context.
+        expiration (int): 첨부 파일 URL 유효 시간 (초 단위).
+
+    Returns:
+        list[dict]: 최상위 댓글 목록. 대댓글은 각 댓글의 replies에 created_at 순으로 포함.
+    """
+    comments = list(comments)
+    object_keys = list({comment.file_url.name for comment in comments if comment.file_url})
+    signed_urls = generate_signed_urls(object_keys, expiration) if object_keys else []
+
+    context = {**(context or {}), "comment_tree": True, "file_urls": dict(zip(object_keys, signed_urls))}
+    comments_data = AssignmentCommentSerializer(comments, many=True, context=context).data
+
+    by_id = {comment["id"]: comment for comment in comments_data}
+    roots = []
+    for comment in comments_data:
+        if comment["parent"] is None:
+            roots.append(comment)
+        elif comment["parent"] in by_id:
+            by_id[comment["parent"]]["replies"].append(comment)
+    return roots
+
+
 class AssignmentCommentCreateSerializer(serializers.ModelSerializer):
     """강의 과제 제출을 위한 직렬화 클래스.
 
@@ -1,17 +1,22 @@
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from apps.common.utils import redis_client
+from apps.common import cache_keys
+from apps.common.storage_outbox import register_file_cleanup
 
-from .models import Assignment
+from .models import Assignment, AssignmentComment
+
+# 삭제 시(queryset, CASCADE 삭제 포함) 파일 삭제를 outbox에 기록
+register_file_cleanup(Assignment, "file_url")
+register_file_cleanup(AssignmentComment, "file_url")
 
 
 @receiver(pre_save, sender=Assignment)
 def clear_assignment_cache_pre_save(sender, instance, **kwargs):
-    """저장 전 chapter_video 변경 시 이전 lecture_chapter 캐시를 삭제.
+    """저장 전 chapter_video 변경 시 이전 lecture_chapter 캐시를 무효화.
 
     기존 Assignment 인스턴스와 비교하여 chapter_video가 변경된 경우
-    이전 lecture_chapter와 연관된 Redis 캐시를 삭제.
+    이전 lecture_chapter의 과제 목록 캐시 세대 번호를 올림.
 
     Args:
         sender (Model): Assignment 모델 클래스.
@@ -20,25 +25,24 @@ def clear_assignment_cache_pre_save(sender, instance, **kwargs):
     """
 
     if instance.pk:
-        try:
-            old_instance = Assignment.objects.get(pk=instance.pk)
-            if old_instance.chapter_video_id != instance.chapter_video_id:
-                # 이전 chapter_video에 연결된 lecture_chapter의 캐시 삭제
-                old_cache_key = f"assignments_{old_instance.chapter_video.lecture_chapter.id}"
-                redis_client.delete(old_cache_key)
-        except Assignment.DoesNotExist:
-            pass
+        old_instance = (
+            Assignment.objects.filter(pk=instance.pk).values("chapter_video_id", "lecture_chapter_id").first()
+        )
+        if old_instance and old_instance["chapter_video_id"] != instance.chapter_video_id:
+            # 이전 chapter_video에 연결된 lecture_chapter의 캐시와 권한 확인용 객체 -> 과정 ID 캐시 무효화
+            cache_keys.invalidate(
+                (cache_keys.LECTURE_CHAPTER, old_instance["lecture_chapter_id"]),
+                (cache_keys.CONTENT, cache_keys.ALL),
+            )
 
 
 @receiver([post_save, post_delete], sender=Assignment)
 def clear_assignment_cache(sender, instance, **kwargs):
-    """Assignment 모델 변경 시, 관련 Redis 캐시를 삭제.
+    """Assignment 모델 변경 시, 관련 과제 목록 캐시를 무효화.
 
     Args:
         sender (Model): Assignment 모델.
         instance (Assignment): 변경된 Assignment 인스턴스.
         **kwargs: 추가 인자.
     """
-    lecture_chapter_id = instance.chapter_video.lecture_chapter.id
-    cache_key = f"assignments_{lecture_chapter_id}"
-    redis_client.delete(cache_key)
+    cache_keys.invalidate((cache_keys.LECTURE_CHAPTER, instance.lecture_chapter_id))
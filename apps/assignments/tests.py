@@ -1,3 +1,226 @@
+import importlib
+import uuid
+from unittest import mock
+
+from django.apps import apps
 from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.assignments.models import Assignment, AssignmentComment
+from apps.common.utils import signed_url_cache
+from apps.courses.models import ChapterVideo, Course, Lecture, LectureChapter
+from apps.registrations.models import Enrollment
+from apps.users.models import Instructor, Student, User
+
+
+class AssignmentCommentViewTest(TestCase):
+    """과제 댓글 트리 조회 API 테스트"""
+
+    def setUp(self):
+        self.instructor_user = User.objects.create_user(
+            "instructor@test.com", "password", name="강사", nickname="강사", phone_number="01000000000"
+        )
+        Instructor.objects.create(user=self.instructor_user)
+        self.student_user = User.objects.create_user(
+            "student@test.com", "password", name="학생", nickname="학생", phone_number="01011111111"
+        )
+        Student.objects.create(user=self.student_user)
+
+        course = Course.objects.create(title="과정", price=0)
+        lecture = Lecture.objects.create(
+            course=course, title="과목", introduction="소개", learning_objective="목표", progress_rate=0
+        )
+        chapter = LectureChapter.objects.create(lecture=lecture, title="챕터")
+        video = ChapterVideo.objects.create(lecture_chapter=chapter, title="영상")
+        self.assignment = Assignment.objects.create(chapter_video=video, title="과제", content="내용")
+
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.instructor_user)}")
+
+    def create_comments(self, count):
+        """학생의 최상위 댓글과 강사의 대댓글, 대댓글의 대댓글을 번갈아 가며 count개 생성"""
+        comments = []
+        for index in range(count):
+            if index % 3 == 0:
+                parent, user = None, self.student_user
+            else:
+                parent, user = comments[-1], self.instructor_user
+            comments.append(
+                AssignmentComment.objects.create(
+                    assignment=self.assignment, user=user, parent=parent, content=f"댓글 {index}"
+                )
+            )
+        return comments
+
+    def get_comments(self):
+        return self.client.get(f"/api/v1/assignments/assignment-comment/{self.assignment.id}/")
+
+    def test_query_count_does_not_grow_with_comments(self):
+        self.get_comments()  # 권한 확인용 캐시를 채움
+
+        # 인증 한 번 + 최상위 댓글 한 페이지 조회 한 번 + 그 대댓글 조회 한 번
+        for count in (1, 10, 500):
+            AssignmentComment.objects.all().delete()
+            self.create_comments(count)
+            with self.assertNumQueries(3):
+                response = self.get_comments()
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data["results"]), min((count + 2) // 3, 20))
+
+    def test_replies_are_nested_in_created_order(self):
+        root, reply, nested_reply = self.create_comments(3)
+        second_reply = AssignmentComment.objects.create(
+            assignment=self.assignment, user=self.instructor_user, parent=root, content="두 번째 답변"
+        )
+
+        results = self.get_comments().data["results"]
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["id"], root.id)
+        self.assertEqual([item["id"] for item in results[0]["replies"]], [reply.id, second_reply.id])
+        self.assertEqual(results[0]["replies"][0]["replies"][0]["id"], nested_reply.id)
+        self.assertEqual(results[0]["replies"][0]["nickname"], "강사")
+
+    def test_student_sees_only_own_threads(self):
+        own_root, own_reply, _ = self.create_comments(3)
+        other_user = User.objects.create_user(
+            "other@test.com", "password", name="다른 학생", nickname="다른 학생", phone_number="01022222222"
+        )
+        Student.objects.create(user=other_user)
+        other_root = AssignmentComment.objects.create(assignment=self.assignment, user=other_user, content="다른 댓글")
+        AssignmentComment.objects.create(
+            assignment=self.assignment, user=self.instructor_user, parent=other_root, content="다른 답변"
+        )
+        Enrollment.objects.create(course=self.assignment.course, student=self.student_user.student, is_active=True)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.student_user)}")
+
+        results = self.get_comments().data["results"]
+
+        self.assertEqual([item["id"] for item in results], [own_root.id])
+        self.assertEqual([item["id"] for item in results[0]["replies"]], [own_reply.id])
+
+    def test_file_urls_are_reused_from_signed_url_cache(self):
+        root, reply, _ = self.create_comments(3)
+        object_key = f"classes/test/assignments/{uuid.uuid4().hex}.pdf"
+        AssignmentComment.objects.filter(id__in=[root.id, reply.id]).update(file_url=object_key)
+        signed_url_cache.clear()
+        self.addCleanup(signed_url_cache.clear)
+
+        with mock.patch("apps.common.utils.get_presigner") as get_presigner:
+            presign_get_many = get_presigner.return_value.presign_get_many
+            presign_get_many.side_effect = lambda object_keys, *args: [f"https://signed/{key}" for key in object_keys]
+            first = self.get_comments().data["results"]
+            signed_count = presign_get_many.call_count
+            second = self.get_comments().data["results"]
+
+        # 같은 파일은 한 번만 서명하고 (file_url + download_url), 다음 요청은 캐시된 URL을 사용
+        self.assertEqual(signed_count, 2)
+        self.assertEqual(presign_get_many.call_count, signed_count)
+        self.assertEqual(first[0]["file_url"], f"https://signed/{object_key}")
+        self.assertEqual(first[0]["replies"][0]["file_url"], first[0]["file_url"])
+        self.assertEqual(second, first)
+
+
+class AssignmentCommentRootTest(TestCase):
+    """대댓글의 최상위 댓글(root) 갱신 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            "instructor@test.com", "password", name="강사", nickname="강사", phone_number="01000000000"
+        )
+        course = Course.objects.create(title="과정", price=0)
+        lecture = Lecture.objects.create(
+            course=course, title="과목", introduction="소개", learning_objective="목표", progress_rate=0
+        )
+        chapter = LectureChapter.objects.create(lecture=lecture, title="챕터")
+        video = ChapterVideo.objects.create(lecture_chapter=chapter, title="영상")
+        self.assignment = Assignment.objects.create(chapter_video=video, title="과제", content="내용")
+
+    def create_thread(self):
+        """최상위 댓글, 대댓글, 대댓글의 대댓글을 생성"""
+        comments = []
+        for index in range(3):
+            comments.append(
+                AssignmentComment.objects.create(
+                    assignment=self.assignment,
+                    user=self.user,
+                    parent=comments[-1] if comments else None,
+                    content=f"댓글 {index}",
+                )
+            )
+        return comments
+
+    def assertRoots(self, expected):
+        self.assertEqual(dict(AssignmentComment.objects.filter(id__in=expected).values_list("id", "root_id")), expected)
+
+    def test_reparented_reply_moves_to_new_thread(self):
+        first_root, reply, nested_reply = self.create_thread()
+        second_root = self.create_thread()[0]
+
+        reply.parent = second_root
+        reply.save()
+
+        self.assertRoots({reply.id: second_root.id, nested_reply.id: second_root.id, first_root.id: None})
+
+    def test_root_comment_moved_under_another_thread(self):
+        first_root, reply, nested_reply = self.create_thread()
+        second_root = self.create_thread()[0]
+
+        first_root.parent = second_root
+        first_root.save()
+
+        self.assertRoots({first_root.id: second_root.id, reply.id: second_root.id, nested_reply.id: second_root.id})
+
+    def test_reply_promoted_to_root(self):
+        _, reply, nested_reply = self.create_thread()
+
+        reply.parent = None
+        reply.save()
+
+        self.assertRoots({reply.id: None, nested_reply.id: reply.id})
+
+    def test_saving_without_moving_keeps_root(self):
+        first_root, reply, _ = self.create_thread()
+
+        # savepoint 두 번 + 이전 부모 조회 + UPDATE (하위 대댓글은 갱신하지 않음)
+        with self.assertNumQueries(4):
+            reply.content = "수정"
+            reply.save()
+
+        self.assertRoots({reply.id: first_root.id})
+
+
+class AssignmentAncestorBackfillTest(TestCase):
+    """0005 마이그레이션의 과제 상위 객체 ID backfill 테스트"""
+
+    def test_backfill_fills_existing_assignments(self):
+        course = Course.objects.create(title="과정", price=0)
+        lecture = Lecture.objects.create(
+            course=course, title="과목", introduction="소개", learning_objective="목표", progress_rate=0
+        )
+        chapter = LectureChapter.objects.create(lecture=lecture, title="챕터")
+        video = ChapterVideo.objects.create(lecture_chapter=chapter, title="영상")
+        assignment = Assignment.objects.create(chapter_video=video, title="과제", content="내용")
+
+        # 컬럼 추가 전부터 있던 행처럼 다른 챕터/과목/과정을 가리키게 한 뒤 backfill 실행
+        other_course = Course.objects.create(title="다른 과정", price=0)
+        other_lecture = Lecture.objects.create(
+            course=other_course, title="다른 과목", introduction="소개", learning_objective="목표", progress_rate=0
+        )
+        other_chapter = LectureChapter.objects.create(lecture=other_lecture, title="다른 챕터")
+        Assignment.objects.filter(pk=assignment.pk).update(
+            lecture_chapter=other_chapter, lecture=other_lecture, course=other_course
+        )
+        migration = importlib.import_module(
+            "apps.assignments.migrations.0005_assignment_lecture_chapter_lecture_course"
+        )
+
+        migration.backfill_assignment_ancestors(apps, None)
 
-# Create your tests here.
+        assignment.refresh_from_db()
+        self.assertEqual(
+            (assignment.lecture_chapter_id, assignment.lecture_id, assignment.course_id),
+            (chapter.id, lecture.id, course.id),
+        )
@@ -1,21 +1,35 @@
-import json
-
 from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common import cache_keys
+from apps.common.cache_fill import get_or_fill
+from apps.common.pagination import (
+    KEYSET_PAGINATION_PARAMETERS,
+    KeysetPagination,
+    keyset_page_schema,
+)
 from apps.common.permissions import IsActiveStudentOrInstructor
-from apps.common.utils import generate_download_signed_url, redis_client
+from apps.common.utils import attach_download_urls, copy_download_infos
+from apps.users.roles import get_role
 
 from .models import Assignment, AssignmentComment
 from .serializers import (
     AssignmentCommentCreateSerializer,
     AssignmentCommentSerializer,
     AssignmentSerializer,
+    serialize_comment_tree,
 )
 
 
+def _iter_download_infos(comments):
+    """직렬화된 댓글 트리를 순회하며 download_info를 반환."""
+    for comment in comments:
+        yield comment.get("download_info")
+        yield from _iter_download_infos(comment.get("replies") or [])
+
+
 class AssignmentView(APIView):
     """강의 챕터별 과제 목록 조회 API.
 
@@ -36,8 +50,8 @@ class AssignmentView(APIView):
     def get(self, request, lecture_chapter_id):
         """lecture_chapter_id를 기반으로 과제 목록을 조회.
 
-        Redis 캐싱을 사용하여 조회 성능을 개선하며
-        캐시된 데이터가 있을 경우 download_info의 URL을 갱신
+        Redis 캐싱을 사용하여 조회 성능을 개선하며 (캐시가 비면 동시에 들어온 요청 중 한 요청만 DB 조회)
+        download_info의 URL은 캐시 여부와 관계없이 응답 직전에 일괄 생성
 
         Args:
             request (Request): 요청 객체.
@@ -49,28 +63,23 @@ class AssignmentView(APIView):
         if lecture_chapter_id <= 0:
             return Response({"error": "잘못된 lecture_chapter_id 입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        cache_key = f"assignments_{lecture_chapter_id}"
-        cached_data = redis_client.get(cache_key)
-
-        if cached_data:
-            assignments_data = json.loads(cached_data)
-            # 캐시된 데이터 내 download_info 갱신: URL 유효시간 등 만료된 정보를 업데이트
-            for assignment in assignments_data:
-                download_info = assignment.get("download_info")
-                if download_info:
-                    object_key = download_info.get("object_key")
-                    file_name = download_info.get("file_name")
-                    # generate_material_signed_url의 expiration 인자 값을 3600초(1시간)으로 사용
-                    new_url = generate_download_signed_url(
-                        object_key=object_key, original_filename=file_name, expiration=3600
-                    )
-                    download_info["download_url"] = new_url
-        else:
-            assignments = Assignment.objects.filter(chapter_video__lecture_chapter__id=lecture_chapter_id)
-            serializer = AssignmentSerializer(assignments, many=True, context={"request": request})
-            assignments_data = serializer.data
-            CACHE_TIMEOUT = 5 * 3600
-            redis_client.setex(cache_key, CACHE_TIMEOUT, json.dumps(assignments_data))
+        def build():
+            # 캐시가 없으면 동시에 들어온 요청 중 한 요청만 DB 조회
+            assignments = Assignment.objects.filter(lecture_chapter_id=lecture_chapter_id)
+            return AssignmentSerializer(assignments, many=True, context={"request": request}).data
+
+        CACHE_TIMEOUT = 5 * 3600
+        cached_data = get_or_fill(
+            "assignments",
+            [(cache_keys.LECTURE_CHAPTER, lecture_chapter_id)],
+            build,
+            timeout=CACHE_TIMEOUT,
+            stale_timeout=24 * 3600,
+        )
+
+        # 캐시에는 download_url 없이 저장하고, 응답 직전에 복사본에 모든 과제 파일의 URL을 한 번에 서명 (유효시간 1시간)
+        assignments_data = copy_download_infos(cached_data, "download_info")
+        attach_download_urls([assignment.get("download_info") for assignment in assignments_data], expiration=3600)
 
         return Response(
             {"lecture_chapter_id": lecture_chapter_id, "assignments": assignments_data},
@@ -93,35 +102,46 @@ class AssignmentCommentView(APIView):
 
     @extend_schema(
         summary="수강생 과제 및 피드백 목록 조회",
-        description="부모가 없는 최상위 댓글만 조회합니다.",
+        description="부모가 없는 최상위 댓글을 작성순으로 조회하며 대댓글은 replies에 포함됩니다. "
+        "다음 페이지는 응답의 next로 요청합니다.",
+        parameters=KEYSET_PAGINATION_PARAMETERS,
         responses={
-            200: AssignmentCommentSerializer(many=True),
+            200: keyset_page_schema("AssignmentCommentPage", AssignmentCommentSerializer(many=True)),
             400: OpenApiExample("오류 예시", value={"error": "유효하지 않은 요청입니다."}),
         },
         tags=["Assignment"],
     )
     def get(self, request, assignment_id):
-        """특정 과제의 최상위 댓글을 조회.
+        """특정 과제의 최상위 댓글을 한 페이지씩 조회.
 
         강사인 경우 모든 댓글을 조회하고, 학생인 경우 자신이 작성한 댓글만 조회.
+        최상위 댓글 한 페이지와 그 대댓글 전체(root 기준)를 작성자와 함께 각각 한 번씩 조회한 뒤
+        메모리에서 트리를 조립하므로 댓글 수와 관계없이 쿼리 수가 일정함.
 
         Args:
             request (Request): 요청 객체.
             assignment_id (int): 과제의 식별자.
 
         Returns:
-            Response: 직렬화된 댓글 목록.
+            Response: 직렬화된 댓글 페이지.
         """
-        if hasattr(request.user, "instructor"):
-            # 강사는 해당 과제에 속한 모든 최상위 댓글을 조회
-            comments = AssignmentComment.objects.filter(parent__isnull=True, assignment=assignment_id)
-        else:
-            # 학생은 본인이 작성한 최상위 댓글만 조회
-            comments = AssignmentComment.objects.filter(
-                parent__isnull=True, assignment=assignment_id, user=request.user
+        roots = AssignmentComment.objects.filter(assignment=assignment_id, parent__isnull=True).select_related("user")
+        if not get_role(request).is_instructor:
+            # 학생은 본인이 작성한 최상위 댓글(과 그 대댓글)만 조회
+            roots = roots.filter(user=request.user)
+
+        paginator = KeysetPagination(descending=False)
+        roots = paginator.paginate_queryset(roots, request, self)
+        replies = []
+        if roots:
+            replies = (
+                AssignmentComment.objects.filter(root__in=roots).select_related("user").order_by("created_at", "id")
             )
-        serializer = AssignmentCommentSerializer(comments, many=True, context={"request": request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        comments_data = serialize_comment_tree([*roots, *replies], context={"request": request})
+
+        # 대댓글까지 포함한 모든 첨부 파일의 download_url을 한 번에 서명
+        attach_download_urls(_iter_download_infos(comments_data), expiration=3600)
+        return paginator.get_paginated_response(comments_data)
 
     @extend_schema(
         summary="강의 과제 제출",
@@ -159,7 +179,7 @@ class AssignmentCommentView(APIView):
         except Assignment.DoesNotExist:
             return Response({"detail": "해당 과제를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        if request.data.get("parent") and not hasattr(request.user, "instructor"):
+        if request.data.get("parent") and not get_role(request).is_instructor:
             return Response({"detail": "대댓글 작성은 강사만 가능합니다."}, status=status.HTTP_403_FORBIDDEN)
 
         data = request.data.copy()
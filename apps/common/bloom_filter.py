@@ -0,0 +1,90 @@
+import hashlib
+
+from apps.common.utils import redis_client
+
+
+class RedisBloomFilter:
+    """Redis 비트맵(SETBIT/GETBIT)으로 만든 Bloom filter.
+
+    "없음"은 확실하고 "있음"은 num_bits, num_hashes에 따른 확률로 틀릴 수 있으므로
+    might_contain_many가 True를 반환한 값만 DB에서 다시 확인하는 용도로 사용.
+    값을 지울 수 없으므로 삭제된 값이 많아지면 rebuild로 다시 만듦.
+
+    Attributes:
+        key (str): 비트맵을 저장할 Redis 키.
+        num_bits (int): 비트맵 크기 (최대 2^32).
+        num_hashes (int): 값마다 설정할 비트 수.
+    """
+
+    def __init__(self, key, num_bits, num_hashes):
+        self.key = key
+        self.ready_key = f"{key}:ready"
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+
+    def _offsets(self, value):
+        # blake2b 다이제스트 두 개를 조합해서 k개의 비트 위치를 만듦 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(str(value).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add_many(self, values, key=None):
+        """값들을 필터에 추가 (파이프라인 한 번)."""
+        pipeline = redis_client.pipeline(transaction=False)
+        for value in values:
+            for offset in self._offsets(value):
+                pipeline.setbit(key or self.key, offset, 1)
+        pipeline.execute()
+
+    def might_contain_many(self, values):
+        """값마다 필터에 있을 수 있는지 확인 (Redis 왕복 한 번).
+
+        Args:
+            values (list[str]): 확인할 값 목록.
+
+        Returns:
+            list[bool] | None: values 순서에 맞게 있을 수 있으면 True, 확실히 없으면 False.
+                필터를 아직 만들지 않았으면 None.
+        """
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.exists(self.ready_key)
+        for value in values:
+            for offset in self._offsets(value):
+                pipeline.getbit(self.key, offset)
+        ready, *bits = pipeline.execute()
+        if not ready:
+            return None
+        return [all(bits[index : index + self.num_hashes]) for index in range(0, len(bits), self.num_hashes)]
+
+    def rebuild(self, values, batch_size=1000):
+        """임시 키에 필터를 새로 만들고 기존 필터와 교체.
+
+        Args:
+            values (Iterable[str]): 필터에 넣을 모든 값.
+            batch_size (int): 파이프라인 한 번에 추가할 값 수.
+
+        Returns:
+            int: 추가한 값 수.
+        """
+        building_key = f"{self.key}:building"
+        redis_client.delete(building_key)
+        redis_client.setbit(building_key, self.num_bits - 1, 0)  # 비트맵 크기를 미리 할당
+
+        count = 0
+        batch = []
+        for value in values:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                self.add_many(batch, key=building_key)
+                count += len(batch)
+                batch = []
+        if batch:
+            self.add_many(batch, key=building_key)
+            count += len(batch)
+
+        pipeline = redis_client.pipeline(transaction=True)
+        pipeline.rename(building_key, self.key)
+        pipeline.set(self.ready_key, "1")
+        pipeline.execute()
+        return count
@@ -0,0 +1,130 @@
+import json
+import math
+import random
+import time
+import uuid
+
+from django.conf import settings
+
+from apps.common import cache_keys
+from apps.common.utils import near_cache, redis_client
+
+LOCK_KEY = "cache_fill_lock:{cache_key}"
+
+# 잠금을 건 요청의 토큰과 일치할 때만 삭제 (만료 후 다른 요청이 다시 건 잠금을 지우지 않기 위함)
+_RELEASE_LOCK_SCRIPT = redis_client.register_script(
+    """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+)
+
+
+def _should_refresh_early(entry, beta):
+    """XFetch: 만료가 가까울수록, 다시 만드는 데 오래 걸린 값일수록 높은 확률로 미리 갱신할지 결정."""
+    if not beta:
+        return False
+    return time.time() - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expires_at"]
+
+
+def _acquire_lock(cache_key):
+    token = uuid.uuid4().hex
+    lock_timeout_ms = int(settings.CACHE_FILL_LOCK_TIMEOUT * 1000)
+    if redis_client.set(LOCK_KEY.format(cache_key=cache_key), token, px=lock_timeout_ms, nx=True):
+        return token
+    return None
+
+
+def _release_lock(cache_key, token):
+    _RELEASE_LOCK_SCRIPT(keys=[LOCK_KEY.format(cache_key=cache_key)], args=[token])
+
+
+def _get_stale(stale_key):
+    if stale_key is None:
+        return None
+    stale = redis_client.get(stale_key)
+    return json.loads(stale) if stale is not None else None
+
+
+def _get_entry(cache_key):
+    entry = near_cache.get(cache_key)
+    if not isinstance(entry, dict) or "expires_at" not in entry:
+        return None  # get_or_fill 이전 형식(값만 저장)으로 캐시된 값은 없는 것으로 보고 다시 만듦
+    return entry
+
+
+def _fill(cache_key, build, timeout, stale_key, stale_timeout):
+    """값을 만들어 캐시(와 stale 복사본)에 저장하고 반환. build가 None을 반환하면 저장하지 않음."""
+    started = time.time()
+    value = build()
+    if value is None:
+        return None
+
+    delta = time.time() - started
+    entry = near_cache.set(cache_key, {"value": value, "delta": delta, "expires_at": time.time() + timeout}, timeout)
+    if stale_key is not None:
+        redis_client.setex(stale_key, stale_timeout, json.dumps(entry["value"]))
+    return entry["value"]
+
+
+def get_or_fill(name, scopes, build, timeout, stale_timeout=None, beta=None):
+    """캐시된 값을 반환하고, 없으면 여러 요청 중 한 요청만 build를 실행해서 채움 (single-flight).
+
+    - 캐시가 없으면 Redis 잠금(SET NX PX)을 얻은 요청만 build를 실행하고, 나머지 요청은
+      stale 복사본이 있으면 바로 반환하고(stale-while-revalidate) 없으면 채워질 때까지 잠시 기다림.
+    - beta를 지정하면 만료 전에 XFetch 확률로 한 요청이 미리 값을 다시 만들고 나머지는 기존 값을 반환.
+    - stale 복사본은 세대 번호가 없는 키에 저장되므로 시그널로 무효화된 직후에도 이전 값을 반환할 수 있음.
+      무효화 직후 잠시 이전 데이터가 보여도 되는 캐시에만 stale_timeout을 지정.
+
+    Args:
+        name (str): 캐시 이름 (예: "lecture_chapters").
+        scopes (list[tuple[str, int | str]]): 캐시 데이터가 의존하는 (scope, scope_id) 목록.
+        build (Callable[[], Any]): 캐시할 값을 만드는 함수. None을 반환하면 캐시하지 않음 (예: 404).
+        timeout (int): 캐시 TTL (초).
+        stale_timeout (int, optional): stale 복사본 보관 기간 (초). 없으면 stale 값을 반환하지 않음.
+        beta (float, optional): XFetch 가중치 (클수록 일찍 갱신). 없으면 CACHE_FILL_BETA 설정값, 0이면 사용 안 함.
+
+    Returns:
+        Any: 캐시된 값 또는 build 결과 (JSON으로 저장했다가 다시 읽은 값).
+    """
+    beta = settings.CACHE_FILL_BETA if beta is None else beta
+    cache_key = cache_keys.make_cache_key(name, *scopes)
+    stale_key = cache_keys.make_stale_key(name, *scopes) if stale_timeout else None
+
+    entry = _get_entry(cache_key)
+    if entry is not None:
+        if not _should_refresh_early(entry, beta):
+            return entry["value"]
+        # 미리 갱신은 잠금을 얻은 한 요청만 하고, 나머지는 아직 유효한 기존 값을 반환
+        token = _acquire_lock(cache_key)
+        if token is None:
+            return entry["value"]
+        try:
+            value = _fill(cache_key, build, timeout, stale_key, stale_timeout)
+        finally:
+            _release_lock(cache_key, token)
+        return entry["value"] if value is None else value
+
+    deadline = time.monotonic() + settings.CACHE_FILL_WAIT_TIMEOUT
+    while True:
+        token = _acquire_lock(cache_key)
+        if token is not None:
+            try:
+                return _fill(cache_key, build, timeout, stale_key, stale_timeout)
+            finally:
+                _release_lock(cache_key, token)
+
+        stale = _get_stale(stale_key)
+        if stale is not None:
+            return stale
+
+        # 다른 요청이 값을 만드는 중이면 잠시 기다렸다가 채워진 값을 사용
+        time.sleep(settings.CACHE_FILL_POLL_INTERVAL)
+        entry = _get_entry(cache_key)
+        if entry is not None:
+            return entry["value"]
+        if time.monotonic() >= deadline:
+            # 잠금을 건 요청이 너무 오래 걸리면 기다리지 않고 직접 만듦
+            return _fill(cache_key, build, timeout, stale_key, stale_timeout)
@@ -0,0 +1,97 @@
+from django.db import transaction
+
+from apps.common.utils import near_cache, redis_client
+
+# 캐시 무효화 범위 (scope). 캐시 키에 범위별 세대(generation) 번호를 넣고, 무효화는 세대 번호를 INCR
+LECTURE = "lecture"
+LECTURE_CHAPTER = "lecture_chapter"
+COURSE = "course"
+USER = "user"
+STUDENT = "student"
+TERMS = "terms"
+ENROLLMENT = "enrollment"  # 학생별 수강 정보 (권한 확인용 활성 과정 캐시)
+CONTENT = "content"  # 과정 > 과목 > 챕터 > 강의 영상 > 과제 구조 (객체가 다른 상위 객체로 옮겨질 때만 무효화)
+
+ALL = "all"  # 특정 ID가 아닌 범위 전체 (예: (LECTURE, ALL)는 모든 과목 목록)
+
+GENERATION_KEY = "cache_generation:{scope}:{scope_id}"
+
+
+def _generation_key(scope, scope_id):
+    return GENERATION_KEY.format(scope=scope, scope_id=scope_id)
+
+
+def get_generations(*scopes):
+    """범위별 현재 세대 번호를 조회 (없으면 0).
+
+    세대 번호는 프로세스 내 캐시(near_cache)에 보관하고 바뀔 때 pub/sub으로 무효화되므로
+    대부분의 요청은 Redis를 거치지 않고, 없는 번호만 MGET 한 번으로 조회.
+
+    Args:
+        *scopes (tuple[str, int | str]): (scope, scope_id) 목록.
+
+    Returns:
+        list[int]: scopes 순서에 맞는 세대 번호 목록.
+    """
+    if not scopes:
+        return []
+    generations = near_cache.get_many(
+        [_generation_key(scope, scope_id) for scope, scope_id in scopes], loads=int, cache_missing=True
+    )
+    return [generation or 0 for generation in generations]
+
+
+def make_cache_key(name, *scopes):
+    """범위별 세대 번호가 들어간 캐시 키를 생성.
+
+    세대 번호가 바뀌면 키 자체가 달라지므로 이전 세대의 캐시는 조회되지 않고 TTL로 만료됨.
+    DB를 조회하기 전에 키를 만들어야 조회 도중 무효화된 경우 이전 세대 키에 저장되어 다시 읽히지 않음.
+
+    Args:
+        name (str): 캐시 이름 (예: "lecture_chapters").
+        *scopes (tuple[str, int | str]): 캐시 데이터가 의존하는 (scope, scope_id) 목록.
+
+    Returns:
+        str: 예) "lecture_chapters:lecture-3-v5"
+    """
+    generations = get_generations(*scopes)
+    parts = [f"{scope}-{scope_id}-v{generation}" for (scope, scope_id), generation in zip(scopes, generations)]
+    return ":".join([name, *parts])
+
+
+def make_stale_key(name, *scopes):
+    """세대 번호 없이 범위만 들어간 stale 복사본 키를 생성.
+
+    세대 번호가 바뀌어도 키가 같으므로 무효화 직후 새 값을 만드는 동안 이전 값을 찾을 때 사용.
+
+    Returns:
+        str: 예) "lecture_chapters:lecture-3:stale"
+    """
+    return ":".join([name, *(f"{scope}-{scope_id}" for scope, scope_id in scopes), "stale"])
+
+
+def bump_generations(*scopes):
+    """범위별 세대 번호를 INCR 해서 해당 범위에 의존하는 모든 캐시 키를 한 번에 무효화.
+
+    모든 워커가 프로세스 내 캐시에 보관한 세대 번호도 pub/sub으로 함께 무효화.
+    """
+    generation_keys = {_generation_key(scope, scope_id) for scope, scope_id in scopes if scope_id is not None}
+    if not generation_keys:
+        return
+    pipeline = redis_client.pipeline(transaction=False)
+    for generation_key in generation_keys:
+        pipeline.incr(generation_key)
+    pipeline.execute()
+    near_cache.invalidate(*generation_keys)
+
+
+def invalidate(*scopes):
+    """트랜잭션 커밋 후 범위별 세대 번호를 올려 캐시를 무효화.
+
+    커밋 전에 세대 번호를 올리면 다른 요청이 새 세대 키로 커밋 전 데이터를 캐시할 수 있으므로
+    transaction.on_commit으로 커밋 이후에 올림 (트랜잭션 밖이면 바로 실행).
+
+    Args:
+        *scopes (tuple[str, int | str]): 무효화할 (scope, scope_id) 목록.
+    """
+    transaction.on_commit(lambda: bump_generations(*scopes))
@@ -0,0 +1,231 @@
+import json
+import os
+import socket
+import time
+import uuid
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+from apps.common.utils import redis_client
+
+# 발송 대기 메일 (LPUSH로 넣고 RPOP으로 꺼내는 FIFO 큐)
+MAIL_QUEUE_KEY = "mail_queue"
+# 발송에 실패해서 재시도를 기다리는 메일 (score = 다시 보낼 시각)
+MAIL_RETRY_KEY = "mail_queue:retry"
+# MAIL_QUEUE_MAX_ATTEMPTS 이상 실패해서 더 이상 보내지 않는 메일 (마지막 오류와 함께 보관)
+MAIL_DEAD_LETTER_KEY = "mail_queue:dead"
+# 워커가 꺼냈지만 아직 발송(또는 재시도 예약)을 마치지 않은 메일 (워커별 목록)
+MAIL_PROCESSING_KEY = "mail_queue:processing:{worker_id}"
+# 메일을 꺼낸 적 있는 워커 ID 집합과 워커별 heartbeat (heartbeat가 만료된 워커의 처리 중 목록은 다시 큐로 옮김)
+MAIL_WORKERS_KEY = "mail_queue:workers"
+MAIL_WORKER_HEARTBEAT_KEY = "mail_queue:worker:{worker_id}"
+
+# 재시도 시각이 지난 메일을 큐로 옮긴 뒤, 먼저 들어온 메일부터 최대 ARGV[2]개를 워커의 처리 중 목록으로 옮김
+# 한 번의 스크립트로 처리하므로 여러 워커가 동시에 실행해도 같은 메일을 두 번 꺼내지 않고,
+# 워커가 발송 전에 종료되어도 메일이 처리 중 목록에 남아있으므로 잃어버리지 않음
+_CLAIM_SCRIPT = redis_client.register_script(
+    """
+local limit = tonumber(ARGV[2])
+redis.call("SADD", KEYS[4], ARGV[3])
+redis.call("SET", KEYS[5], ARGV[1], "EX", ARGV[4])
+local due = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", ARGV[1], "LIMIT", 0, limit)
+for _, item in ipairs(due) do
+    redis.call("ZREM", KEYS[2], item)
+    redis.call("LPUSH", KEYS[1], item)
+end
+local items = {}
+for _ = 1, limit do
+    local item = redis.call("LMOVE", KEYS[1], KEYS[3], "RIGHT", "LEFT")
+    if not item then
+        break
+    end
+    items[#items + 1] = item
+end
+return items
+"""
+)
+
+# 처리 중 목록의 메일을 꺼낸 순서대로 다시 발송 큐의 맨 앞(RPOP 쪽)에 넣고 워커를 목록에서 제거
+_RECOVER_SCRIPT = redis_client.register_script(
+    """
+local count = 0
+while redis.call("LMOVE", KEYS[1], KEYS[2], "LEFT", "RIGHT") do
+    count = count + 1
+end
+redis.call("SREM", KEYS[3], ARGV[1])
+return count
+"""
+)
+
+
+def get_worker_id():
+    """현재 워커 프로세스의 ID (호스트 이름 + pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _processing_key(worker_id):
+    return MAIL_PROCESSING_KEY.format(worker_id=worker_id)
+
+
+def enqueue_mail(subject, message, recipient_list, from_email=None):
+    """메일을 발송 큐에 넣음 (실제 발송은 send_queued_mail 커맨드가 처리).
+
+    SMTP 서버에 연결하지 않고 Redis에 LPUSH만 하므로 API 응답이 메일 서버 응답을 기다리지 않음.
+
+    Args:
+        subject (str): 메일 제목.
+        message (str): 메일 본문.
+        recipient_list (list[str]): 받는 사람 이메일 목록.
+        from_email (str, optional): 보내는 사람. 없으면 EMAIL_HOST_USER.
+
+    Returns:
+        str: 큐에 넣은 메일의 ID.
+    """
+    mail_id = uuid.uuid4().hex
+    payload = {
+        "id": mail_id,
+        "subject": subject,
+        "message": message,
+        "from_email": from_email or settings.EMAIL_HOST_USER,
+        "to": list(recipient_list),
+        "attempts": 0,
+    }
+    redis_client.lpush(MAIL_QUEUE_KEY, json.dumps(payload))
+    return mail_id
+
+
+def _backoff(attempts):
+    """재시도 대기 시간 (MAIL_QUEUE_RETRY_BASE_DELAY부터 두 배씩, 최대 MAIL_QUEUE_RETRY_MAX_DELAY 초)."""
+    return min(settings.MAIL_QUEUE_RETRY_BASE_DELAY * 2 ** (attempts - 1), settings.MAIL_QUEUE_RETRY_MAX_DELAY)
+
+
+def _handle_failure(processing_key, item, payload, error):
+    """실패한 메일을 backoff 후 다시 보내도록 예약하고, 최대 시도 횟수를 넘으면 dead-letter 목록으로 옮김.
+
+    재시도 예약(또는 dead-letter 이동)과 처리 중 목록에서의 제거는 MULTI/EXEC 한 번으로 처리.
+
+    Returns:
+        bool: dead-letter 목록으로 옮겼으면 True.
+    """
+    payload["attempts"] += 1
+    payload["error"] = f"{type(error).__name__}: {error}"
+    dead = payload["attempts"] >= settings.MAIL_QUEUE_MAX_ATTEMPTS
+
+    pipeline = redis_client.pipeline(transaction=True)
+    if dead:
+        pipeline.lpush(MAIL_DEAD_LETTER_KEY, json.dumps(payload))
+        pipeline.ltrim(MAIL_DEAD_LETTER_KEY, 0, settings.MAIL_QUEUE_DEAD_LETTER_MAX_LENGTH - 1)
+    else:
+        pipeline.zadd(MAIL_RETRY_KEY, {json.dumps(payload): time.time() + _backoff(payload["attempts"])})
+    pipeline.lrem(processing_key, 1, item)
+    pipeline.execute()
+    return dead
+
+
+def recover_stale_mail(worker_id=None):
+    """종료된 워커의 처리 중 목록에 남은 메일을 발송 큐로 되돌림 (워커 시작 시 실행).
+
+    현재 워커 ID(재시작 후 pid가 같은 경우)와 heartbeat가 만료된 워커의 목록을 복구.
+    발송 후 처리 중 목록에서 지우기 전에 종료된 메일은 한 번 더 발송될 수 있음 (최소 한 번 발송).
+
+    Args:
+        worker_id (str, optional): 현재 워커 ID. 없으면 get_worker_id().
+
+    Returns:
+        int: 발송 큐로 되돌린 메일 수.
+    """
+    worker_id = worker_id or get_worker_id()
+    recovered = 0
+    for stale_worker_id in redis_client.smembers(MAIL_WORKERS_KEY) | {worker_id}:
+        if stale_worker_id != worker_id and redis_client.exists(
+            MAIL_WORKER_HEARTBEAT_KEY.format(worker_id=stale_worker_id)
+        ):
+            continue  # 아직 실행 중인 워커
+        recovered += _RECOVER_SCRIPT(
+            keys=[_processing_key(stale_worker_id), MAIL_QUEUE_KEY, MAIL_WORKERS_KEY], args=[stale_worker_id]
+        )
+    return recovered
+
+
+def send_queued_mail(batch_size=None, connection=None, worker_id=None):
+    """발송 큐에서 메일 한 배치를 워커의 처리 중 목록으로 꺼내 하나의 SMTP 연결로 보냄.
+
+    connection을 넘기면 배치가 끝나도 연결을 닫지 않으므로 워커는 같은 연결로 여러 배치를 보낼 수 있음
+    (메일마다 SMTP 연결, TLS 협상, 로그인을 반복하지 않음).
+    보낸 메일은 처리 중 목록에서 지우고, 실패한 메일은 backoff 후 재시도하며
+    MAIL_QUEUE_MAX_ATTEMPTS 이상 실패하면 dead-letter 목록으로 옮김.
+
+    Args:
+        batch_size (int, optional): 한 번에 꺼낼 최대 메일 수. 없으면 MAIL_QUEUE_BATCH_SIZE.
+        connection (BaseEmailBackend, optional): 재사용할 메일 백엔드 연결. 없으면 새로 열고 배치가 끝나면 닫음.
+        worker_id (str, optional): 처리 중 목록을 구분할 워커 ID. 없으면 get_worker_id().
+
+    Returns:
+        dict: 이번 배치의 처리 결과 (claimed, sent, retried, dead).
+    """
+    batch_size = batch_size or settings.MAIL_QUEUE_BATCH_SIZE
+    worker_id = worker_id or get_worker_id()
+    processing_key = _processing_key(worker_id)
+    result = {"claimed": 0, "sent": 0, "retried": 0, "dead": 0}
+
+    items = _CLAIM_SCRIPT(
+        keys=[
+            MAIL_QUEUE_KEY,
+            MAIL_RETRY_KEY,
+            processing_key,
+            MAIL_WORKERS_KEY,
+            MAIL_WORKER_HEARTBEAT_KEY.format(worker_id=worker_id),
+        ],
+        args=[time.time(), batch_size, worker_id, settings.MAIL_QUEUE_WORKER_TTL],
+    )
+    if not items:
+        return result
+    result["claimed"] = len(items)
+
+    close_connection = connection is None
+    if connection is None:
+        connection = get_connection(fail_silently=False)
+
+    try:
+        for item in items:
+            payload = json.loads(item)
+            message = EmailMessage(
+                subject=payload["subject"],
+                body=payload["message"],
+                from_email=payload["from_email"],
+                to=payload["to"],
+                connection=connection,
+            )
+            try:
+                # 이미 열린 연결이면 그대로 사용 (끊어진 뒤에는 여기서 다시 연결)
+                connection.open()
+                connection.send_messages([message])
+            except Exception as e:
+                # 연결이 끊겼을 수 있으므로 닫아두고 다음 메일에서 다시 연결
+                connection.close()
+                if _handle_failure(processing_key, item, payload, e):
+                    result["dead"] += 1
+                else:
+                    result["retried"] += 1
+            else:
+                redis_client.lrem(processing_key, 1, item)
+                result["sent"] += 1
+    finally:
+        if close_connection:
+            connection.close()
+
+    return result
+
+
+def get_mail_queue_stats():
+    """발송 큐 상태 (발송 대기, 재시도 대기, 워커가 처리 중인, dead-letter 메일 수)."""
+    worker_ids = list(redis_client.smembers(MAIL_WORKERS_KEY))
+    pipeline = redis_client.pipeline(transaction=False)
+    pipeline.llen(MAIL_QUEUE_KEY)
+    pipeline.zcard(MAIL_RETRY_KEY)
+    pipeline.llen(MAIL_DEAD_LETTER_KEY)
+    for worker_id in worker_ids:
+        pipeline.llen(_processing_key(worker_id))
+    queued, retrying, dead, *processing = pipeline.execute()
+    return {"queued": queued, "retrying": retrying, "processing": sum(processing), "dead": dead}
@@ -0,0 +1,78 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+from django_redis import get_redis_connection
+
+SERIALIZERS = {
+    "pickle": "django_redis.serializers.pickle.PickleSerializer",
+    "json": "django_redis.serializers.json.JSONSerializer",
+    "msgpack": "django_redis.serializers.msgpack.MSGPackSerializer",
+}
+COMPRESSORS = {
+    "none": "django_redis.compressors.identity.IdentityCompressor",
+    "zlib": "django_redis.compressors.zlib.ZlibCompressor",
+    "lzma": "django_redis.compressors.lzma.LzmaCompressor",
+}
+BENCHMARK_KEY = "benchmark_cache:{name}"
+
+
+def build_lecture_list_payload(size):
+    """LectureListView 응답과 같은 형태의 과목 목록 payload를 생성"""
+    return [
+        {
+            "id": lecture_id,
+            "title": f"소리상상 과목 {lecture_id} - 발성과 호흡 기초",
+            "thumbnail": f"https://bucket.kr.object.ncloudstorage.com/classes/1/lectures/thumbnail_{lecture_id:08d}.png",
+            "progress_rate": round(lecture_id * 7.31 % 100, 2),
+        }
+        for lecture_id in range(1, size + 1)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Django 캐시에 쓸 serializer/compressor 조합별 payload 크기와 Redis set/get 지연 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=200, help="payload에 포함할 과목 수")
+        parser.add_argument("--iterations", type=int, default=500, help="조합별 set/get 반복 횟수")
+        parser.add_argument("--cache", default="default", help="벤치마크에 사용할 CACHES 별칭 (Redis 연결만 사용)")
+
+    def handle(self, *args, **options):
+        payload = build_lecture_list_payload(options["size"])
+        iterations = options["iterations"]
+        client = get_redis_connection(options["cache"])
+        configured = settings.CACHES[options["cache"]].get("OPTIONS", {})
+        current = (configured.get("SERIALIZER"), configured.get("COMPRESSOR"))
+
+        self.stdout.write(f"payload: {options['size']} lectures, {iterations} iterations")
+        self.stdout.write(f"{'serializer':<10} {'compressor':<10} {'bytes':>8} {'set p50(us)':>12} {'get p50(us)':>12}")
+
+        for serializer_name, serializer_path in SERIALIZERS.items():
+            serializer = import_string(serializer_path)(options=configured)
+            for compressor_name, compressor_path in COMPRESSORS.items():
+                compressor = import_string(compressor_path)(options=configured)
+                key = BENCHMARK_KEY.format(name=f"{serializer_name}:{compressor_name}")
+                set_times, get_times = [], []
+
+                # django-redis 클라이언트와 같은 순서로 직렬화 -> 압축 / 압축 해제 -> 역직렬화 시간을 포함해 측정
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    value = compressor.compress(serializer.dumps(payload))
+                    client.set(key, value, ex=60)
+                    set_times.append(time.perf_counter() - started)
+
+                    started = time.perf_counter()
+                    serializer.loads(compressor.decompress(client.get(key)))
+                    get_times.append(time.perf_counter() - started)
+
+                client.delete(key)
+                marker = " *" if (serializer_path, compressor_path) == current else ""
+                self.stdout.write(
+                    f"{serializer_name:<10} {compressor_name:<10} {len(value):>8} "
+                    f"{statistics.median(set_times) * 1e6:>12.1f} {statistics.median(get_times) * 1e6:>12.1f}{marker}"
+                )
+
+        self.stdout.write(self.style.SUCCESS("* 현재 CACHES 설정"))
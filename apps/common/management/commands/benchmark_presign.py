@@ -0,0 +1,87 @@
+import statistics
+import time
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from apps.common import utils
+from apps.common.presigner import get_presigner
+
+BENCHMARK_OBJECT_KEY = "classes/1/lectures/1/videos_benchmark_00000000-0000-0000-0000-000000000000.mp4"
+
+
+def create_s3_client():
+    """get_s3_client 도입 전처럼 호출할 때마다 새 boto3 클라이언트를 생성"""
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_S3_REGION_NAME,
+        config=Config(max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS),
+    )
+
+
+def presign_with(client):
+    return client.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": BENCHMARK_OBJECT_KEY},
+        ExpiresIn=3600,
+    )
+
+
+class Command(BaseCommand):
+    help = "Signed URL 생성 방식별 호출당 지연 시간과 초당 URL 생성 수를 비교합니다 (네트워크 요청 없음)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200, help="방식별 반복 횟수")
+        parser.add_argument("--batch-size", type=int, default=50, help="일괄 서명 방식에서 한 번에 서명할 URL 수")
+
+    def measure(self, label, presign, iterations, urls_per_call=1):
+        presign()  # 클라이언트/서명 키 생성 등 첫 호출 비용은 제외
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            presign()
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(
+            f"{label:<40} p50={statistics.median(timings) * 1e6:>9.1f}us p95={p95 * 1e6:>9.1f}us "
+            f"{len(timings) * urls_per_call / sum(timings):>10.0f} URLs/s"
+        )
+
+    def handle(self, *args, **options):
+        # 서명은 로컬 계산이므로 키가 설정되지 않은 환경에서는 임의의 키로 측정
+        overrides = {}
+        if not settings.AWS_ACCESS_KEY_ID or not settings.AWS_SECRET_ACCESS_KEY:
+            overrides = {"AWS_ACCESS_KEY_ID": "benchmark", "AWS_SECRET_ACCESS_KEY": "benchmark"}
+        if not settings.AWS_STORAGE_BUCKET_NAME:
+            overrides["AWS_STORAGE_BUCKET_NAME"] = "benchmark"
+
+        with override_settings(**overrides):
+            utils._s3_client_registry.clear()  # 설정을 바꿨으므로 새 클라이언트로 측정
+            get_presigner.cache_clear()
+            try:
+                self.run(options["iterations"], options["batch_size"])
+            finally:
+                utils._s3_client_registry.clear()
+                get_presigner.cache_clear()
+
+    def run(self, iterations, batch_size):
+        self.stdout.write(f"{iterations} iterations")
+        self.measure(
+            "boto3: 호출마다 클라이언트 생성 (기존 방식)", lambda: presign_with(create_s3_client()), iterations
+        )
+        self.measure("boto3: get_s3_client 공유 클라이언트", lambda: presign_with(utils.get_s3_client()), iterations)
+        self.measure("NCPPresigner: presign_get", lambda: get_presigner().presign_get(BENCHMARK_OBJECT_KEY), iterations)
+        object_keys = [BENCHMARK_OBJECT_KEY] * batch_size
+        self.measure(
+            f"NCPPresigner: presign_get_many({batch_size})",
+            lambda: get_presigner().presign_get_many(object_keys),
+            iterations,
+            urls_per_call=batch_size,
+        )
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.common.storage_outbox import (
+    MAX_KEYS_PER_REQUEST,
+    drain_storage_deletions,
+    get_storage_deletion_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "파일 삭제 outbox에 쌓인 요청을 DeleteObjects API로 모아서 NCP Object Storage에서 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=MAX_KEYS_PER_REQUEST, help="한 번에 삭제할 최대 파일 수")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 계속 outbox를 확인")
+        parser.add_argument("--interval", type=float, default=5.0, help="--loop 사용 시 비어있을 때 대기 시간 (초)")
+        parser.add_argument("--stats", action="store_true", help="삭제하지 않고 outbox 상태만 출력")
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self.stdout.write(str(get_storage_deletion_stats()))
+            return
+
+        batch_size = min(options["batch_size"], MAX_KEYS_PER_REQUEST)
+        while True:
+            result = drain_storage_deletions(batch_size=batch_size)
+            if result["claimed"]:
+                self.stdout.write(f"deleted={result['deleted']} failed={result['failed']}")
+
+            # 꽉 찬 배치를 처리했다면 남은 요청이 있을 수 있으므로 바로 다음 배치 처리
+            if result["claimed"] >= batch_size:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS(str(get_storage_deletion_stats())))
@@ -0,0 +1,68 @@
+import time
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+
+from apps.common.mail_queue import (
+    get_mail_queue_stats,
+    get_worker_id,
+    recover_stale_mail,
+    send_queued_mail,
+)
+
+
+class Command(BaseCommand):
+    help = "Redis 발송 큐에 쌓인 메일을 SMTP 연결 하나로 모아서 보냅니다 (실패 시 backoff 후 재시도)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.MAIL_QUEUE_BATCH_SIZE, help="한 번에 보낼 최대 메일 수"
+        )
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 계속 발송 큐를 확인")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.MAIL_QUEUE_POLL_INTERVAL,
+            help="--loop 사용 시 큐가 비어있을 때 대기 시간 (초)",
+        )
+        parser.add_argument("--stats", action="store_true", help="보내지 않고 발송 큐 상태만 출력")
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self.stdout.write(str(get_mail_queue_stats()))
+            return
+
+        batch_size = options["batch_size"]
+        # 이전에 종료된 워커가 꺼내고 보내지 못한 메일을 다시 발송 큐로 옮김
+        worker_id = get_worker_id()
+        recovered = recover_stale_mail(worker_id)
+        if recovered:
+            self.stdout.write(f"recovered={recovered}")
+
+        # 배치 사이에도 SMTP 연결을 유지하고, 한동안 보낼 메일이 없으면 닫음 (메일 서버가 먼저 끊는 것을 방지)
+        connection = get_connection(fail_silently=False)
+        last_sent_at = None
+        try:
+            while True:
+                result = send_queued_mail(batch_size=batch_size, connection=connection, worker_id=worker_id)
+                if result["claimed"]:
+                    last_sent_at = time.monotonic()
+                    self.stdout.write(f"sent={result['sent']} retried={result['retried']} dead={result['dead']}")
+
+                # 꽉 찬 배치를 처리했다면 남은 메일이 있을 수 있으므로 바로 다음 배치 처리
+                if result["claimed"] >= batch_size:
+                    continue
+                if not options["loop"]:
+                    break
+                if (
+                    last_sent_at is not None
+                    and time.monotonic() - last_sent_at >= settings.MAIL_QUEUE_CONNECTION_IDLE_TIMEOUT
+                ):
+                    connection.close()
+                    last_sent_at = None
+                time.sleep(options["interval"])
+        finally:
+            connection.close()
+
+        self.stdout.write(self.style.SUCCESS(str(get_mail_queue_stats())))
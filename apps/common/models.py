@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class BaseModel(models.Model):
@@ -7,3 +8,23 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class StorageDeletion(BaseModel):
+    """NCP Object Storage 파일 삭제 outbox.
+
+    파일 삭제를 요청한 트랜잭션 안에서 삭제할 객체 경로만 기록하고
+    실제 삭제는 drain_storage_deletions 커맨드가 DeleteObjects API로 모아서 처리.
+    """
+
+    object_key = models.CharField(max_length=1024)  # 삭제할 객체 경로
+    attempts = models.PositiveSmallIntegerField(default=0)  # 삭제 시도 횟수
+    last_error = models.TextField(blank=True, default="")  # 마지막 실패 사유
+    next_attempt_at = models.DateTimeField(default=timezone.now)  # 다음 시도 가능 시각 (재시도 backoff)
+
+    def __str__(self):
+        return self.object_key
+
+    class Meta:
+        db_table = "storage_deletion_outbox"
+        indexes = [models.Index(fields=["next_attempt_at", "id"], name="storage_del_next_attempt_idx")]
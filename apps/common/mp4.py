@@ -0,0 +1,148 @@
+import struct
+
+# 박스 헤더 크기 (size 4 byte + type 4 byte), size가 1이면 뒤에 8 byte largesize가 이어짐
+_HEADER_SIZE = 8
+_LARGE_HEADER_SIZE = 16
+
+# moov 박스를 찾지 못하는 비정상 파일에서 무한히 읽지 않도록 제한
+MAX_TOP_LEVEL_BOXES = 64
+MAX_MOOV_SIZE = 64 * 1024 * 1024
+
+
+class RangeReader:
+    """read_range(start, end) 로 필요한 구간만 읽어오는 버퍼 리더.
+
+    작은 헤더를 읽을 때도 chunk_size 만큼 미리 읽어서 ranged GET 요청 횟수를 줄임.
+
+    Attributes:
+        read_range (Callable[[int, int], bytes]): start ~ end (end 포함) 구간의 byte를 반환하는 함수.
+        chunk_size (int): 한 번에 미리 읽을 최소 크기.
+    """
+
+    def __init__(self, read_range, chunk_size=64 * 1024):
+        self.read_range = read_range
+        self.chunk_size = chunk_size
+        self.requests = 0
+        self._offset = 0
+        self._buffer = b""
+
+    def read(self, offset, length):
+        """offset부터 length byte를 반환. 파일 끝을 넘으면 남은 만큼만 반환."""
+        buffer_end = self._offset + len(self._buffer)
+        if not (self._offset <= offset and offset + length <= buffer_end):
+            self._buffer = self.read_range(offset, offset + max(length, self.chunk_size) - 1)
+            self._offset = offset
+            self.requests += 1
+        start = offset - self._offset
+        return self._buffer[start : start + length]
+
+
+def _iter_boxes(data, start=0, end=None):
+    """메모리에 읽은 박스 본문에서 (type, 본문 시작, 본문 끝) 을 순서대로 반환."""
+    end = len(data) if end is None else end
+    offset = start
+    while offset + _HEADER_SIZE <= end:
+        size, box_type = struct.unpack(">I4s", data[offset : offset + _HEADER_SIZE])
+        header_size = _HEADER_SIZE
+        if size == 1:
+            if offset + _LARGE_HEADER_SIZE > end:
+                return
+            size = struct.unpack(">Q", data[offset + 8 : offset + 16])[0]
+            header_size = _LARGE_HEADER_SIZE
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return
+        yield box_type, offset + header_size, min(offset + size, end)
+        offset += size
+
+
+def _find_box(data, path, start=0, end=None):
+    """path(b"trak" 등의 목록) 를 따라 내려간 첫 번째 박스의 (본문 시작, 본문 끝) 을 반환."""
+    for box_type, body_start, body_end in _iter_boxes(data, start, end):
+        if box_type == path[0]:
+            if len(path) == 1:
+                return body_start, body_end
+            return _find_box(data, path[1:], body_start, body_end)
+    return None
+
+
+def _parse_duration(data, start, end):
+    """mvhd/mdhd 본문에서 duration / timescale (초) 을 계산. 본문이 잘려 있으면 None."""
+    if start >= end:
+        return None
+    if data[start] == 1:
+        fields, field_start, field_end = ">IQ", start + 20, start + 32
+    else:
+        fields, field_start, field_end = ">II", start + 12, start + 20
+    if field_end > end:
+        return None
+    timescale, duration = struct.unpack(fields, data[field_start:field_end])
+    if not timescale or duration in (0, 0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+        return None
+    return duration / timescale
+
+
+def parse_moov_duration(moov):
+    """moov 박스 본문에서 영상 길이(초) 를 반환.
+
+    mvhd의 duration을 사용하고, 값이 없으면 (fragmented MP4 등) 트랙별 mdhd duration 중 가장 긴 값을 사용.
+
+    Args:
+        moov (bytes): moov 박스 본문 (헤더 제외).
+
+    Returns:
+        float | None: 영상 길이 (초). 계산할 수 없으면 None.
+    """
+    mvhd = _find_box(moov, [b"mvhd"])
+    duration = _parse_duration(moov, *mvhd) if mvhd else None
+    if duration:
+        return duration
+
+    track_durations = []
+    for box_type, body_start, body_end in _iter_boxes(moov):
+        if box_type == b"trak":
+            mdhd = _find_box(moov, [b"mdia", b"mdhd"], body_start, body_end)
+            if mdhd:
+                track_durations.append(_parse_duration(moov, *mdhd) or 0)
+    return max(track_durations, default=0) or None
+
+
+def read_mp4_duration(read_range, chunk_size=64 * 1024):
+    """MP4/MOV 파일의 최상위 박스 헤더만 따라가며 moov 박스를 찾아 영상 길이(초) 를 반환.
+
+    mdat 등 다른 박스는 헤더의 크기만 보고 건너뛰므로 moov 박스가 파일 끝에 있어도
+    파일 전체가 아닌 박스 헤더와 moov 박스만 읽음.
+
+    Args:
+        read_range (Callable[[int, int], bytes]): start ~ end (end 포함) 구간의 byte를 반환하는 함수.
+        chunk_size (int): 한 번에 미리 읽을 최소 크기.
+
+    Returns:
+        float | None: 영상 길이 (초). MP4/MOV 형식이 아니거나 moov 박스가 없으면 None.
+    """
+    reader = RangeReader(read_range, chunk_size)
+    offset = 0
+    for _ in range(MAX_TOP_LEVEL_BOXES):
+        header = reader.read(offset, _LARGE_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE:
+            return None
+
+        size, box_type = struct.unpack(">I4s", header[:_HEADER_SIZE])
+        header_size = _HEADER_SIZE
+        if size == 1:
+            if len(header) < _LARGE_HEADER_SIZE:
+                return None
+            size = struct.unpack(">Q", header[_HEADER_SIZE:])[0]
+            header_size = _LARGE_HEADER_SIZE
+
+        if box_type == b"moov":
+            body_size = (size or MAX_MOOV_SIZE) - header_size
+            if body_size <= 0 or body_size > MAX_MOOV_SIZE:
+                return None
+            return parse_moov_duration(reader.read(offset + header_size, body_size))
+
+        if size < header_size:  # size가 0이면 파일 끝까지 이어지는 마지막 박스
+            return None
+        offset += size
+    return None
@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+
+_MISSING = object()
+
+
+class NearCache:
+    """Redis 앞에 두는 프로세스 내 LRU 캐시 (2단계 캐시).
+
+    Redis에서 읽어서 디코딩한 객체를 워커 프로세스 안에 ttl 동안 보관해서, 같은 키를 다시 읽을 때
+    Redis 왕복과 json.loads를 생략. 반환하는 객체는 여러 요청이 공유하므로 호출한 쪽에서 수정하면 안 됨.
+
+    무효화는 Redis pub/sub 채널로 모든 워커에 전파되고 각 워커의 구독 스레드가 메시지를 받는 즉시
+    해당 키를 프로세스 내 캐시에서 제거. 구독이 끊긴 동안 놓친 메시지가 있을 수 있으므로 (재)구독할 때
+    프로세스 내 캐시를 모두 비우며, ttl은 메시지를 놓친 경우에도 오래된 값이 남아있을 수 있는 최대 시간.
+
+    Attributes:
+        redis (redis.Redis): decode_responses=True로 생성한 Redis 클라이언트.
+        channel (str): 무효화 메시지를 주고받을 pub/sub 채널.
+        max_entries (int): 프로세스 내 LRU에 보관할 최대 키 수.
+        ttl (float): 프로세스 내 캐시 보관 시간 (초).
+    """
+
+    def __init__(self, redis_client, channel="near_cache:invalidate", max_entries=1000, ttl=60):
+        self.redis = redis_client
+        self.channel = channel
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self._epoch = 0  # 무효화할 때마다 증가 (Redis 조회 도중 무효화된 값을 프로세스 내 캐시에 저장하지 않기 위함)
+        self._listener_pid = None
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, key, loads=json.loads):
+        """키의 값을 프로세스 내 캐시 -> Redis 순서로 조회.
+
+        Args:
+            key (str): Redis 키.
+            loads (Callable[[str], Any]): Redis에 저장된 문자열을 객체로 바꾸는 함수.
+
+        Returns:
+            Any: 디코딩된 값. 두 곳 모두 없으면 None.
+        """
+        return self.get_many([key], loads)[0]
+
+    def get_many(self, keys, loads=json.loads, cache_missing=False):
+        """여러 키를 프로세스 내 캐시에서 찾고 없는 키만 MGET 한 번으로 Redis에서 조회.
+
+        Args:
+            keys (list[str]): Redis 키 목록.
+            loads (Callable[[str], Any]): Redis에 저장된 문자열을 객체로 바꾸는 함수.
+            cache_missing (bool): Redis에 없는 키도 None으로 프로세스 내 캐시에 보관할지 여부.
+                값이 생길 때 반드시 invalidate()가 호출되는 키(예: 캐시 세대 번호)에만 사용.
+
+        Returns:
+            list[Any]: keys 순서에 맞는 값 목록 (없으면 None).
+        """
+        self._ensure_listener()
+        now = time.monotonic()
+        values = [None] * len(keys)
+        missing = []
+
+        with self._lock:
+            for index, key in enumerate(keys):
+                value, expires_at = self._entries.get(key, (_MISSING, 0))
+                if value is not _MISSING and expires_at > now:
+                    self._entries.move_to_end(key)
+                    values[index] = value
+                    self._stats["local_hits"] += 1
+                else:
+                    missing.append(index)
+            epoch = self._epoch
+
+        if not missing:
+            return values
+
+        raw_values = self.redis.mget([keys[index] for index in missing])
+        loaded = [None if raw is None else loads(raw) for raw in raw_values]
+
+        with self._lock:
+            # 조회하는 동안 무효화 메시지를 받았다면 방금 읽은 값이 이미 오래된 값일 수 있으므로 저장하지 않음
+            store = self._epoch == epoch
+            for index, raw, value in zip(missing, raw_values, loaded):
+                values[index] = value
+                self._stats["misses" if raw is None else "redis_hits"] += 1
+                if store and (raw is not None or cache_missing):
+                    self._store_local(keys[index], value, now)
+        return values
+
+    def set(self, key, value, timeout, dumps=json.dumps, loads=json.loads):
+        """Redis에 값을 저장하고 프로세스 내 캐시에도 보관.
+
+        키에 캐시 세대 번호가 들어가므로 같은 키의 값은 바뀌지 않는다고 보고 다른 워커에 알리지 않음.
+        프로세스 내 캐시에는 다른 워커가 Redis에서 읽는 것과 같은 값이 되도록 저장한 문자열을 다시 디코딩해서 보관.
+
+        Args:
+            key (str): Redis 키.
+            value (Any): 저장할 값 (예: serializer.data).
+            timeout (int): Redis TTL (초).
+            dumps (Callable[[Any], str]): 값을 문자열로 바꾸는 함수.
+            loads (Callable[[str], Any]): 저장한 문자열을 객체로 바꾸는 함수.
+
+        Returns:
+            Any: 프로세스 내 캐시에 보관한 디코딩된 값.
+        """
+        raw = dumps(value)
+        self.redis.setex(key, timeout, raw)
+        value = loads(raw)
+        with self._lock:
+            self._store_local(key, value, time.monotonic())
+        return value
+
+    def invalidate(self, *keys):
+        """현재 프로세스에서 키를 바로 제거하고 pub/sub으로 다른 워커에도 제거를 요청.
+
+        Args:
+            *keys (str): 값이 바뀐 Redis 키.
+        """
+        if not keys:
+            return
+        self._drop_local(keys)
+        try:
+            self.redis.publish(self.channel, json.dumps(keys))
+        except redis.RedisError:
+            pass  # 다른 워커는 ttl이 지나면 Redis에서 다시 읽음
+
+    def stats(self):
+        """프로세스 내 캐시 적중(local_hits), Redis 적중(redis_hits), 미적중(misses) 횟수와 비율을 반환."""
+        with self._lock:
+            stats = {**self._stats, "entries": len(self._entries)}
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["local_hit_rate"] = stats["local_hits"] / lookups if lookups else 0.0
+        stats["redis_hit_rate"] = stats["redis_hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """프로세스 내 캐시를 비움 (Redis에 저장된 값은 그대로 유지)."""
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+
+    def _store_local(self, key, value, now):
+        self._entries[key] = (value, now + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _drop_local(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            self._epoch += 1
+            self._stats["invalidations"] += len(keys)
+
+    def _ensure_listener(self):
+        """현재 프로세스의 구독 스레드가 없으면 시작 (gunicorn fork 이후 워커마다 한 번)."""
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._lock:
+            if self._listener_pid == pid:
+                return
+            self._listener_pid = pid
+            # fork 전에 부모 프로세스에서 채운 값은 무효화 메시지를 받지 못했을 수 있으므로 버림
+            self._entries.clear()
+            self._epoch += 1
+        threading.Thread(target=self._listen, name="near-cache-invalidation", daemon=True).start()
+
+    def _listen(self):
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                pubsub.subscribe(self.channel)
+                while True:
+                    # socket_timeout보다 짧은 timeout으로 대기해서 메시지가 없는 동안에도 연결이 끊긴 것으로 보지 않음
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    if message["type"] == "subscribe":
+                        self.clear()  # 구독하기 전에 보낸 무효화 메시지는 받을 수 없으므로 모두 비움
+                    elif message["type"] == "message":
+                        self._drop_local(json.loads(message["data"]))
+            except Exception as e:
+                print(f"near cache 구독 오류: {e}")
+                self.clear()
+                time.sleep(1)
+            finally:
+                pubsub.close()
@@ -0,0 +1,135 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from drf_spectacular.utils import OpenApiParameter, inline_serializer
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# extend_schema에 사용할 KeysetPagination 쿼리 파라미터
+KEYSET_PAGINATION_PARAMETERS = [
+    OpenApiParameter("cursor", str, required=False, description="이전 응답의 next에 포함된 cursor"),
+    OpenApiParameter("page_size", int, required=False, description="페이지 크기"),
+]
+
+
+def keyset_page_schema(name, serializer):
+    """extend_schema의 responses에 사용할 KeysetPagination 응답 스키마.
+
+    Args:
+        name (str): 스키마 이름.
+        serializer (Serializer): results에 담길 항목의 직렬화 클래스 인스턴스.
+
+    Returns:
+        Serializer: next, results 필드를 가진 inline serializer.
+    """
+    return inline_serializer(
+        name=name,
+        fields={"next": serializers.URLField(allow_null=True), "results": serializer},
+    )
+
+
+class KeysetPagination(BasePagination):
+    """(created_at, id) 기준 keyset(cursor) 페이지네이션.
+
+    OFFSET 대신 이전 페이지 마지막 행의 (created_at, id) 다음 행부터 page_size + 1개만 조회하므로
+    몇 번째 페이지든 (created_at, id)로 끝나는 복합 인덱스의 범위 스캔 한 번으로 끝나고,
+    페이지 사이에 행이 추가/삭제되어도 중복되거나 빠지는 행이 없음.
+    cursor는 (created_at, id)를 base64로 인코딩한 문자열이며 클라이언트는 응답의 next를 그대로 사용.
+
+    Attributes:
+        descending (bool): True이면 최신순, False이면 오래된순.
+        page_size (int): 기본 페이지 크기.
+        max_page_size (int): page_size 쿼리 파라미터로 요청할 수 있는 최대 페이지 크기.
+        cursor_query_param (str): cursor 쿼리 파라미터 이름.
+        page_size_query_param (str): 페이지 크기 쿼리 파라미터 이름.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "잘못된 cursor 입니다."
+
+    def __init__(self, descending=True):
+        self.descending = descending
+        self.page_size = settings.KEYSET_PAGE_SIZE
+        self.max_page_size = settings.KEYSET_MAX_PAGE_SIZE
+        self.next_cursor = None
+        self.request = None
+
+    @staticmethod
+    def encode_cursor(instance):
+        """행의 (created_at, id)를 cursor 문자열로 인코딩."""
+        payload = json.dumps([instance.created_at.isoformat(), instance.pk], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """cursor 문자열을 (created_at, id)로 디코딩. 형식이 잘못되었으면 NotFound를 발생."""
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            created_at, pk = json.loads(payload)
+            created_at = parse_datetime(created_at)
+            if created_at is None or not isinstance(pk, int):
+                raise ValueError(cursor)
+        except (binascii.Error, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """cursor 다음 페이지의 행 목록을 반환 (쿼리 한 번).
+
+        Args:
+            queryset (QuerySet): 필터만 적용된 쿼리셋 (정렬은 이 클래스가 지정).
+            request (Request): 요청 객체.
+            view: 현재 실행 중인 뷰.
+
+        Returns:
+            list: 페이지의 행 목록.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            created_at, pk = self.decode_cursor(cursor)
+            if self.descending:
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+            else:
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk))
+
+        ordering = ("-created_at", "-pk") if self.descending else ("created_at", "pk")
+        rows = list(queryset.order_by(*ordering)[: page_size + 1])
+
+        # 한 행을 더 조회해서 다음 페이지가 있는지 확인 (COUNT 쿼리 없음)
+        self.next_cursor = self.encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -1,13 +1,27 @@
 from rest_framework.permissions import BasePermission
 
-from apps.registrations.models import Enrollment
+from apps.registrations.access import (
+    can_access,
+    can_access_object,
+    has_active_enrollment,
+)
+from apps.users.roles import get_role
+
+# URL 인자 이름 -> 접근 대상 객체 종류 (학생은 해당 객체가 속한 과정을 수강 중이어야 함)
+ACCESS_URL_KWARGS = {
+    "lecture_id": "lecture",
+    "lecture_chapter_id": "lecture_chapter",
+    "chapter_video_id": "chapter_video",
+    "assignment_id": "assignment",
+}
 
 
 class IsActiveStudentOrInstructor(BasePermission):
     """수강 중인 학생 또는 강사 전용 접근 권한.
 
     로그인한 사용자 중에서 강사이거나,
-    학생인 경우 수강 신청이 승인된 경우에만 접근을 허용.
+    학생인 경우 접근하려는 객체가 속한 과정의 수강 신청이 승인된 경우에만 접근을 허용.
+    학생의 활성 과정과 객체의 과정 ID는 Redis에 캐시되므로 대부분의 요청은 DB를 조회하지 않음.
 
     Attributes:
         message (str): 권한 거부 시 반환할 메시지.
@@ -20,7 +34,8 @@ class IsActiveStudentOrInstructor(BasePermission):
 
         사용자가 로그인되어 있지 않으면 접근을 거부하고,
         강사이면 바로 접근을 허용하며,
-        학생인 경우 활성화된 Enrollment가 있는지 확인.
+        학생인 경우 URL에 과목/챕터/강의 영상/과제 ID가 있으면 그 객체가 속한 과정을 수강 중인지,
+        없으면 활성화된 Enrollment가 하나라도 있는지 확인.
 
         Args:
             request (Request): 요청 객체.
@@ -31,10 +46,62 @@ class IsActiveStudentOrInstructor(BasePermission):
         """
         if not request.user or not request.user.is_authenticated:
             return False
+        role = get_role(request)
         # 강사인 경우 바로 허용
-        if hasattr(request.user, "instructor"):
+        if role.is_instructor:
             return True
-        # 학생인 경우, 해당 학생이 활성 Enrollment를 가지고 있는지 확인
-        if hasattr(request.user, "student"):
-            return Enrollment.objects.filter(student=request.user.student, is_active=True).exists()
+        # 학생인 경우, 접근하려는 객체가 속한 과정의 활성 Enrollment를 가지고 있는지 확인
+        if role.is_student:
+            student_id = role.student.id
+            for url_kwarg, kind in ACCESS_URL_KWARGS.items():
+                if url_kwarg in view.kwargs:
+                    return can_access(student_id, kind, view.kwargs[url_kwarg])
+            return has_active_enrollment(student_id)
         return False
+
+    def has_object_permission(self, request, view, obj):
+        """강사이거나, 객체(과정/과목/챕터/강의 영상/과제)가 속한 과정을 수강 중인 학생인지 확인.
+
+        Args:
+            request (Request): 요청 객체.
+            view: 현재 실행 중인 뷰.
+            obj (Model): 접근하려는 객체.
+
+        Returns:
+            bool: 접근 권한이 있으면 True, 없으면 False.
+        """
+        role = get_role(request)
+        if role.is_instructor:
+            return True
+        if role.is_student:
+            return can_access_object(role.student.id, obj)
+        return False
+
+
+class IsInstructor(BasePermission):
+    """강사 전용 접근 권한.
+
+    객체 단위 권한은 강의 영상이 속한 과목의 담당 강사인 경우에만 허용.
+
+    Attributes:
+        message (str): 권한 거부 시 반환할 메시지.
+    """
+
+    message = "담당 강사만 이 작업을 수행할 수 있습니다."
+
+    def has_permission(self, request, view):
+        """로그인한 강사인지 확인."""
+        return bool(request.user and request.user.is_authenticated and get_role(request).is_instructor)
+
+    def has_object_permission(self, request, view, obj):
+        """강의 영상(ChapterVideo)이 속한 과목의 담당 강사인지 확인.
+
+        Args:
+            request (Request): 요청 객체.
+            view: 현재 실행 중인 뷰.
+            obj (ChapterVideo): 접근하려는 강의 영상.
+
+        Returns:
+            bool: 담당 강사이면 True, 아니면 False.
+        """
+        return obj.lecture.instructor_id == get_role(request).instructor.id
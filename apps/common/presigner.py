@@ -0,0 +1,182 @@
+import functools
+import hashlib
+import hmac
+import threading
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
+
+from django.conf import settings
+
+# SigV4 쿼리 서명에서 percent-encoding 하지 않는 문자 (botocore와 동일)
+_UNRESERVED = "-_.~"
+_ALGORITHM = "AWS4-HMAC-SHA256"
+_UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+# 응답 헤더 override 파라미터 이름 (boto3 Params 이름 -> 쿼리 파라미터 이름)
+RESPONSE_OVERRIDES = {
+    "ResponseCacheControl": "response-cache-control",
+    "ResponseContentDisposition": "response-content-disposition",
+    "ResponseContentEncoding": "response-content-encoding",
+    "ResponseContentLanguage": "response-content-language",
+    "ResponseContentType": "response-content-type",
+    "ResponseExpires": "response-expires",
+}
+
+
+def _quote(value):
+    return quote(str(value).encode("utf-8"), safe=_UNRESERVED)
+
+
+def sign(key, msg):
+    """HMAC-SHA256 서명값(bytes)을 반환."""
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+def derive_signing_key(secret_key, date_stamp, region, service="s3"):
+    """AWS Signature v4 서명 키 (date/region/service/aws4_request) 를 계산."""
+    k_date = sign(("AWS4" + secret_key).encode("utf-8"), date_stamp)
+    k_region = sign(k_date, region)
+    k_service = sign(k_region, service)
+    return sign(k_service, "aws4_request")
+
+
+class NCPPresigner:
+    """botocore 요청 파이프라인을 거치지 않는 NCP Object Storage용 SigV4 presigned URL 생성기.
+
+    presigned URL 생성은 네트워크 통신 없이 canonical request에 대한 HMAC 계산만 필요하므로
+    직접 계산하며, 날짜/리전/서비스 단위의 서명 키는 UTC 날짜가 바뀔 때만 다시 계산.
+    생성되는 URL은 path-style 주소를 쓰는 boto3 `generate_presigned_url("get_object" / "upload_part")` 결과와
+    서명이 동일.
+    """
+
+    def __init__(self, access_key, secret_key, region, endpoint_url, bucket):
+        endpoint = urlsplit(endpoint_url)
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.bucket = bucket
+        self.scheme = endpoint.scheme
+        self.host = endpoint.netloc
+        self._signing_key = (None, None)  # (date_stamp, signing_key)
+        self._lock = threading.Lock()
+
+    def get_signing_key(self, date_stamp):
+        """UTC 날짜별 서명 키를 반환. 같은 날짜에는 한 번만 계산."""
+        cached_date, cached_key = self._signing_key
+        if cached_date == date_stamp:
+            return cached_key
+
+        with self._lock:
+            cached_date, cached_key = self._signing_key
+            if cached_date != date_stamp:
+                cached_key = derive_signing_key(self.secret_key, date_stamp, self.region)
+                self._signing_key = (date_stamp, cached_key)
+        return cached_key
+
+    def presign_get(self, object_key, expiration=3600, response_params=None, now=None):
+        """단일 객체에 대한 GET Signed URL을 생성.
+
+        Args:
+            object_key (str): 버킷 내 객체 경로.
+            expiration (int): URL 유효 시간 (초 단위).
+            response_params (dict, optional): ResponseContentDisposition 등 boto3 Params 이름으로 된 응답 헤더 override.
+            now (datetime, optional): 서명 기준 시각 (UTC). 없으면 현재 시각.
+
+        Returns:
+            str: Signed URL.
+        """
+        return self.presign_get_many([object_key], expiration, [response_params], now=now)[0]
+
+    def presign_get_many(self, object_keys, expiration=3600, response_params=None, now=None):
+        """여러 객체의 GET Signed URL을 한 번에 생성.
+
+        서명 시각과 서명 키를 한 번만 계산하고 객체마다 canonical request 해시와 HMAC 한 번씩만 수행.
+
+        Args:
+            object_keys (list[str]): 버킷 내 객체 경로 목록.
+            expiration (int): URL 유효 시간 (초 단위).
+            response_params (dict | list[dict], optional): 모든 객체에 공통으로 적용할 override,
+                또는 object_keys와 같은 길이의 객체별 override 목록.
+            now (datetime, optional): 서명 기준 시각 (UTC). 없으면 현재 시각.
+
+        Returns:
+            list[str]: object_keys 순서에 맞는 Signed URL 목록.
+        """
+        if response_params is None or isinstance(response_params, dict):
+            response_params = [response_params] * len(object_keys)
+
+        context = self._signing_context(expiration, now)
+        return [
+            self._signed_url(
+                context,
+                "GET",
+                object_key,
+                [(RESPONSE_OVERRIDES[name], value) for name, value in (overrides or {}).items()],
+            )
+            for object_key, overrides in zip(object_keys, response_params)
+        ]
+
+    def presign_upload_parts(self, object_key, upload_id, part_numbers, expiration=3600, now=None):
+        """Multipart Upload 파트별 PUT Signed URL을 한 번에 생성.
+
+        Args:
+            object_key (str): 업로드 중인 객체 경로.
+            upload_id (str): CreateMultipartUpload로 발급받은 업로드 ID.
+            part_numbers (list[int]): 서명할 파트 번호 목록 (1 ~ 10000).
+            expiration (int): URL 유효 시간 (초 단위).
+            now (datetime, optional): 서명 기준 시각 (UTC). 없으면 현재 시각.
+
+        Returns:
+            list[str]: part_numbers 순서에 맞는 Signed URL 목록.
+        """
+        context = self._signing_context(expiration, now)
+        return [
+            self._signed_url(context, "PUT", object_key, [("partNumber", part_number), ("uploadId", upload_id)])
+            for part_number in part_numbers
+        ]
+
+    def _signing_context(self, expiration, now=None):
+        """한 번의 호출에서 생성하는 URL들이 공유하는 서명 시각, 서명 키, 인증 쿼리 파라미터를 계산."""
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = now.strftime("%Y%m%d")
+        credential_scope = f"{date_stamp}/{self.region}/s3/aws4_request"
+        return {
+            "signing_key": self.get_signing_key(date_stamp),
+            "auth_params": [
+                ("X-Amz-Algorithm", _ALGORITHM),
+                ("X-Amz-Credential", f"{self.access_key}/{credential_scope}"),
+                ("X-Amz-Date", amz_date),
+                ("X-Amz-Expires", str(int(expiration))),
+                ("X-Amz-SignedHeaders", "host"),
+            ],
+            "string_to_sign_prefix": f"{_ALGORITHM}\n{amz_date}\n{credential_scope}\n",
+            "canonical_suffix": f"host:{self.host}\n\nhost\n{_UNSIGNED_PAYLOAD}",
+        }
+
+    def _signed_url(self, context, method, object_key, params):
+        """canonical request에 서명한 path-style URL을 생성 (canonical request 해시와 HMAC 한 번씩)."""
+        path = f"/{self.bucket}/{quote(object_key.encode('utf-8'), safe='/~')}"
+        encoded = [(_quote(key), _quote(value)) for key, value in [*params, *context["auth_params"]]]
+
+        canonical_query = "&".join(f"{key}={value}" for key, value in sorted(encoded))
+        canonical_request = f"{method}\n{path}\n{canonical_query}\n{context['canonical_suffix']}"
+        string_to_sign = (
+            context["string_to_sign_prefix"] + hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()
+        )
+        signature = hmac.new(context["signing_key"], string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+        query = "&".join(f"{key}={value}" for key, value in encoded)
+        return f"{self.scheme}://{self.host}{path}?{query}&X-Amz-Signature={signature}"
+
+
+@functools.lru_cache(maxsize=None)
+def get_presigner():
+    """설정값으로 만든 NCPPresigner를 프로세스 단위로 공유해서 반환 (소켓을 쓰지 않으므로 fork 후에도 안전)."""
+    return NCPPresigner(
+        access_key=settings.AWS_ACCESS_KEY_ID,
+        secret_key=settings.AWS_SECRET_ACCESS_KEY,
+        region=settings.AWS_S3_REGION_NAME,
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+        bucket=settings.AWS_STORAGE_BUCKET_NAME,
+    )
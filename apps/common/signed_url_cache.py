@@ -0,0 +1,129 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+
+
+class SignedURLCache:
+    """만료 시간을 고려하는 Signed URL 캐시 (프로세스 내 LRU + 선택적 Redis).
+
+    캐시 키는 (object_key, 다운로드 파일명, content type, 유효 시간) 이며
+    발급한 URL의 남은 유효 시간이 전체 유효 시간의 min_remaining_ratio보다 많이 남아있는 동안만 재사용.
+    같은 강의를 보는 수강생들이 매 요청마다 새 서명을 만들지 않고 몇 개의 URL을 나눠 쓰도록 하기 위함.
+
+    Attributes:
+        max_entries (int): 프로세스 내 LRU에 보관할 최대 URL 수.
+        min_remaining_ratio (float): 재사용을 허용하는 최소 남은 유효 시간 비율 (0 ~ 1).
+        redis (redis.Redis | None): 워커 간 공유할 Redis 클라이언트. None이면 프로세스 내 캐시만 사용.
+    """
+
+    REDIS_KEY = "signed_url:{digest}"
+
+    def __init__(self, max_entries=10000, min_remaining_ratio=0.5, redis_client=None):
+        self.max_entries = max_entries
+        self.min_remaining_ratio = min_remaining_ratio
+        self.redis = redis_client
+        self._entries = OrderedDict()  # cache_key -> (signed_url, expires_at)
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+
+    def _redis_key(self, cache_key):
+        return self.REDIS_KEY.format(digest=hashlib.sha1(repr(cache_key).encode("utf-8")).hexdigest())
+
+    def _is_fresh(self, expires_at, expiration, now):
+        return expires_at - now > expiration * self.min_remaining_ratio
+
+    def _store_local(self, cache_key, signed_url, expires_at):
+        self._entries[cache_key] = (signed_url, expires_at)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_many(self, cache_keys, expiration, sign_many):
+        """캐시된 URL을 반환하고 없거나 만료가 가까운 URL만 sign_many로 한 번에 새로 서명.
+
+        Args:
+            cache_keys (list[tuple]): (object_key, filename, content_type) 형태의 캐시 키 목록.
+            expiration (int): 새로 서명할 URL의 유효 시간 (초 단위).
+            sign_many (Callable[[list[int]], list[str]]): 캐시에 없는 항목의 인덱스 목록을 받아 URL 목록을 반환.
+
+        Returns:
+            list[str]: cache_keys 순서에 맞는 Signed URL 목록.
+        """
+        now = time.time()
+        cache_keys = [(*cache_key, expiration) for cache_key in cache_keys]
+        signed_urls = [None] * len(cache_keys)
+        missing = []
+
+        with self._lock:
+            for index, cache_key in enumerate(cache_keys):
+                entry = self._entries.get(cache_key)
+                if entry and self._is_fresh(entry[1], expiration, now):
+                    self._entries.move_to_end(cache_key)
+                    signed_urls[index] = entry[0]
+                    self._stats["local_hits"] += 1
+                else:
+                    missing.append(index)
+
+        if missing and self.redis is not None:
+            missing = self._get_from_redis(cache_keys, missing, signed_urls, expiration, now)
+
+        if not missing:
+            return signed_urls
+
+        new_urls = sign_many(missing)
+        expires_at = now + expiration
+        with self._lock:
+            self._stats["misses"] += len(missing)
+            for index, signed_url in zip(missing, new_urls):
+                signed_urls[index] = signed_url
+                self._store_local(cache_keys[index], signed_url, expires_at)
+
+        if self.redis is not None:
+            # Redis에는 재사용 가능한 기간 동안만 남도록 TTL 설정
+            reusable_seconds = int(expiration * (1 - self.min_remaining_ratio))
+            try:
+                pipeline = self.redis.pipeline(transaction=False)
+                for index, signed_url in zip(missing, new_urls):
+                    if signed_url and reusable_seconds > 0:
+                        pipeline.setex(
+                            self._redis_key(cache_keys[index]), reusable_seconds, f"{expires_at}|{signed_url}"
+                        )
+                pipeline.execute()
+            except redis.RedisError:
+                pass  # 캐시 저장 실패는 응답에 영향을 주지 않음
+        return signed_urls
+
+    def _get_from_redis(self, cache_keys, missing, signed_urls, expiration, now):
+        """Redis에서 프로세스 내 캐시에 없는 URL을 조회하고 여전히 없는 인덱스 목록을 반환."""
+        try:
+            values = self.redis.mget([self._redis_key(cache_keys[index]) for index in missing])
+        except redis.RedisError:
+            return missing
+
+        still_missing = []
+        with self._lock:
+            for index, value in zip(missing, values):
+                if value:
+                    expires_at, signed_url = value.split("|", 1)
+                    expires_at = float(expires_at)
+                    if self._is_fresh(expires_at, expiration, now):
+                        signed_urls[index] = signed_url
+                        self._store_local(cache_keys[index], signed_url, expires_at)
+                        self._stats["redis_hits"] += 1
+                        continue
+                still_missing.append(index)
+        return still_missing
+
+    def stats(self):
+        """캐시 적중/미적중 횟수와 현재 보관 중인 URL 수를 반환."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def clear(self):
+        """프로세스 내 캐시와 통계를 초기화 (Redis에 저장된 URL은 TTL로 만료)."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
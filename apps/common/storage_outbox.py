@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete
+from django.utils import timezone
+
+from apps.common.models import StorageDeletion
+from apps.common.utils import get_s3_client, to_object_key
+
+# DeleteObjects API 한 번에 보낼 수 있는 최대 객체 수
+MAX_KEYS_PER_REQUEST = 1000
+
+
+def enqueue_file_deletion(*file_paths):
+    """삭제할 파일을 outbox에 기록.
+
+    호출한 쪽의 트랜잭션 안에서 INSERT만 하므로 DB 변경이 롤백되면 삭제 요청도 함께 롤백됨.
+
+    Args:
+        *file_paths (str): 삭제할 파일 경로 (FieldFile.name 또는 MEDIA_URL이 붙은 경로).
+    """
+    object_keys = {to_object_key(file_path) for file_path in file_paths if file_path}
+    if object_keys:
+        StorageDeletion.objects.bulk_create([StorageDeletion(object_key=object_key) for object_key in object_keys])
+
+
+def register_file_cleanup(model, *field_names):
+    """모델 인스턴스가 삭제될 때 파일 필드의 파일을 outbox에 기록하도록 post_delete 시그널을 연결.
+
+    post_delete는 인스턴스 delete()뿐 아니라 queryset 삭제와 CASCADE 삭제에서도 호출되므로
+    모델의 delete()를 오버라이딩하는 방식과 달리 모든 삭제 경로를 처리.
+
+    Args:
+        model (Model): 파일 필드를 가진 모델 클래스.
+        *field_names (str): 파일 필드 이름.
+    """
+
+    def handle_delete(sender, instance, **kwargs):
+        enqueue_file_deletion(*(getattr(instance, field_name).name for field_name in field_names))
+
+    post_delete.connect(handle_delete, sender=model, weak=False, dispatch_uid=f"file_cleanup_{model._meta.label}")
+
+
+def _backoff(attempts):
+    """재시도 대기 시간 (1분, 2분, 4분 ... 최대 1시간)."""
+    return timedelta(minutes=min(2 ** (attempts - 1), 60))
+
+
+def drain_storage_deletions(batch_size=MAX_KEYS_PER_REQUEST):
+    """outbox에 쌓인 삭제 요청 한 배치를 DeleteObjects API로 처리.
+
+    select_for_update(skip_locked)로 배치를 가져오므로 여러 워커가 동시에 실행해도 같은 행을 처리하지 않음.
+    성공한 행은 삭제하고 실패한 행은 시도 횟수를 올리고 backoff 후 다시 시도.
+    STORAGE_DELETION_MAX_ATTEMPTS 이상 실패한 행은 더 이상 가져오지 않고 last_error와 함께 남겨둠.
+
+    Args:
+        batch_size (int): 한 번에 처리할 최대 행 수 (최대 1000).
+
+    Returns:
+        dict: 이번 배치의 처리 결과 (claimed, deleted, failed).
+    """
+    batch_size = min(batch_size, MAX_KEYS_PER_REQUEST)
+    result = {"claimed": 0, "deleted": 0, "failed": 0}
+
+    with transaction.atomic():
+        rows = list(
+            StorageDeletion.objects.select_for_update(skip_locked=True)
+            .filter(next_attempt_at__lte=timezone.now(), attempts__lt=settings.STORAGE_DELETION_MAX_ATTEMPTS)
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if not rows:
+            return result
+        result["claimed"] = len(rows)
+
+        errors = {}
+        try:
+            response = get_s3_client().delete_objects(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Delete={
+                    "Objects": [{"Key": object_key} for object_key in {row.object_key for row in rows}],
+                    "Quiet": True,
+                },
+            )
+            for error in response.get("Errors", []):
+                # 이미 없는 객체는 삭제된 것으로 간주
+                if error.get("Code") != "NoSuchKey":
+                    errors[error["Key"]] = f"{error.get('Code')}: {error.get('Message')}"
+        except Exception as e:
+            errors = {row.object_key: str(e) for row in rows}
+
+        failed_rows = [row for row in rows if row.object_key in errors]
+        StorageDeletion.objects.filter(id__in=[row.id for row in rows if row.object_key not in errors]).delete()
+        for row in failed_rows:
+            StorageDeletion.objects.filter(id=row.id).update(
+                attempts=F("attempts") + 1,
+                last_error=errors[row.object_key][:1000],
+                next_attempt_at=timezone.now() + _backoff(row.attempts + 1),
+            )
+
+        result["failed"] = len(failed_rows)
+        result["deleted"] = result["claimed"] - result["failed"]
+    return result
+
+
+def get_storage_deletion_stats():
+    """outbox 상태 지표를 반환.
+
+    Returns:
+        dict: pending(처리 대기), retrying(재시도 대기), dead(최대 시도 횟수 초과) 행 수와 가장 오래된 대기 행의 생성 시각.
+    """
+    max_attempts = settings.STORAGE_DELETION_MAX_ATTEMPTS
+    alive = StorageDeletion.objects.filter(attempts__lt=max_attempts)
+    oldest = alive.order_by("created_at").values_list("created_at", flat=True).first()
+    return {
+        "pending": alive.filter(attempts=0).count(),
+        "retrying": alive.filter(attempts__gt=0).count(),
+        "dead": StorageDeletion.objects.filter(attempts__gte=max_attempts).count(),
+        "oldest_pending_at": oldest,
+    }
@@ -1,3 +1,346 @@
-from django.test import TestCase
+import datetime
+import os
+import struct
+import threading
+import time
+import unittest
+import uuid
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import parse_qsl, urlsplit
 
-# Create your tests here.
+import boto3
+from botocore.config import Config
+from django.core import mail
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.common import cache_keys, mail_queue, utils
+from apps.common.mp4 import read_mp4_duration
+from apps.common.near_cache import NearCache
+from apps.common.presigner import NCPPresigner
+from apps.common.utils import near_cache, redis_client
+
+
+class CacheKeysTest(TestCase):
+    """세대 번호 기반 캐시 키 테스트"""
+
+    scope = (cache_keys.LECTURE, "test")
+
+    def setUp(self):
+        redis_client.delete(cache_keys.GENERATION_KEY.format(scope=self.scope[0], scope_id=self.scope[1]))
+        # 이전 테스트에서 프로세스 내 캐시에 남은 세대 번호를 읽지 않도록 비움
+        near_cache.clear()
+        self.addCleanup(near_cache.clear)
+
+    def test_invalidate_changes_cache_key(self):
+        cache_key = cache_keys.make_cache_key("test", self.scope)
+        self.assertEqual(cache_key, "test:lecture-test-v0")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            cache_keys.invalidate(self.scope)
+
+        self.assertEqual(cache_keys.make_cache_key("test", self.scope), "test:lecture-test-v1")
+
+    def test_generation_is_bumped_only_after_commit(self):
+        cache_key = cache_keys.make_cache_key("test", self.scope)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                cache_keys.invalidate(self.scope)
+                # 커밋 전에는 같은 키를 사용하므로 다른 요청이 커밋 전 데이터를 새 세대 키로 캐시할 수 없음
+                self.assertEqual(cache_keys.make_cache_key("test", self.scope), cache_key)
+
+        self.assertNotEqual(cache_keys.make_cache_key("test", self.scope), cache_key)
+
+    def test_value_cached_during_invalidation_is_not_read(self):
+        # 조회 요청이 DB를 읽기 전에 키를 만들고, 그 사이 변경이 커밋되어 무효화된 경우
+        stale_key = cache_keys.make_cache_key("test", self.scope)
+        with self.captureOnCommitCallbacks(execute=True):
+            cache_keys.invalidate(self.scope)
+        redis_client.setex(stale_key, 60, "stale")
+
+        # 이전 데이터는 이전 세대 키에 저장되므로 이후 요청에서 조회되지 않음
+        fresh_key = cache_keys.make_cache_key("test", self.scope)
+        self.assertIsNone(redis_client.get(fresh_key))
+        redis_client.delete(stale_key)
+
+
+def mp4_box(box_type, body, size=None):
+    """MP4 박스 (size, type 헤더 + 본문) 를 생성. size를 지정하면 헤더에 실제와 다른 크기를 기록."""
+    return struct.pack(">I4s", 8 + len(body) if size is None else size, box_type) + body
+
+
+def mvhd_body(timescale, duration):
+    """version 0 mvhd/mdhd 본문 (version/flags, 생성/수정 시각, timescale, duration + 나머지 필드)"""
+    return struct.pack(">B3xIIII", 0, 0, 0, timescale, duration) + bytes(80)
+
+
+class Mp4DurationTest(SimpleTestCase):
+    """MP4 moov 박스에서 영상 길이를 읽는 파서 테스트"""
+
+    def read_duration(self, data):
+        return read_mp4_duration(lambda start, end: data[start : end + 1], chunk_size=16)
+
+    def test_reads_mvhd_duration_after_mdat(self):
+        data = (
+            mp4_box(b"ftyp", b"isom" + bytes(4))
+            + mp4_box(b"mdat", bytes(1000))
+            + mp4_box(b"moov", mp4_box(b"mvhd", mvhd_body(1000, 90500)))
+        )
+
+        self.assertEqual(self.read_duration(data), 90.5)
+
+    def test_falls_back_to_longest_track(self):
+        tracks = b"".join(
+            mp4_box(b"trak", mp4_box(b"mdia", mp4_box(b"mdhd", mvhd_body(600, duration)))) for duration in (6000, 7200)
+        )
+        data = mp4_box(b"moov", mp4_box(b"mvhd", mvhd_body(1000, 0)) + tracks)
+
+        self.assertEqual(self.read_duration(data), 12)
+
+    def test_truncated_mvhd_returns_none(self):
+        # mvhd 헤더는 108 byte라고 기록되어 있지만 본문이 10 byte만 남은 경우
+        data = mp4_box(b"moov", mp4_box(b"mvhd", bytes(10), size=108))
+
+        self.assertIsNone(self.read_duration(data))
+
+    def test_truncated_large_size_header_returns_none(self):
+        data = mp4_box(b"moov", struct.pack(">I4s", 1, b"trak") + bytes(4))
+
+        self.assertIsNone(self.read_duration(data))
+
+    def test_empty_mvhd_body_returns_none(self):
+        self.assertIsNone(self.read_duration(mp4_box(b"moov", mp4_box(b"mvhd", b""))))
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class MailQueueTest(SimpleTestCase):
+    """메일 발송 큐의 처리 중 목록과 워커 종료 후 복구 테스트"""
+
+    def setUp(self):
+        # 실제 발송 큐와 섞이지 않도록 테스트용 키 사용
+        prefix = f"test:{uuid.uuid4().hex}:mail_queue"
+        keys = {
+            "MAIL_QUEUE_KEY": prefix,
+            "MAIL_RETRY_KEY": f"{prefix}:retry",
+            "MAIL_DEAD_LETTER_KEY": f"{prefix}:dead",
+            "MAIL_PROCESSING_KEY": f"{prefix}:processing:{{worker_id}}",
+            "MAIL_WORKERS_KEY": f"{prefix}:workers",
+            "MAIL_WORKER_HEARTBEAT_KEY": f"{prefix}:worker:{{worker_id}}",
+        }
+        patcher = mock.patch.multiple(mail_queue, **keys)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(lambda: redis_client.delete(prefix, *redis_client.keys(f"{prefix}:*")))
+
+    def processing(self, worker_id):
+        return redis_client.lrange(mail_queue.MAIL_PROCESSING_KEY.format(worker_id=worker_id), 0, -1)
+
+    def test_sent_mail_is_removed_from_processing_list(self):
+        mail_queue.enqueue_mail("제목", "본문", ["user@test.com"])
+
+        result = mail_queue.send_queued_mail(worker_id="worker-a")
+
+        self.assertEqual(result["sent"], 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(self.processing("worker-a"), [])
+
+    def test_failed_mail_moves_to_retry(self):
+        mail_queue.enqueue_mail("제목", "본문", ["user@test.com"])
+        connection = mock.Mock(send_messages=mock.Mock(side_effect=ConnectionError("smtp down")))
+
+        result = mail_queue.send_queued_mail(connection=connection, worker_id="worker-a")
+
+        self.assertEqual(result["retried"], 1)
+        self.assertEqual(self.processing("worker-a"), [])
+        self.assertEqual(mail_queue.get_mail_queue_stats()["retrying"], 1)
+
+    def test_mail_claimed_by_stopped_worker_is_recovered(self):
+        mail_queue.enqueue_mail("제목", "본문", ["user@test.com"])
+        # 메일을 꺼낸 뒤 발송하기 전에 워커가 종료된 경우
+        connection = mock.Mock(send_messages=mock.Mock(side_effect=SystemExit))
+        with self.assertRaises(SystemExit):
+            mail_queue.send_queued_mail(connection=connection, worker_id="worker-a")
+        self.assertEqual(len(self.processing("worker-a")), 1)
+
+        # heartbeat가 남아있는 동안은 실행 중인 워커로 보고 복구하지 않음
+        self.assertEqual(mail_queue.recover_stale_mail("worker-b"), 0)
+
+        redis_client.delete(mail_queue.MAIL_WORKER_HEARTBEAT_KEY.format(worker_id="worker-a"))
+        self.assertEqual(mail_queue.recover_stale_mail("worker-b"), 1)
+        self.assertEqual(self.processing("worker-a"), [])
+
+        result = mail_queue.send_queued_mail(worker_id="worker-b")
+        self.assertEqual(result["sent"], 1)
+        self.assertEqual(mail.outbox[0].to, ["user@test.com"])
+
+    def test_restarted_worker_recovers_its_own_processing_list(self):
+        mail_queue.enqueue_mail("제목", "본문", ["user@test.com"])
+        connection = mock.Mock(send_messages=mock.Mock(side_effect=SystemExit))
+        with self.assertRaises(SystemExit):
+            mail_queue.send_queued_mail(connection=connection, worker_id="worker-a")
+
+        # 재시작 후 같은 워커 ID(pid)로 시작하면 heartbeat가 남아있어도 이전 실행의 목록을 복구
+        self.assertEqual(mail_queue.recover_stale_mail("worker-a"), 1)
+        self.assertEqual(mail_queue.get_mail_queue_stats()["queued"], 1)
+
+
+class NearCacheTest(SimpleTestCase):
+    """프로세스 내 캐시(NearCache) pub/sub 무효화 테스트"""
+
+    def setUp(self):
+        # 다른 테스트의 메시지와 섞이지 않도록 테스트마다 별도 채널 사용
+        self.channel = f"near_cache:test:{uuid.uuid4().hex}"
+        self.key = f"{self.channel}:value"
+        self.addCleanup(redis_client.delete, self.key)
+
+    def wait_until(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("timeout")
+            time.sleep(0.01)
+
+    def test_invalidate_from_another_worker_evicts_local_copy(self):
+        local = NearCache(redis_client, channel=self.channel)
+        other_worker = NearCache(redis_client, channel=self.channel)
+
+        # 구독 스레드가 구독을 마치면서 프로세스 내 캐시를 비운 뒤에 값을 보관해야 하므로 구독 완료를 기다림
+        with mock.patch.object(local, "clear", wraps=local.clear) as clear:
+            local.get_many([])
+            self.wait_until(lambda: clear.called)
+
+        redis_client.set(self.key, "1")
+        self.assertEqual(local.get(self.key, loads=int), 1)
+
+        # 다른 워커가 Redis 값을 바꾸기만 하면 프로세스 내 캐시의 값을 계속 읽음
+        redis_client.set(self.key, "2")
+        self.assertEqual(local.get(self.key, loads=int), 1)
+
+        # 다른 워커의 invalidate()가 pub/sub으로 전달되면 프로세스 내 캐시에서 제거되어 Redis에서 다시 읽음
+        other_worker.invalidate(self.key)
+        self.wait_until(lambda: local.get(self.key, loads=int) == 2)
+        self.assertEqual(local.stats()["invalidations"], 1)
+
+
+class S3ClientRegistryTest(SimpleTestCase):
+    """워커 프로세스당 S3 클라이언트 하나를 공유하는지 테스트"""
+
+    def setUp(self):
+        utils._s3_client_registry.clear()
+        self.addCleanup(utils._s3_client_registry.clear)
+
+    def test_threads_share_one_client(self):
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(utils.get_s3_client())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(client) for client in clients}), 1)
+        self.assertIs(utils.get_s3_client(), clients[0])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "fork를 지원하는 OS에서만 실행")
+    def test_forked_process_creates_its_own_client(self):
+        parent_client = utils.get_s3_client()
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:  # 자식 프로세스: 결과만 파이프로 전달하고 바로 종료
+            try:
+                client = utils.get_s3_client()
+                ok = (
+                    client is not parent_client
+                    and utils.get_s3_client() is client
+                    and list(utils._s3_client_registry) == [os.getpid()]
+                )
+                os.write(write_fd, b"1" if ok else b"0")
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd, "rb") as pipe:
+            self.assertEqual(pipe.read(), b"1")
+        # 자식 프로세스가 만든 클라이언트는 부모 프로세스의 레지스트리에 영향이 없음
+        self.assertIs(utils.get_s3_client(), parent_client)
+
+
+class NCPPresignerTest(SimpleTestCase):
+    """직접 계산한 SigV4 presigned URL이 boto3 generate_presigned_url 결과와 같은지 테스트"""
+
+    endpoint_url = "https://kr.object.ncloudstorage.com"
+    bucket = "test-bucket"
+    now = datetime.datetime(2026, 3, 1, 23, 59, 30, tzinfo=datetime.timezone.utc)
+    object_key = "classes/1/assignments/2/submissions/과제 제출 (최종)~v2_0a1b2c3d.pdf"
+
+    def setUp(self):
+        self.presigner = NCPPresigner(
+            access_key="test-access-key",
+            secret_key="test-secret-key",
+            region="kr-standard",
+            endpoint_url=self.endpoint_url,
+            bucket=self.bucket,
+        )
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            aws_access_key_id="test-access-key",
+            aws_secret_access_key="test-secret-key",
+            region_name="kr-standard",
+            config=Config(signature_version="s3v4", s3={"addressing_style": "path"}),
+        )
+
+    def boto3_url(self, client_method, params, expiration):
+        # botocore가 서명 시각으로 사용하는 현재 시각을 self.now로 고정
+        class FrozenDatetime(datetime.datetime):
+            @classmethod
+            def utcnow(cls):
+                return self.now.replace(tzinfo=None)
+
+            @classmethod
+            def now(cls, tz=None):
+                return self.now if tz else self.now.replace(tzinfo=None)
+
+        with mock.patch("botocore.auth.datetime", SimpleNamespace(datetime=FrozenDatetime)):
+            return self.client.generate_presigned_url(
+                client_method, Params={"Bucket": self.bucket, **params}, ExpiresIn=expiration
+            )
+
+    def assertSameURL(self, url, expected):
+        url, expected = urlsplit(url), urlsplit(expected)
+        self.assertEqual((url.scheme, url.netloc, url.path), (expected.scheme, expected.netloc, expected.path))
+        self.assertEqual(sorted(parse_qsl(url.query)), sorted(parse_qsl(expected.query)))
+
+    def test_presign_get_matches_boto3(self):
+        url = self.presigner.presign_get(self.object_key, expiration=600, now=self.now)
+
+        self.assertSameURL(url, self.boto3_url("get_object", {"Key": self.object_key}, 600))
+
+    def test_presign_get_with_response_params_matches_boto3(self):
+        response_params = utils._download_response_params(self.object_key, "과제 제출 (최종).pdf")
+
+        urls = self.presigner.presign_get_many(
+            [self.object_key, "classes/1/lectures/1/materials_a.pdf"], 3600, response_params, now=self.now
+        )
+
+        self.assertSameURL(urls[0], self.boto3_url("get_object", {"Key": self.object_key, **response_params}, 3600))
+        self.assertSameURL(
+            urls[1],
+            self.boto3_url("get_object", {"Key": "classes/1/lectures/1/materials_a.pdf", **response_params}, 3600),
+        )
+
+    def test_presign_upload_parts_matches_boto3(self):
+        upload_id = "2~abc/def+ghi="
+
+        urls = self.presigner.presign_upload_parts(self.object_key, upload_id, [1, 2, 10000], now=self.now)
+
+        for part_number, url in zip([1, 2, 10000], urls):
+            expected = self.boto3_url(
+                "upload_part",
+                {"Key": self.object_key, "UploadId": upload_id, "PartNumber": part_number},
+                3600,
+            )
+            self.assertSameURL(url, expected)
@@ -0,0 +1,112 @@
+import time
+import uuid
+
+import redis
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+
+from apps.common.utils import redis_client
+
+THROTTLE_KEY = "throttle:{scope}:{dimension}:{ident}"
+
+# 여러 sliding window(IP, 이메일, 전체)를 한 번에 확인하고, 모두 여유가 있을 때만 이번 요청을 기록
+# KEYS: window별 sorted set / ARGV: 현재 시각(ms), 요청 ID, 이후 window마다 (최대 요청 수, window 길이(ms))
+# 반환값: 0이면 허용, 아니면 다시 요청할 수 있을 때까지 남은 시간(ms)
+_SLIDING_WINDOW_SCRIPT = redis_client.register_script(
+    """
+local now = tonumber(ARGV[1])
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[i * 2 + 1])
+    local window = tonumber(ARGV[i * 2 + 2])
+    redis.call("ZREMRANGEBYSCORE", key, "-inf", now - window)
+    if redis.call("ZCARD", key) >= limit then
+        local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+        wait = math.max(wait, tonumber(oldest[2]) + window - now, 1)
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i, key in ipairs(KEYS) do
+    redis.call("ZADD", key, now, ARGV[2])
+    redis.call("PEXPIRE", key, tonumber(ARGV[i * 2 + 2]))
+end
+return 0
+"""
+)
+
+DURATIONS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24}
+
+
+def parse_rate(rate):
+    """DRF 형식의 요청 제한("5/min", "100/hour")을 (최대 요청 수, window 길이(초))로 변환."""
+    num, period = rate.split("/")
+    return int(num), DURATIONS[period[0]]
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """Redis sorted set 기반 sliding window 요청 제한 (IP별, 이메일별, 전체).
+
+    뷰의 throttle_scope로 REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]에서 아래 요청 제한을 찾아 적용하며,
+    설정되지 않은 항목은 제한하지 않음.
+
+    - "{scope}_ip": 클라이언트 IP별 (NUM_PROXIES 설정에 따라 X-Forwarded-For 사용)
+    - "{scope}_email": 요청 본문의 email별 (여러 IP에서 한 계정을 노리는 요청 제한)
+    - "{scope}": 모든 요청 합계 (워커가 감당할 수 있는 전체 처리량)
+
+    모든 window를 Lua 스크립트 한 번으로 확인하고 기록하므로 요청마다 Redis 왕복은 한 번이며,
+    DRF가 뷰의 핸들러보다 먼저 호출하므로 거부된 요청은 비밀번호 해시나 DB 조회를 하지 않음.
+    Redis에 연결할 수 없으면 로그인이 막히지 않도록 요청을 허용.
+
+    Attributes:
+        scope_attr (str): 뷰에서 scope를 읽을 속성 이름.
+    """
+
+    scope_attr = "throttle_scope"
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_limits(self, request, view):
+        """(Redis 키, 최대 요청 수, window 길이(초)) 목록을 반환."""
+        scope = getattr(view, self.scope_attr, None)
+        if not scope:
+            return []
+
+        rates = settings.REST_FRAMEWORK.get("DEFAULT_THROTTLE_RATES", {})
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        idents = {
+            "ip": self.get_ident(request),
+            "email": email.strip().lower() if isinstance(email, str) and email.strip() else None,
+            "all": "all",
+        }
+        limits = []
+        for dimension, rate_name in (("ip", f"{scope}_ip"), ("email", f"{scope}_email"), ("all", scope)):
+            rate = rates.get(rate_name)
+            if rate and idents[dimension]:
+                key = THROTTLE_KEY.format(scope=scope, dimension=dimension, ident=idents[dimension])
+                limits.append((key, *parse_rate(rate)))
+        return limits
+
+    def allow_request(self, request, view):
+        limits = self.get_limits(request, view)
+        if not limits:
+            return True
+
+        args = [int(time.time() * 1000), uuid.uuid4().hex]
+        for _, num_requests, duration in limits:
+            args += [num_requests, duration * 1000]
+        try:
+            wait_ms = _SLIDING_WINDOW_SCRIPT(keys=[key for key, _, _ in limits], args=args)
+        except redis.RedisError as e:
+            print(f"Throttle check failed: {e}")
+            return True
+
+        if wait_ms:
+            self.wait_seconds = wait_ms / 1000
+            return False
+        return True
+
+    def wait(self):
+        return self.wait_seconds
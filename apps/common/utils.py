@@ -1,11 +1,95 @@
 import os
+import threading
 import urllib.parse
 import uuid
 
 import boto3
 import redis
+from botocore.config import Config
 from django.conf import settings
 
+from apps.common.near_cache import NearCache
+from apps.common.presigner import get_presigner
+from apps.common.signed_url_cache import SignedURLCache
+
+# 워커 프로세스마다 하나씩만 생성해서 재사용하는 S3 클라이언트 (pid, client)
+_s3_client_registry = {}
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """NCP Object Storage(S3 호환) 클라이언트를 반환.
+
+    boto3 클라이언트는 생성 비용이 크지만 스레드 안전하므로 워커 프로세스당 하나만 만들어 공유.
+    fork 이후에는 부모 프로세스의 커넥션 풀을 물려받지 않도록 pid 기준으로 새로 생성.
+
+    Returns:
+        botocore.client.S3: 커넥션 풀이 적용된 S3 클라이언트.
+    """
+    pid = os.getpid()
+    client = _s3_client_registry.get(pid)
+    if client is not None:
+        return client
+
+    with _s3_client_lock:
+        client = _s3_client_registry.get(pid)
+        if client is None:
+            _s3_client_registry.clear()  # 부모 프로세스에서 만든 클라이언트는 버림
+            client = boto3.session.Session().client(
+                "s3",
+                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_S3_REGION_NAME,
+                config=Config(max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS),
+            )
+            _s3_client_registry[pid] = client
+    return client
+
+
+def to_object_key(file_path):
+    """MEDIA_URL이 붙어있는 경로에서 버킷 내 객체 경로만 추출."""
+    return file_path.replace(settings.MEDIA_URL, "").lstrip("/")
+
+
+def _download_response_params(object_key, original_filename=None):
+    """브라우저가 원래 파일명으로 다운로드하도록 하는 응답 헤더 override 값을 생성."""
+    filename = original_filename or os.path.basename(object_key)
+
+    # UTF-8 percent-encoded filename for non-ASCII names
+    encoded_filename = urllib.parse.quote(filename)
+
+    content_disposition = f"attachment; filename=\"{filename}\"; filename*=UTF-8''{encoded_filename}"
+
+    return {
+        "ResponseContentType": "application/octet-stream",  #  브라우저가 파일을 무조건 다운로드하도록 지시하는 binary type
+        "ResponseContentDisposition": content_disposition,
+        "ResponseCacheControl": "no-cache",
+    }
+
+
+def _presign_cached(files, expiration):
+    """Signed URL 캐시를 거쳐 URL 목록을 반환하고, 캐시에 없는 파일만 한 번에 서명.
+
+    Args:
+        files (list[tuple[str, str | None, dict]]): (object_key, 다운로드 파일명, 응답 헤더 override) 목록.
+            override가 빈 dict이면 응답 헤더를 바꾸지 않는 URL.
+        expiration (int): URL 유효 시간 (초 단위).
+
+    Returns:
+        list[str]: files 순서에 맞는 Signed URL 목록.
+    """
+
+    def sign_many(indexes):
+        return get_presigner().presign_get_many(
+            [files[index][0] for index in indexes],
+            expiration,
+            [files[index][2] for index in indexes],
+        )
+
+    cache_keys = [(object_key, filename, params.get("ResponseContentType")) for object_key, filename, params in files]
+    return signed_url_cache.get_many(cache_keys, expiration, sign_many)
+
 
 def generate_ncp_signed_url(object_key, expiration=60 * 30):
     """
@@ -18,30 +102,26 @@ def generate_ncp_signed_url(object_key, expiration=60 * 30):
     if not object_key:
         return None
 
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
+    response_params = {
+        "ResponseContentType": "video/mp4",  # 파일 유형 설정 (필요시)
+        "ResponseCacheControl": "no-cache",  # 캐시 방지
+    }
+
+    # Signed URL 생성 (유효 시간이 충분히 남은 URL이 캐시에 있으면 재사용)
+    return _presign_cached([(object_key, None, response_params)], expiration)[0]
 
-    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
-
-    # Signed URL 생성
-    signed_url = s3_client.generate_presigned_url(
-        "get_object",
-        Params={
-            "Bucket": bucket_name,
-            "Key": object_key,
-            "ResponseContentType": "video/mp4",  # 파일 유형 설정 (필요시)
-            "ResponseCacheControl": "no-cache",  # 캐시 방지
-        },
-        ExpiresIn=expiration,
-        HttpMethod="GET",
-    )
 
-    return signed_url
+def generate_signed_urls(object_keys, expiration=3600):
+    """응답 헤더를 바꾸지 않는 GET Signed URL을 Signed URL 캐시를 거쳐 한 번에 생성.
+
+    Args:
+        object_keys (list[str]): 버킷 내 객체 경로 목록.
+        expiration (int): URL 유효 시간 (초 단위).
+
+    Returns:
+        list[str]: object_keys 순서에 맞는 Signed URL 목록.
+    """
+    return _presign_cached([(object_key, None, {}) for object_key in object_keys], expiration)
 
 
 def generate_download_signed_url(object_key, expiration=3600, original_filename=None):
@@ -55,42 +135,62 @@ def generate_download_signed_url(object_key, expiration=3600, original_filename=
         return None
 
     try:
-        s3_client = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME,
-        )
-
-        bucket_name = settings.AWS_STORAGE_BUCKET_NAME
-        object_key = object_key.replace(settings.MEDIA_URL, "").lstrip("/")
-        filename = original_filename or os.path.basename(object_key)
-
-        # UTF-8 percent-encoded filename for non-ASCII names
-        encoded_filename = urllib.parse.quote(filename)
-
-        content_disposition = f"attachment; filename=\"{filename}\"; filename*=UTF-8''{encoded_filename}"
-
-        signed_url = s3_client.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": bucket_name,
-                "Key": object_key,
-                "ResponseContentType": "application/octet-stream",  #  브라우저가 파일을 무조건 다운로드하도록 지시하는 binary type
-                "ResponseContentDisposition": content_disposition,
-                "ResponseCacheControl": "no-cache",
-            },
-            ExpiresIn=expiration,
-            HttpMethod="GET",
-        )
-
-        return signed_url
+        return generate_download_signed_urls([(object_key, original_filename)], expiration=expiration)[0]
 
     except Exception as e:
         return None  # 오류 발생 시 None 반환
 
 
+def generate_download_signed_urls(files, expiration=3600):
+    """여러 파일의 다운로드 Signed URL을 한 번에 생성.
+
+    Args:
+        files (list[tuple[str, str | None]]): (object_key, original_filename) 목록.
+        expiration (int): URL 유효 시간 (초 단위).
+
+    Returns:
+        list[str | None]: files 순서에 맞는 Signed URL 목록. object_key가 없으면 None.
+    """
+    to_sign = []
+    for object_key, original_filename in files:
+        if object_key:
+            object_key = to_object_key(object_key)
+            to_sign.append((object_key, original_filename, _download_response_params(object_key, original_filename)))
+
+    signed_urls = iter(_presign_cached(to_sign, expiration))
+    return [next(signed_urls) if object_key else None for object_key, _ in files]
+
+
+def attach_download_urls(download_infos, expiration=3600):
+    """file_name, object_key를 가진 다운로드 정보 dict 목록에 download_url을 일괄 생성해서 채움.
+
+    Args:
+        download_infos (Iterable[dict | None]): 직렬화된 다운로드 정보 목록 (None은 건너뜀).
+        expiration (int): URL 유효 시간 (초 단위).
+    """
+    download_infos = [info for info in download_infos if info and info.get("object_key")]
+    signed_urls = generate_download_signed_urls(
+        [(info["object_key"], info.get("file_name")) for info in download_infos], expiration=expiration
+    )
+    for info, signed_url in zip(download_infos, signed_urls):
+        info["download_url"] = signed_url
+
+
+def copy_download_infos(items, field):
+    """캐시에서 꺼낸 항목에 download_url을 붙일 수 있도록 항목과 다운로드 정보 dict만 얕은 복사.
+
+    프로세스 내 캐시(near_cache)가 반환하는 객체는 여러 요청이 공유하므로 직접 수정하지 않기 위함.
+
+    Args:
+        items (list[dict]): 직렬화된 항목 목록.
+        field (str): 다운로드 정보 dict가 들어있는 필드 이름 (예: "material_info").
+
+    Returns:
+        list[dict]: 복사된 항목 목록.
+    """
+    return [{**item, field: item.get(field) and {**item[field]}} for item in items]
+
+
 def generate_unique_filename(filename):
     """원본 파일명 + UUID + 확장자로 파일명 생성하는 함수"""
     name, ext = os.path.splitext(filename)  # 파일명과 확장자 분리
@@ -107,20 +207,20 @@ def class_lecture_file_path(instance, filename):
     # Lecture 모델 (썸네일 저장)
     if isinstance(instance, Lecture):
         file_type = "thumbnails"
-        course_id = instance.course.id
+        course_id = instance.course_id
         lecture_id = instance.id
 
     # LectureChapter 모델 (학습자료 저장)
     elif isinstance(instance, LectureChapter):
         file_type = "materials"
-        course_id = instance.lecture.course.id
-        lecture_id = instance.lecture.id
+        course_id = instance.lecture.course_id
+        lecture_id = instance.lecture_id
 
-    # ChapterVideo 모델 (강의 영상 저장)
+    # ChapterVideo 모델 (강의 영상 저장, save에서 복사해 둔 과목/과정 ID 사용)
     elif isinstance(instance, ChapterVideo):
         file_type = "videos"
-        course_id = instance.lecture_chapter.lecture.course.id
-        lecture_id = instance.lecture_chapter.lecture.id
+        course_id = instance.course_id
+        lecture_id = instance.lecture_id
 
     else:
         raise ValueError(f"지원되지 않는 모델 유형입니다: {type(instance).__name__}")
@@ -146,11 +246,8 @@ def assignment_material_path(instance, filename):
     # instance는 이미 Assignment 인스턴스이므로, pk가 있다면 사용, 없다면 'new'로 처리
     assignment_pk = instance.pk if instance.pk else "new"
 
-    try:
-        # Lecture 정보를 통해 강의(클래스) 식별자(course_id)를 가져옵니다.
-        course_id = instance.chapter_video.lecture_chapter.lecture.course_id
-    except AttributeError:
-        course_id = "default"
+    # save에서 chapter_video의 과정 ID를 복사해 두므로 상위 객체를 조회하지 않음
+    course_id = instance.course_id or "default"
 
     return f"classes/{course_id}/assignments/{assignment_pk}/assignment_materials/{unique_filename}"
 
@@ -178,42 +275,34 @@ def assignment_comment_file_path(instance, filename):
     is_instructor = hasattr(instance.user, "instructor")
 
     # 파일 저장 경로 설정
-    base_path = f"classes/{instance.assignment.chapter_video.lecture_chapter.lecture.course_id}/assignments/{instance.assignment.pk}"
+    base_path = f"classes/{instance.assignment.course_id}/assignments/{instance.assignment.pk}"
     folder = "feedbacks" if is_instructor else "submissions"
 
     return f"{base_path}/{folder}/{unique_filename}"
 
 
-def delete_file_from_ncp(file_path):
-    """NCP Object Storage에서 파일을 삭제.
-
-    Args:
-        file_path (str): 삭제할 파일의 경로.
-    """
-    if not file_path:
-        return
-
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
+# 프로세스당 하나의 커넥션 풀을 공유 (Django 캐시와 같은 서버/풀 설정 사용)
+# Django 캐시는 직렬화된 bytes를 다루고 redis_client는 문자열을 반환해야 하므로 커넥션(디코딩 설정)은 분리
+redis_client = redis.StrictRedis(
+    connection_pool=redis.ConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        decode_responses=True,  # 문자열 반환을 위해 decode_responses=True 설정
+        **settings.REDIS_CONNECTION_POOL_KWARGS,
     )
+)
 
-    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
-    object_key = file_path.replace(settings.MEDIA_URL, "").lstrip("/")
-
-    try:
-        s3_client.delete_object(Bucket=bucket_name, Key=object_key)
-        print(f"Deleted from NCP Storage: {object_key}")
-    except Exception as e:
-        print(f"Error deleting file from NCP: {e}")
-
+near_cache = NearCache(
+    redis_client,
+    max_entries=settings.NEAR_CACHE_MAX_ENTRIES,
+    ttl=settings.NEAR_CACHE_TTL,
+)
 
-redis_client = redis.StrictRedis(
-    host=os.getenv("REDIS_HOST"),
-    port=6379,
-    db=0,
-    decode_responses=True,  # 문자열 반환을 위해 decode_responses=True 설정
+signed_url_cache = SignedURLCache(
+    max_entries=settings.SIGNED_URL_CACHE_MAX_ENTRIES,
+    min_remaining_ratio=settings.SIGNED_URL_CACHE_MIN_REMAINING_RATIO,
+    redis_client=redis_client if settings.SIGNED_URL_CACHE_USE_REDIS else None,
 )
@@ -0,0 +1,36 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.courses.progress_buffer import flush_progress_buffer, get_progress_buffer_size
+
+
+class Command(BaseCommand):
+    help = "Redis에 모아둔 학습 진행률 heartbeat를 INSERT ... ON CONFLICT 로 DB에 일괄 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.PROGRESS_BUFFER_BATCH_SIZE, help="한 번에 저장할 최대 행 수"
+        )
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 주기적으로 flush")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.PROGRESS_BUFFER_FLUSH_INTERVAL,
+            help="--loop 사용 시 flush 주기 (초)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        while True:
+            flushed = flush_progress_buffer(batch_size=batch_size)
+            if flushed:
+                self.stdout.write(f"flushed={flushed} pending={get_progress_buffer_size()}")
+
+            # 꽉 찬 배치를 저장했다면 남은 heartbeat가 있을 수 있으므로 바로 다음 배치 처리
+            if flushed >= batch_size:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
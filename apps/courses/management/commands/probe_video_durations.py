@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.courses.models import ChapterVideo
+from apps.courses.video_upload import update_video_duration
+
+
+class Command(BaseCommand):
+    help = "영상 길이가 저장되지 않은 강의 영상의 moov 박스를 읽어 duration_seconds를 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="이미 영상 길이가 저장된 강의 영상도 다시 계산")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 새로 업로드된 영상을 계속 확인")
+        parser.add_argument("--interval", type=float, default=5.0, help="--loop 사용 시 비어있을 때 대기 시간 (초)")
+
+    def handle(self, *args, **options):
+        videos = ChapterVideo.objects.exclude(video_url="").exclude(video_url__isnull=True)
+        if not options["all"]:
+            videos = videos.filter(duration_seconds__isnull=True)
+
+        # 계산에 실패한 영상은 워커가 재시작되기 전까지 다시 시도하지 않음 (같은 영상을 반복해서 읽지 않도록)
+        failed_ids = set()
+        while True:
+            updated = failed = 0
+            for chapter_video_id in videos.exclude(id__in=failed_ids).values_list("id", flat=True).iterator():
+                if update_video_duration(chapter_video_id):
+                    updated += 1
+                else:
+                    failed += 1
+                    failed_ids.add(chapter_video_id)
+                    self.stderr.write(f"chapter_video={chapter_video_id} 영상 길이 계산 실패")
+
+            if updated or failed or not options["loop"]:
+                self.stdout.write(self.style.SUCCESS(f"updated={updated} failed={failed}"))
+            if not options["loop"]:
+                break
+            # --all은 한 번 전체를 다시 계산한 뒤에는 길이가 비어있는 영상만 확인
+            videos = videos.filter(duration_seconds__isnull=True)
+            time.sleep(options["interval"])
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.courses.progress import rebuild_lecture_progress
+
+
+class Command(BaseCommand):
+    help = "Lecture.video_count와 학생별 과목 완료 영상 수(LectureProgress) 를 ProgressTracking에서 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lecture", type=int, action="append", help="다시 계산할 과목 ID (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        rows = rebuild_lecture_progress(options["lecture"])
+        self.stdout.write(self.style.SUCCESS(f"lecture_progress rows={rows}"))
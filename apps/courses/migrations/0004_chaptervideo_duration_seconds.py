@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0003_alter_lecture_instructor"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chaptervideo",
+            name="duration_seconds",
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F
+
+
+def backfill_lecture_progress(apps, schema_editor):
+    """기존 강의 영상 수와 학생별 과목 완료 영상 수를 계산해서 채움"""
+    ChapterVideo = apps.get_model("courses", "ChapterVideo")
+    Lecture = apps.get_model("courses", "Lecture")
+    LectureProgress = apps.get_model("courses", "LectureProgress")
+    ProgressTracking = apps.get_model("courses", "ProgressTracking")
+
+    video_counts = (
+        ChapterVideo.objects.order_by()
+        .values(lecture_id=F("lecture_chapter__lecture_id"))
+        .annotate(count=Count("id"))
+        .values_list("lecture_id", "count")
+    )
+    for lecture_id, count in video_counts:
+        Lecture.objects.filter(id=lecture_id).update(video_count=count)
+
+    completed_counts = (
+        ProgressTracking.objects.filter(is_completed=True, student__isnull=False)
+        .order_by()
+        .values("student_id", lecture_id=F("chapter_video__lecture_chapter__lecture_id"))
+        .annotate(count=Count("id"))
+    )
+    LectureProgress.objects.bulk_create(
+        [
+            LectureProgress(student_id=row["student_id"], lecture_id=row["lecture_id"], completed_count=row["count"])
+            for row in completed_counts
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0004_chaptervideo_duration_seconds"),
+        ("users", "0005_instructor_deleted_at_instructor_restored_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lecture",
+            name="video_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="LectureProgress",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("completed_count", models.PositiveIntegerField(default=0)),
+                ("lecture", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="courses.lecture")),
+                ("student", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="users.student")),
+            ],
+            options={
+                "db_table": "lecture_progress",
+                "unique_together": {("student", "lecture")},
+            },
+        ),
+        migrations.RunPython(backfill_lecture_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_chapter_video_ancestors(apps, schema_editor):
+    """기존 강의 영상에 챕터의 과목/과정 ID를 UPDATE 한 번으로 채움"""
+    ChapterVideo = apps.get_model("courses", "ChapterVideo")
+    LectureChapter = apps.get_model("courses", "LectureChapter")
+
+    chapters = LectureChapter.objects.filter(pk=OuterRef("lecture_chapter_id"))
+    ChapterVideo.objects.update(
+        lecture_id=Subquery(chapters.values("lecture_id")[:1]),
+        course_id=Subquery(chapters.values("lecture__course_id")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0005_lecture_progress"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chaptervideo",
+            name="course",
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, to="courses.course"
+            ),
+        ),
+        migrations.AddField(
+            model_name="chaptervideo",
+            name="lecture",
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, to="courses.lecture"
+            ),
+        ),
+        migrations.RunPython(backfill_chapter_video_ancestors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0006_chaptervideo_lecture_course"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="chaptervideo",
+            name="course",
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, to="courses.course"),
+        ),
+        migrations.AlterField(
+            model_name="chaptervideo",
+            name="lecture",
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, to="courses.lecture"),
+        ),
+    ]
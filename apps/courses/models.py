@@ -1,11 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 
 from apps.common.models import BaseModel
-from apps.common.utils import (
-    class_lecture_file_path,
-    delete_file_from_ncp,
-    generate_ncp_signed_url,
-)
+from apps.common.storage_outbox import enqueue_file_deletion
+from apps.common.utils import class_lecture_file_path, generate_ncp_signed_url
 from apps.users.models import Instructor, Student
 
 
@@ -30,24 +27,28 @@ class Lecture(BaseModel):
     introduction = models.CharField(max_length=1000)  # 강의 소개
     learning_objective = models.CharField(max_length=255)  # 학습 목표
     progress_rate = models.DecimalField(max_digits=5, decimal_places=2)  # 강의 진행 상황
+    video_count = models.PositiveIntegerField(default=0)  # 강의 영상 수 (ChapterVideo 추가/삭제 시그널에서 갱신)
 
     def __str__(self):
         return f"{self.course.title} - {self.title}"  # 과정명 + 강의명을 출력
 
     def save(self, *args, **kwargs):
-        """썸네일 변경 시 기존 썸네일 삭제"""
-        if self.pk:
-            old_instance = Lecture.objects.get(pk=self.pk)
-            if old_instance.thumbnail and old_instance.thumbnail != self.thumbnail:
-                delete_file_from_ncp(old_instance.thumbnail.name)  # 기존 파일 삭제
+        """썸네일 변경 시 기존 썸네일 삭제 (삭제는 outbox에 기록 후 워커가 처리)
 
-        super().save(*args, **kwargs)  # 새로운 파일 저장
+        다른 과정으로 옮겨진 경우 하위 강의 영상, 과제에 복사해 둔 과정 ID도 함께 갱신
+        """
+        from apps.assignments.models import Assignment
+
+        with transaction.atomic():
+            old_instance = Lecture.objects.filter(pk=self.pk).only("thumbnail", "course").first() if self.pk else None
+            if old_instance and old_instance.thumbnail and old_instance.thumbnail != self.thumbnail:
+                enqueue_file_deletion(old_instance.thumbnail.name)  # 기존 파일 삭제 예약
 
-    def delete(self, *args, **kwargs):
-        """NCP Object Storage에서도 파일 삭제"""
-        if self.thumbnail:
-            delete_file_from_ncp(self.thumbnail.name)  # 파일 삭제 실행
-        super().delete(*args, **kwargs)
+            super().save(*args, **kwargs)  # 새로운 파일 저장
+
+            if old_instance and old_instance.course_id != self.course_id:
+                ChapterVideo.objects.filter(lecture=self).update(course_id=self.course_id)
+                Assignment.objects.filter(lecture=self).update(course_id=self.course_id)
 
     class Meta:
         db_table = "lecture"
@@ -62,19 +63,30 @@ class LectureChapter(BaseModel):
         return f"{self.lecture.title} - {self.title}"  # Lecture 제목 + 챕터 제목 출력
 
     def save(self, *args, **kwargs):
-        """파일이 변경될 경우 기존 파일 삭제 후 새로운 파일 저장"""
-        if self.pk:  # 기존 객체가 존재하는 경우
-            old_instance = LectureChapter.objects.get(pk=self.pk)
-            if old_instance.material_url and old_instance.material_url != self.material_url:
-                delete_file_from_ncp(old_instance.material_url.name)  # 기존 파일 삭제
-
-        super().save(*args, **kwargs)  # 새로운 파일 저장
+        """파일이 변경될 경우 기존 파일 삭제 후 새로운 파일 저장 (삭제는 outbox에 기록 후 워커가 처리)
 
-    def delete(self, *args, **kwargs):
-        """NCP Object Storage에서도 파일 삭제"""
-        if self.material_url:
-            delete_file_from_ncp(self.material_url.name)
-        super().delete(*args, **kwargs)
+        다른 과목으로 옮겨진 경우 하위 강의 영상, 과제에 복사해 둔 과목/과정 ID도 함께 갱신
+        """
+        from apps.assignments.models import Assignment
+
+        with transaction.atomic():
+            old_instance = (
+                LectureChapter.objects.filter(pk=self.pk).only("material_url", "lecture").first() if self.pk else None
+            )
+            if old_instance and old_instance.material_url and old_instance.material_url != self.material_url:
+                enqueue_file_deletion(old_instance.material_url.name)  # 기존 파일 삭제 예약
+            # 다른 과목으로 옮겨진 경우 이전 과목의 캐시도 무효화하기 위해 기록 (post_save 시그널에서 사용)
+            self._previous_lecture_id = old_instance.lecture_id if old_instance else None
+
+            # post_save 시그널에서 과목별 영상 수를 다시 계산할 때 옮겨진 값을 사용하도록 저장 전에 갱신
+            if old_instance and old_instance.lecture_id != self.lecture_id:
+                course_id = Lecture.objects.filter(pk=self.lecture_id).values_list("course_id", flat=True).get()
+                ChapterVideo.objects.filter(lecture_chapter=self).update(
+                    lecture_id=self.lecture_id, course_id=course_id
+                )
+                Assignment.objects.filter(lecture_chapter=self).update(lecture_id=self.lecture_id, course_id=course_id)
+
+            super().save(*args, **kwargs)  # 새로운 파일 저장
 
     class Meta:
         db_table = "lecture_chapter"
@@ -82,33 +94,62 @@ class LectureChapter(BaseModel):
 
 class ChapterVideo(BaseModel):
     lecture_chapter = models.ForeignKey(LectureChapter, on_delete=models.CASCADE)
+    # lecture_chapter의 과목/과정 (save에서 복사, 파일 경로 생성과 캐시 무효화, 권한 확인 시 JOIN 없이 사용)
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, editable=False)
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, editable=False)
     title = models.CharField(max_length=50)
     video_url = models.FileField(upload_to=class_lecture_file_path, null=True, blank=True)  # 강의 영상
+    duration_seconds = models.FloatField(
+        null=True, blank=True
+    )  # 영상 길이 (초 단위, 업로드 후 probe_video_durations 워커가 moov 박스에서 계산)
 
-    def get_video_url(self, user_id=None):
+    def get_video_url(self):
         """
         강의 영상의 Signed URL을 반환
-        :param user_id: 현재 요청한 사용자 ID (보안 강화를 위해 추가)
         :return: Signed URL 또는 None
         """
         if self.video_url:
-            return generate_ncp_signed_url(self.video_url.name, user_id=user_id)
+            return generate_ncp_signed_url(self.video_url.name)
         return None
 
     def save(self, *args, **kwargs):
-        """강의 영상 변경 시 기존 파일 삭제"""
-        if self.pk:
-            old_instance = ChapterVideo.objects.get(pk=self.pk)
-            if old_instance.video_url and old_instance.video_url != self.video_url:
-                delete_file_from_ncp(old_instance.video_url.name)  # 기존 파일 삭제
-
-        super().save(*args, **kwargs)  # 새로운 파일 저장
+        """강의 영상 변경 시 기존 파일 삭제 (삭제는 outbox에 기록 후 워커가 처리)
 
-    def delete(self, *args, **kwargs):
-        """NCP Object Storage에서도 파일 삭제"""
-        if self.video_url:
-            delete_file_from_ncp(self.video_url.name)  # 파일 삭제 실행
-        super().delete(*args, **kwargs)
+        영상이 바뀌면 duration_seconds를 비워두고, 영상 길이는 요청과 별도로
+        probe_video_durations 워커가 moov 박스를 읽어서 채움.
+        새 영상이거나 다른 챕터로 옮겨진 경우 챕터의 과목/과정 ID를 복사하고 하위 과제에도 반영
+        """
+        from apps.assignments.models import Assignment
+
+        with transaction.atomic():
+            old_instance = (
+                ChapterVideo.objects.filter(pk=self.pk).only("video_url", "lecture_chapter", "lecture").first()
+                if self.pk
+                else None
+            )
+            # 다른 챕터로 옮겨진 경우 이전 과목의 영상 수도 갱신하기 위해 기록 (post_save 시그널에서 사용)
+            self._previous_lecture_chapter_id = old_instance.lecture_chapter_id if old_instance else None
+            self._previous_lecture_id = old_instance.lecture_id if old_instance else None
+            chapter_changed = old_instance is None or old_instance.lecture_chapter_id != self.lecture_chapter_id
+            if chapter_changed:
+                # 파일 경로(class_lecture_file_path)가 과목/과정 ID를 사용하므로 저장 전에 복사
+                self.lecture_id, self.course_id = (
+                    LectureChapter.objects.filter(pk=self.lecture_chapter_id)
+                    .values_list("lecture_id", "lecture__course_id")
+                    .get()
+                )
+            video_changed = (old_instance.video_url if old_instance else None) != self.video_url
+            if video_changed:
+                if old_instance and old_instance.video_url:
+                    enqueue_file_deletion(old_instance.video_url.name)  # 기존 파일 삭제 예약
+                self.duration_seconds = None  # probe_video_durations 워커가 채움
+
+            super().save(*args, **kwargs)  # 새로운 파일 저장
+
+            if old_instance and chapter_changed:
+                Assignment.objects.filter(chapter_video=self).update(
+                    lecture_chapter_id=self.lecture_chapter_id, lecture_id=self.lecture_id, course_id=self.course_id
+                )
 
     def __str__(self):
         return self.title
@@ -127,3 +168,20 @@ class ProgressTracking(BaseModel):
     class Meta:
         db_table = "progress_tracking"
         unique_together = ("student", "chapter_video")
+
+
+class LectureProgress(BaseModel):
+    """학생별 과목 완료 영상 수 요약 테이블.
+
+    과목 목록에서 학생의 진행률을 ProgressTracking 집계 없이 조회하기 위해
+    ProgressTracking.is_completed가 바뀔 때마다 해당 (학생, 과목) 의 완료 영상 수를 다시 계산해서 저장.
+    rebuild_lecture_progress 커맨드로 전체를 다시 계산할 수 있음.
+    """
+
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE)
+    completed_count = models.PositiveIntegerField(default=0)  # 완료한 강의 영상 수
+
+    class Meta:
+        db_table = "lecture_progress"
+        unique_together = ("student", "lecture")
@@ -0,0 +1,224 @@
+from django.db import connection, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.courses.models import ChapterVideo, Lecture, LectureProgress, ProgressTracking
+
+COMPLETION_THRESHOLD = 98  # 진행률이 이 값(%) 이상이면 완료 처리
+MAX_PROGRESS = 100
+
+
+def calculate_progress(last_watched_time, total_duration):
+    """마지막 시청 시간과 영상 길이로 (진행률, 완료 여부) 를 계산.
+
+    Args:
+        last_watched_time (float): 마지막 시청 시간 (초 단위).
+        total_duration (float): 영상 길이 (초 단위).
+
+    Returns:
+        tuple[float, bool]: 0 ~ 100 사이의 진행률 (소수점 2자리) 과 완료 여부.
+    """
+    progress = (last_watched_time / total_duration) * 100 if total_duration and total_duration > 0 else 0
+    progress = round(min(max(progress, 0), MAX_PROGRESS), 2)
+    return progress, progress >= COMPLETION_THRESHOLD
+
+
+def calculate_progress_rate(completed_count, video_count):
+    """과목 진행률 계산: 완료된 강의 영상 수 / 전체 강의 영상 수 * 100 (소수점 2자리)"""
+    if not video_count:
+        return 0.0  # 강의 영상이 없으면 0%
+    return round((completed_count / video_count) * 100, 2)
+
+
+def upsert_progress(rows):
+    """학습 진행 기록을 INSERT ... ON CONFLICT 한 번으로 저장.
+
+    이미 있는 기록은 last_watched_time, progress는 더 큰 값으로, is_completed는 한 번 완료되면 유지.
+    조회 후 저장하지 않고 한 번의 쿼리로 처리하므로 동시에 들어온 요청끼리 unique 제약에서 충돌하지 않음.
+    ORM save()를 거치지 않으므로 완료 여부가 새로 바뀐 학생의 강의 목록 캐시는 직접 삭제.
+
+    Args:
+        rows (Iterable[tuple]): (student_id, chapter_video_id, last_watched_time, progress, is_completed) 목록.
+
+    Returns:
+        list[dict]: 저장된 id, student_id, chapter_video_id, last_watched_time, progress, is_completed 목록.
+    """
+    from apps.courses.signals import clear_student_lecture_cache
+
+    # 같은 (학생, 영상) 이 여러 번 있으면 하나의 INSERT에서 같은 행을 두 번 수정할 수 없으므로 가장 큰 값만 남김
+    merged = {}
+    for student_id, chapter_video_id, last_watched_time, progress, is_completed in rows:
+        key = (student_id, chapter_video_id)
+        if key in merged:
+            _, _, old_time, old_progress, old_completed = merged[key]
+            last_watched_time = max(last_watched_time, old_time)
+            progress = max(progress, old_progress)
+            is_completed = is_completed or old_completed
+        merged[key] = (student_id, chapter_video_id, last_watched_time, progress, is_completed)
+    if not merged:
+        return []
+
+    table = connection.ops.quote_name(ProgressTracking._meta.db_table)
+    now = timezone.now()
+    placeholders = ", ".join(["(%s::bigint, %s::bigint, %s::double precision, %s::numeric, %s::boolean)"] * len(merged))
+    params = [value for row in merged.values() for value in row] + [now, now]
+    with connection.cursor() as cursor:
+        # data-modifying CTE의 previous는 INSERT 이전 스냅샷을 보므로 별도 조회 없이 완료 여부 변경을 알 수 있음
+        cursor.execute(
+            f"""
+            WITH incoming (student_id, chapter_video_id, last_watched_time, progress, is_completed) AS (
+                VALUES {placeholders}
+            ),
+            previous AS (
+                SELECT t.student_id, t.chapter_video_id, t.is_completed
+                FROM {table} t JOIN incoming i USING (student_id, chapter_video_id)
+            ),
+            upserted AS (
+                INSERT INTO {table}
+                    (student_id, chapter_video_id, last_watched_time, progress, is_completed, created_at, updated_at)
+                SELECT student_id, chapter_video_id, last_watched_time, progress, is_completed, %s, %s FROM incoming
+                ON CONFLICT (student_id, chapter_video_id) DO UPDATE SET
+                    last_watched_time = GREATEST({table}.last_watched_time, EXCLUDED.last_watched_time),
+                    progress = GREATEST({table}.progress, EXCLUDED.progress),
+                    is_completed = {table}.is_completed OR EXCLUDED.is_completed,
+                    updated_at = EXCLUDED.updated_at
+                RETURNING id, student_id, chapter_video_id, last_watched_time, progress, is_completed
+            )
+            SELECT u.id, u.student_id, u.chapter_video_id, u.last_watched_time, u.progress, u.is_completed,
+                   COALESCE(p.is_completed, FALSE)
+            FROM upserted u LEFT JOIN previous p USING (student_id, chapter_video_id)
+            """,
+            params,
+        )
+        results = cursor.fetchall()
+
+    saved = []
+    newly_completed = set()
+    for row_id, student_id, chapter_video_id, last_watched_time, progress, is_completed, was_completed in results:
+        saved.append(
+            {
+                "id": row_id,
+                "student_id": student_id,
+                "chapter_video_id": chapter_video_id,
+                "last_watched_time": last_watched_time,
+                "progress": progress,
+                "is_completed": is_completed,
+            }
+        )
+        if is_completed and not was_completed:
+            newly_completed.add((student_id, chapter_video_id))
+
+    if newly_completed:
+        refresh_lecture_progress(newly_completed)
+        for student_id in {student_id for student_id, _ in newly_completed}:
+            clear_student_lecture_cache(student_id)
+    return saved
+
+
+def refresh_video_count(lecture_ids):
+    """과목별 강의 영상 수(Lecture.video_count) 를 UPDATE 한 번으로 다시 계산.
+
+    Args:
+        lecture_ids (Iterable[int] | None): 갱신할 과목 ID 목록. None이면 전체 과목.
+    """
+    video_counts = (
+        ChapterVideo.objects.filter(lecture=OuterRef("pk"))
+        .order_by()
+        .values("lecture")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    lectures = Lecture.objects.all() if lecture_ids is None else Lecture.objects.filter(id__in=set(lecture_ids))
+    lectures.update(video_count=Coalesce(Subquery(video_counts, output_field=IntegerField()), Value(0)))
+
+
+def _completed_counts(student_ids, lecture_ids):
+    """(student_id, lecture_id) 별 완료한 강의 영상 수를 집계 쿼리 한 번으로 계산."""
+    progress = ProgressTracking.objects.filter(is_completed=True, student__isnull=False)
+    if student_ids is not None:
+        progress = progress.filter(student_id__in=student_ids)
+    if lecture_ids is not None:
+        progress = progress.filter(chapter_video__lecture_id__in=lecture_ids)
+    rows = (
+        progress.order_by().values("student_id", lecture_id=F("chapter_video__lecture_id")).annotate(count=Count("id"))
+    )
+    return {(row["student_id"], row["lecture_id"]): row["count"] for row in rows}
+
+
+def refresh_lecture_progress(student_video_pairs, create=True):
+    """완료 여부가 바뀐 (학생, 강의 영상) 이 속한 (학생, 과목) 의 완료 영상 수를 다시 계산해서 저장.
+
+    증감 대신 다시 집계한 값을 upsert하므로 같은 변경이 여러 번 반영되어도 결과가 같음.
+
+    Args:
+        student_video_pairs (Iterable[tuple[int, int]]): (student_id, chapter_video_id) 목록.
+        create (bool): 요약 행이 없으면 생성할지 여부. 삭제 시그널에서는 False로 기존 행만 갱신.
+    """
+    student_video_pairs = {(student_id, video_id) for student_id, video_id in student_video_pairs if student_id}
+    if not student_video_pairs:
+        return
+
+    video_lectures = dict(
+        ChapterVideo.objects.filter(id__in={video_id for _, video_id in student_video_pairs}).values_list(
+            "id", "lecture_id"
+        )
+    )
+    pairs = {
+        (student_id, video_lectures[video_id])
+        for student_id, video_id in student_video_pairs
+        if video_id in video_lectures
+    }
+    if not pairs:
+        return
+
+    counts = _completed_counts({student_id for student_id, _ in pairs}, {lecture_id for _, lecture_id in pairs})
+    if create:
+        LectureProgress.objects.bulk_create(
+            [
+                LectureProgress(
+                    student_id=student_id,
+                    lecture_id=lecture_id,
+                    completed_count=counts.get((student_id, lecture_id), 0),
+                )
+                for student_id, lecture_id in pairs
+            ],
+            update_conflicts=True,
+            unique_fields=["student", "lecture"],
+            update_fields=["completed_count", "updated_at"],
+        )
+    else:
+        for student_id, lecture_id in pairs:
+            LectureProgress.objects.filter(student_id=student_id, lecture_id=lecture_id).update(
+                completed_count=counts.get((student_id, lecture_id), 0), updated_at=timezone.now()
+            )
+
+
+@transaction.atomic
+def rebuild_lecture_progress(lecture_ids=None):
+    """강의 영상 수와 학생별 완료 영상 수를 ProgressTracking에서 전부 다시 계산.
+
+    Args:
+        lecture_ids (Iterable[int], optional): 다시 계산할 과목 ID 목록. 없으면 전체 과목.
+
+    Returns:
+        int: 저장한 LectureProgress 행 수.
+    """
+    lecture_ids = None if lecture_ids is None else set(lecture_ids)
+    refresh_video_count(lecture_ids)
+
+    counts = _completed_counts(None, lecture_ids)
+    summaries = (
+        LectureProgress.objects.all()
+        if lecture_ids is None
+        else LectureProgress.objects.filter(lecture_id__in=lecture_ids)
+    )
+    summaries.delete()
+    LectureProgress.objects.bulk_create(
+        [
+            LectureProgress(student_id=student_id, lecture_id=lecture_id, completed_count=count)
+            for (student_id, lecture_id), count in counts.items()
+        ],
+        batch_size=1000,
+    )
+    return len(counts)
@@ -0,0 +1,175 @@
+from django.conf import settings
+from django.db import IntegrityError
+
+from apps.common.utils import redis_client
+from apps.courses.models import ChapterVideo
+from apps.courses.progress import calculate_progress, upsert_progress
+from apps.users.models import Student
+
+PROGRESS_BUFFER_KEY = "progress_buffer:{student_id}:{chapter_video_id}"
+PROGRESS_BUFFER_DIRTY_KEY = "progress_buffer:dirty"  # flush 대기 중인 "student_id:chapter_video_id" 집합
+VIDEO_DURATION_KEY = "chapter_video_duration:{chapter_video_id}"
+
+# last_watched_time이 기존 값보다 클 때만 갱신하고 flush 대상으로 등록한 뒤 현재 버퍼 값을 반환
+_BUFFER_PROGRESS_SCRIPT = redis_client.register_script(
+    """
+    local current = tonumber(redis.call('HGET', KEYS[1], 'last_watched_time'))
+    if not current or tonumber(ARGV[1]) > current then
+        redis.call('HSET', KEYS[1], 'last_watched_time', ARGV[1], 'progress', ARGV[2], 'is_completed', ARGV[3])
+    end
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    redis.call('SADD', KEYS[2], ARGV[4])
+    return redis.call('HMGET', KEYS[1], 'last_watched_time', 'progress', 'is_completed')
+    """
+)
+
+
+def _to_state(last_watched_time, progress, is_completed):
+    return {
+        "last_watched_time": float(last_watched_time),
+        "progress": f"{float(progress):.2f}",  # ProgressTrackingSerializer의 DecimalField 출력 형식과 동일
+        "is_completed": is_completed in ("1", 1, True),
+    }
+
+
+def _buffer(student_id, chapter_video_id, last_watched_time, progress, is_completed):
+    return _BUFFER_PROGRESS_SCRIPT(
+        keys=[
+            PROGRESS_BUFFER_KEY.format(student_id=student_id, chapter_video_id=chapter_video_id),
+            PROGRESS_BUFFER_DIRTY_KEY,
+        ],
+        args=[
+            last_watched_time,
+            progress,
+            int(is_completed),
+            f"{student_id}:{chapter_video_id}",
+            settings.PROGRESS_BUFFER_TTL,
+        ],
+    )
+
+
+def get_video_duration(chapter_video_id):
+    """강의 영상 길이를 Redis에 캐시해서 반환 (heartbeat마다 ChapterVideo를 조회하지 않기 위함).
+
+    Raises:
+        ChapterVideo.DoesNotExist: 강의 영상이 없는 경우.
+
+    Returns:
+        float | None: 영상 길이 (초). 아직 계산되지 않았으면 None.
+    """
+    cache_key = VIDEO_DURATION_KEY.format(chapter_video_id=chapter_video_id)
+    cached = redis_client.get(cache_key)
+    if cached is None:
+        durations = ChapterVideo.objects.filter(id=chapter_video_id).values_list("duration_seconds", flat=True)
+        if not durations:
+            raise ChapterVideo.DoesNotExist
+        cached = "" if durations[0] is None else str(durations[0])
+        redis_client.setex(cache_key, settings.PROGRESS_VIDEO_DURATION_CACHE_TTL, cached)
+    return float(cached) if cached else None
+
+
+def clear_video_duration_cache(chapter_video_id):
+    """캐시된 강의 영상 길이 삭제 (영상이 바뀌거나 길이가 계산된 경우)"""
+    redis_client.delete(VIDEO_DURATION_KEY.format(chapter_video_id=chapter_video_id))
+
+
+def buffer_progress(student_id, chapter_video_id, last_watched_time, total_duration):
+    """heartbeat를 DB에 바로 쓰지 않고 Redis hash에 가장 큰 last_watched_time만 남겨둠.
+
+    Args:
+        student_id (int): 학생 ID.
+        chapter_video_id (int): 강의 영상 ID.
+        last_watched_time (float): 마지막 시청 시간 (초 단위).
+        total_duration (float): 영상 길이 (초 단위).
+
+    Returns:
+        dict: 버퍼에 남아있는 last_watched_time, progress, is_completed.
+    """
+    progress, is_completed = calculate_progress(last_watched_time, total_duration)
+    return _to_state(*_buffer(student_id, chapter_video_id, last_watched_time, progress, is_completed))
+
+
+def get_buffered_progress(student_id, chapter_video_id):
+    """아직 DB에 flush되지 않은 진행 상태를 반환. 없으면 None."""
+    values = redis_client.hmget(
+        PROGRESS_BUFFER_KEY.format(student_id=student_id, chapter_video_id=chapter_video_id),
+        "last_watched_time",
+        "progress",
+        "is_completed",
+    )
+    if values[0] is None:
+        return None
+    return _to_state(*values)
+
+
+def flush_progress_buffer(batch_size=1000):
+    """버퍼에 쌓인 진행 상태를 한 번의 INSERT ... ON CONFLICT 로 DB에 저장.
+
+    flush 대상 집합에서 꺼낸 hash는 MULTI/EXEC 안에서 읽고 바로 삭제하므로
+    그 사이에 들어온 heartbeat는 새 hash와 flush 대상으로 다시 등록되어 다음 배치에서 저장됨.
+    버퍼에 있는 동안 학생이나 강의 영상이 삭제되어 FK 제약에 걸리면 해당 행만 버리고 다시 저장하며,
+    그 밖의 이유로 DB 저장에 실패하면 꺼낸 값을 버퍼에 다시 넣음.
+
+    Args:
+        batch_size (int): 한 번에 저장할 최대 (학생, 강의 영상) 수.
+
+    Returns:
+        int: 저장한 행 수.
+    """
+    members = redis_client.spop(PROGRESS_BUFFER_DIRTY_KEY, batch_size)
+    if not members:
+        return 0
+
+    keys = []
+    for member in members:
+        student_id, chapter_video_id = member.split(":")
+        keys.append((int(student_id), int(chapter_video_id)))
+
+    pipeline = redis_client.pipeline(transaction=True)
+    for student_id, chapter_video_id in keys:
+        buffer_key = PROGRESS_BUFFER_KEY.format(student_id=student_id, chapter_video_id=chapter_video_id)
+        pipeline.hgetall(buffer_key)
+        pipeline.delete(buffer_key)
+    results = pipeline.execute()[::2]
+
+    rows = [
+        (
+            student_id,
+            chapter_video_id,
+            float(values["last_watched_time"]),
+            float(values["progress"]),
+            values["is_completed"] == "1",
+        )
+        for (student_id, chapter_video_id), values in zip(keys, results)
+        if values
+    ]
+    try:
+        try:
+            return len(upsert_progress(rows))
+        except IntegrityError:
+            # 한 행이라도 삭제된 학생/강의 영상을 가리키면 배치 전체가 실패하므로 그 행만 버리고 다시 저장
+            rows = _drop_orphaned_rows(rows)
+            return len(upsert_progress(rows))
+    except Exception:
+        # 저장하지 못한 값은 다시 버퍼에 넣어 다음 flush에서 재시도
+        for student_id, chapter_video_id, last_watched_time, progress, is_completed in rows:
+            _buffer(student_id, chapter_video_id, last_watched_time, progress, is_completed)
+        raise
+
+
+def _drop_orphaned_rows(rows):
+    """학생이나 강의 영상이 더 이상 없는 행을 제외한 목록을 반환 (제외한 행은 다시 저장할 수 없으므로 버림)."""
+    student_ids = set(Student.global_objects.filter(id__in={row[0] for row in rows}).values_list("id", flat=True))
+    video_ids = set(ChapterVideo.objects.filter(id__in={row[1] for row in rows}).values_list("id", flat=True))
+    valid_rows = []
+    for row in rows:
+        if row[0] in student_ids and row[1] in video_ids:
+            valid_rows.append(row)
+        else:
+            print(f"삭제된 학생 또는 강의 영상의 학습 진행 기록 제외: student={row[0]} chapter_video={row[1]}")
+    return valid_rows
+
+
+def get_progress_buffer_size():
+    """flush 대기 중인 (학생, 강의 영상) 수"""
+    return redis_client.scard(PROGRESS_BUFFER_DIRTY_KEY)
@@ -1,36 +1,23 @@
 import os
 import re
 
-import boto3
+from django.conf import settings
 from rest_framework import serializers
 
-from apps.common.utils import generate_download_signed_url
+from apps.common.utils import generate_download_signed_url, generate_ncp_signed_url
 from apps.courses.models import ChapterVideo, Lecture, LectureChapter, ProgressTracking
-from apps.users.models import Instructor, Student
-from config.settings import base
+from apps.users.models import Instructor
 
 
 class LectureListSerializer(serializers.ModelSerializer):
-    """과목 목록 조회 Serializer"""
+    """과목 목록 조회 Serializer (응답 스키마 문서화용, 목록은 LectureListView에서 values()로 직접 구성)"""
 
-    progress_rate = serializers.SerializerMethodField()  # 동적 필드
+    progress_rate = serializers.FloatField(read_only=True, help_text="학생의 과목 진행률 (%), 학생인 경우만 포함")
 
     class Meta:
         model = Lecture
         fields = ["id", "title", "thumbnail", "progress_rate"]
 
-    def get_progress_rate(self, obj):
-        """강의 진행률 계산: 완료된 강의 영상 수 / 전체 강의 영상 수 * 100"""
-        total_videos = ChapterVideo.objects.filter(lecture_chapter__lecture=obj).count()
-        completed_videos = ProgressTracking.objects.filter(
-            chapter_video__lecture_chapter__lecture=obj, is_completed=True
-        ).count()
-
-        if total_videos == 0:
-            return 0.0  # 강의 영상이 없으면 0%
-
-        return round((completed_videos / total_videos) * 100, 2)  # 퍼센트 변환 (소수점 2자리)
-
 
 class InstructorSerializer(serializers.ModelSerializer):
     """강사 정보 Serializer"""
@@ -75,22 +62,19 @@ class LectureChapterSerializer(serializers.ModelSerializer):
         return [{"id": v.id, "title": v.title} for v in obj.chaptervideo_set.all()]
 
     def get_material_info(self, obj):
-        """학습 자료(material_url) 존재 시 Signed URL 반환"""
+        """학습 자료(material_url) 존재 시 파일 정보 반환
+
+        download_url은 응답 직전에 뷰에서 attach_download_urls로 한 번에 서명해서 채움
+        """
         if not obj.material_url:
             return None  # 학습 자료가 없는 경우 None 반환
 
         file_name = os.path.basename(obj.material_url.name)  # 원본 파일명 추출
         original_file_name = self.extract_original_filename(file_name)  # UUID 제거
 
-        signed_url = generate_download_signed_url(
-            object_key=obj.material_url.name,
-            original_filename=original_file_name,  # 이게 다운로드 파일명으로 사용됨
-        )
-
         return {
-            "file_name": original_file_name,  # 사용자에게 보여줄 이름
+            "file_name": original_file_name,  # 사용자에게 보여줄 이름 (다운로드 파일명으로 사용됨)
             "object_key": obj.material_url.name,
-            "download_url": signed_url,  # 서명된 S3 다운로드 URL
         }
 
     @staticmethod
@@ -142,62 +126,24 @@ class ProgressTrackingSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ProgressTracking
-        fields = ["id", "student_id", "progress", "is_completed"]
-
-
-class ProgressTrackingCreateSerializer(serializers.ModelSerializer):
-    last_watched_time = serializers.FloatField()
-    progress = serializers.FloatField(read_only=True)  # progress 추가
-
-    class Meta:
-        model = ProgressTracking
-        fields = ["last_watched_time", "progress"]  # 불필요한 필드 제거
-
-    def validate_last_watched_time(self, value):
-        """last_watched_time이 음수값이 되는 것을 방지"""
-        if value < 0:
-            raise serializers.ValidationError("last_watched_time은 0보다 작을 수 없습니다.")
-        return value
-
-    def create(self, validated_data):
-        """student와 chapter_video를 자동 설정"""
-        request = self.context["request"]
-        student = Student.objects.get(user=request.user)  #  현재 로그인한 사용자의 student 가져오기
-        chapter_video_id = self.context["chapter_video_id"]
-        chapter_video = ChapterVideo.objects.get(id=chapter_video_id)
+        fields = ["id", "student_id", "progress", "is_completed", "last_watched_time"]
 
-        last_watched_time = validated_data["last_watched_time"]
-        total_duration = request.data.get("total_duration", 1)  #  프론트엔드에서 제공하는 total_duration 사용
 
-        #  진행률(progress) 계산 (음수 방지)
-        progress = max((last_watched_time / total_duration) * 100, 0) if total_duration > 0 else 0
-        is_completed = progress >= 98  #  98% 이상이면 완료 처리
+class ProgressTrackingUpdateSerializer(serializers.Serializer):
+    """학습 진행률 heartbeat 검증 Serializer (저장은 Redis 버퍼를 거쳐 flush 워커가 처리)"""
 
-        tracking = ProgressTracking.objects.create(
-            student=student,
-            chapter_video=chapter_video,
-            last_watched_time=last_watched_time,
-            progress=progress,
-            is_completed=is_completed,
-        )
-
-        return tracking  #  생성된 객체 반환 (progress 값 포함)
-
-
-class ProgressTrackingUpdateSerializer(serializers.ModelSerializer):
     last_watched_time = serializers.FloatField(help_text="사용자가 마지막으로 시청한 시간 (초 단위)")
-    total_duration = serializers.FloatField(write_only=True, help_text="영상 전체 길이 (초 단위, 프론트엔드 제공)")
-
-    class Meta:
-        model = ProgressTracking
-        fields = ["last_watched_time", "total_duration", "progress", "is_completed"]
-        read_only_fields = ["progress", "is_completed"]  # progress와 is_completed는 자동 계산
+    total_duration = serializers.FloatField(
+        write_only=True,
+        required=False,
+        help_text="영상 전체 길이 (초 단위). 서버에 영상 길이가 저장되지 않은 영상만 필요",
+    )
 
     def validate(self, data):
         """last_watched_time이 음수값이 되거나 영상 길이를 초과하지 않도록 검증"""
-        instance = self.instance
-        last_watched_time = data.get("last_watched_time", instance.last_watched_time)
-        total_duration = data.get("total_duration")
+        last_watched_time = data["last_watched_time"]
+        # 서버에 저장된 영상 길이를 우선 사용
+        total_duration = self.context.get("duration_seconds") or data.get("total_duration")
 
         if total_duration is None:
             raise serializers.ValidationError("total_duration 값이 필요합니다.")  # 필수 값 검증
@@ -208,23 +154,9 @@ class ProgressTrackingUpdateSerializer(serializers.ModelSerializer):
         if last_watched_time > total_duration:
             raise serializers.ValidationError("last_watched_time이 영상 길이를 초과할 수 없습니다.")
 
+        data["total_duration"] = total_duration
         return data
 
-    def update(self, instance, validated_data):
-        """진행률 계산 시 프론트에서 제공한 total_duration 사용"""
-        last_watched_time = validated_data.get("last_watched_time", instance.last_watched_time)
-        total_duration = validated_data.get("total_duration")
-
-        progress = (last_watched_time / total_duration) * 100 if total_duration > 0 else 0
-        is_completed = progress >= 98  # 98% 이상이면 완료 처리
-
-        instance.last_watched_time = last_watched_time
-        instance.progress = progress
-        instance.is_completed = is_completed
-        instance.save()
-
-        return instance
-
 
 class ChapterVideoSerializer(serializers.ModelSerializer):
     video_url = serializers.SerializerMethodField()
@@ -238,22 +170,38 @@ class ChapterVideoSerializer(serializers.ModelSerializer):
         if not obj.video_url:
             return None
 
-        s3_client = boto3.client(
-            "s3",
-            endpoint_url=base.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=base.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=base.AWS_SECRET_ACCESS_KEY,
-            region_name=base.AWS_S3_REGION_NAME,
-        )
-
-        bucket_name = base.AWS_STORAGE_BUCKET_NAME
-        object_key = obj.video_url.name
-
-        # Signed URL 생성 (30분 유효)
-        url = s3_client.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": bucket_name, "Key": object_key},
-            ExpiresIn=60 * 30,  # 30분 후 만료
-            HttpMethod="GET",
-        )
-        return url
+        # Signed URL 생성 (30분 유효, 캐시된 URL 재사용)
+        return generate_ncp_signed_url(obj.video_url.name, expiration=60 * 30)
+
+
+class ChapterVideoUploadStartSerializer(serializers.Serializer):
+    """강의 영상 Multipart Upload 시작 요청 Serializer"""
+
+    filename = serializers.CharField(max_length=200)
+    content_type = serializers.RegexField(r"^video/[\w.+-]+$", default="video/mp4")
+    file_size = serializers.IntegerField(min_value=1, required=False)
+
+
+class ChapterVideoUploadPartsSerializer(serializers.Serializer):
+    """파트 Signed URL 발급 요청 Serializer"""
+
+    upload_id = serializers.CharField()
+    part_numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=10000),
+        allow_empty=False,
+        max_length=settings.CHAPTER_VIDEO_UPLOAD_MAX_PART_URLS,
+    )
+
+
+class ChapterVideoUploadPartSerializer(serializers.Serializer):
+    """업로드 완료된 파트 정보 Serializer (PUT 응답의 ETag 헤더 값)"""
+
+    part_number = serializers.IntegerField(min_value=1, max_value=10000)
+    etag = serializers.CharField()
+
+
+class ChapterVideoUploadCompleteSerializer(serializers.Serializer):
+    """Multipart Upload 완료 요청 Serializer (parts를 생략하면 서버에서 업로드된 파트를 조회)"""
+
+    upload_id = serializers.CharField()
+    parts = ChapterVideoUploadPartSerializer(many=True, required=False)
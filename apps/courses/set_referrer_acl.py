@@ -16,6 +16,8 @@ sys.path.insert(0, PROJECT_ROOT)
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.base")
 django.setup()
 
+from apps.common.presigner import derive_signing_key
+
 # settings.base에서 직접 불러오기
 from config.settings import base
 
@@ -37,17 +39,8 @@ def get_amz_date_short():
 
 
 # AWS Signature v4 Key 생성
-def sign(key, msg):
-    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
-
-
 def get_signature_key():
-    date_stamp = get_amz_date_short()
-    k_date = sign(("AWS4" + AWS_SECRET_ACCESS_KEY).encode("utf-8"), date_stamp)
-    k_region = sign(k_date, AWS_S3_REGION_NAME)
-    k_service = sign(k_region, "s3")
-    k_signing = sign(k_service, "aws4_request")
-    return k_signing
+    return derive_signing_key(AWS_SECRET_ACCESS_KEY, get_amz_date_short(), AWS_S3_REGION_NAME)
 
 
 # XML 형태의 CORS 정책 생성
@@ -1,42 +1,113 @@
-from django.core.cache import cache
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from apps.common.utils import redis_client  # utils.py에서 redis_client 가져오기
+from apps.common import cache_keys
+from apps.common.storage_outbox import register_file_cleanup
 from apps.courses.models import ChapterVideo, Lecture, LectureChapter, ProgressTracking
+from apps.courses.progress import (
+    rebuild_lecture_progress,
+    refresh_lecture_progress,
+    refresh_video_count,
+)
+from apps.courses.progress_buffer import clear_video_duration_cache
 
+# 삭제 시(queryset, CASCADE 삭제 포함) 파일 삭제를 outbox에 기록
+register_file_cleanup(Lecture, "thumbnail")
+register_file_cleanup(LectureChapter, "material_url")
+register_file_cleanup(ChapterVideo, "video_url")
 
-def clear_lecture_chapter_cache(lecture_id):
-    """해당 강의(lecture_id)와 관련된 챕터 데이터의 Redis 캐시 삭제"""
-    cache_key = f"lecture_chapters:{lecture_id}"
-    redis_client.delete(cache_key)
 
+def clear_lecture_chapter_cache(lecture_id, lecture_chapter_id=None):
+    """해당 강의(lecture_id)와 관련된 챕터 데이터 캐시 무효화 (챕터를 지정하면 챕터별 과제 캐시도 무효화)"""
+    cache_keys.invalidate((cache_keys.LECTURE, lecture_id), (cache_keys.LECTURE_CHAPTER, lecture_chapter_id))
 
-# LectureChapter 추가/수정/삭제 시 캐시 삭제
+
+# LectureChapter 추가/수정/삭제 시 캐시 무효화
 @receiver(post_save, sender=LectureChapter)
 @receiver(post_delete, sender=LectureChapter)
 def handle_lecture_chapter_change(sender, instance, **kwargs):
-    clear_lecture_chapter_cache(instance.lecture_id)
+    clear_lecture_chapter_cache(instance.lecture_id, instance.id)
+
+
+@receiver(post_save, sender=LectureChapter)
+def handle_lecture_chapter_move(sender, instance, created=False, **kwargs):
+    """챕터가 다른 과목으로 옮겨진 경우 이전/새 과목의 영상 수와 완료 영상 수를 다시 계산하고 두 과목의 캐시 무효화"""
+    previous_lecture_id = getattr(instance, "_previous_lecture_id", None)
+    if created or previous_lecture_id is None or previous_lecture_id == instance.lecture_id:
+        return
+
+    rebuild_lecture_progress([previous_lecture_id, instance.lecture_id])
+    cache_keys.invalidate(
+        (cache_keys.LECTURE, previous_lecture_id),
+        (cache_keys.LECTURE, instance.lecture_id),
+        (cache_keys.LECTURE, cache_keys.ALL),
+        (cache_keys.CONTENT, cache_keys.ALL),
+    )
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_save, sender=LectureChapter)
+def clear_content_cache(sender, instance, created=False, **kwargs):
+    """과목/챕터가 수정되면 (다른 과정/과목으로 옮겨졌을 수 있으므로) 권한 확인용 객체 -> 과정 ID 캐시 무효화"""
+    if not created:
+        cache_keys.invalidate((cache_keys.CONTENT, cache_keys.ALL))
 
 
-# ChapterVideo 추가/수정/삭제 시 캐시 삭제 (LectureChapter와 연관됨)
+# ChapterVideo 추가/수정/삭제 시 캐시 무효화 (LectureChapter와 연관됨)
 @receiver(post_save, sender=ChapterVideo)
 @receiver(post_delete, sender=ChapterVideo)
 def handle_chapter_video_change(sender, instance, **kwargs):
-    clear_lecture_chapter_cache(instance.lecture_chapter.lecture_id)
+    clear_lecture_chapter_cache(instance.lecture_id, instance.lecture_chapter_id)
+    clear_video_duration_cache(instance.id)
+
+
+@receiver(post_save, sender=ChapterVideo)
+def handle_chapter_video_count_change(sender, instance, created=False, **kwargs):
+    """강의 영상이 추가되거나 다른 챕터로 옮겨진 경우 과목의 강의 영상 수 갱신
+
+    다른 과목의 챕터로 옮겨진 경우 학생별 완료 영상 수도 두 과목 모두 다시 계산.
+    """
+    previous_lecture_chapter_id = getattr(instance, "_previous_lecture_chapter_id", None)
+    if created or previous_lecture_chapter_id != instance.lecture_chapter_id:
+        lecture_ids = {instance.lecture_id}
+        previous_lecture_id = getattr(instance, "_previous_lecture_id", None)
+        if previous_lecture_id and previous_lecture_id != instance.lecture_id:
+            lecture_ids.add(previous_lecture_id)
+            rebuild_lecture_progress(lecture_ids)
+        else:
+            refresh_video_count(lecture_ids)
+
+        # 영상 수가 바뀌면 모든 학생의 과목 목록 진행률이 달라지므로 과목 목록 캐시 전체 무효화
+        # 다른 챕터로 옮겨진 경우 권한 확인용 객체 -> 과정 ID 캐시도 무효화
+        cache_keys.invalidate(
+            (cache_keys.LECTURE, cache_keys.ALL),
+            (cache_keys.CONTENT, None if created else cache_keys.ALL),
+            (cache_keys.LECTURE_CHAPTER, previous_lecture_chapter_id),
+            *((cache_keys.LECTURE, lecture_id) for lecture_id in lecture_ids),
+        )
 
 
-# Lecture 추가/수정/삭제 시 캐시 삭제 (Lecture 자체가 변경될 경우)
+@receiver(post_delete, sender=ChapterVideo)
+def handle_chapter_video_delete(sender, instance, **kwargs):
+    """강의 영상 삭제 시 과목의 강의 영상 수 갱신"""
+    refresh_video_count([instance.lecture_id])
+    cache_keys.invalidate((cache_keys.LECTURE, cache_keys.ALL))
+
+
+# Lecture 추가/수정/삭제 시 캐시 무효화 (Lecture 자체가 변경될 경우 과목 목록 캐시도 무효화)
 @receiver(post_save, sender=Lecture)
 @receiver(post_delete, sender=Lecture)
 def handle_lecture_change(sender, instance, **kwargs):
-    clear_lecture_chapter_cache(instance.id)
+    cache_keys.invalidate(
+        (cache_keys.LECTURE, instance.id),
+        (cache_keys.LECTURE, cache_keys.ALL),
+        (cache_keys.COURSE, instance.course_id),
+    )
 
 
 def clear_student_lecture_cache(student_id):
-    """학생의 강의 목록 캐시 삭제"""
-    cache_key = f"student_{student_id}_lectures"
-    cache.delete(cache_key)
+    """학생의 강의 목록 캐시 무효화"""
+    cache_keys.invalidate((cache_keys.STUDENT, student_id))
 
 
 @receiver(pre_save, sender=ProgressTracking)
@@ -51,14 +122,22 @@ def track_is_completed_change(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=ProgressTracking)
-def handle_progress_tracking_change(sender, instance, **kwargs):
-    """is_completed 값이 변경된 경우에만 Redis 캐시 삭제"""
-    if hasattr(instance, "_is_completed_was") and instance._is_completed_was != instance.is_completed:
-        clear_student_lecture_cache(instance.student.id)
+def handle_progress_tracking_change(sender, instance, created=False, **kwargs):
+    """is_completed 값이 변경된 경우에만 과목별 완료 영상 수를 다시 계산하고 Redis 캐시 삭제"""
+    completed_changed = hasattr(instance, "_is_completed_was") and instance._is_completed_was != instance.is_completed
+    if created and instance.is_completed:
+        completed_changed = True
+
+    if completed_changed and instance.student_id:
+        refresh_lecture_progress([(instance.student_id, instance.chapter_video_id)])
+        clear_student_lecture_cache(instance.student_id)
 
 
 @receiver(post_delete, sender=ProgressTracking)
 def handle_progress_tracking_delete(sender, instance, **kwargs):
-    """ProgressTracking 삭제 시 캐시 삭제"""
+    """ProgressTracking 삭제 시 과목별 완료 영상 수를 다시 계산하고 캐시 삭제"""
     if instance.student_id:
+        if instance.is_completed:
+            # 학생 삭제로 인한 CASCADE 삭제 중일 수 있으므로 요약 행은 새로 만들지 않음
+            refresh_lecture_progress([(instance.student_id, instance.chapter_video_id)], create=False)
         clear_student_lecture_cache(instance.student_id)
@@ -1,3 +1,413 @@
-from django.test import TestCase
+import importlib
+import struct
+import unittest
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.core.cache import cache
+from django.db import IntegrityError, OperationalError, connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.assignments.models import Assignment
+from apps.common import cache_keys
+from apps.common.utils import redis_client
+from apps.courses.models import (
+    ChapterVideo,
+    Course,
+    Lecture,
+    LectureChapter,
+    LectureProgress,
+    ProgressTracking,
+)
+from apps.courses.progress import upsert_progress
+from apps.courses.progress_buffer import (
+    PROGRESS_BUFFER_DIRTY_KEY,
+    PROGRESS_BUFFER_KEY,
+    buffer_progress,
+    flush_progress_buffer,
+    get_progress_buffer_size,
+)
+from apps.courses.video_upload import probe_video_duration
+from apps.registrations.models import Enrollment
+from apps.users.models import Instructor, Student, User
+
+
+class LectureListViewTest(TestCase):
+    """과목 목록 조회 API 테스트"""
+
+    def setUp(self):
+        instructor_user = User.objects.create_user(
+            "instructor@test.com", "password", name="강사", nickname="강사", phone_number="01000000000"
+        )
+        self.instructor = Instructor.objects.create(user=instructor_user)
+
+        self.user = User.objects.create_user(
+            "student@test.com", "password", name="학생", nickname="학생", phone_number="01011111111"
+        )
+        self.student = Student.objects.create(user=self.user)
+        self.course = Course.objects.create(title="과정", price=0)
+        Enrollment.objects.create(course=self.course, student=self.student, is_active=True)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def create_lecture(self, video_count=2, completed_count=0):
+        """강의 영상 video_count개 중 completed_count개를 학생이 완료한 과목 생성"""
+        with self.captureOnCommitCallbacks(execute=True):  # 커밋 후 실행되는 캐시 무효화까지 실행
+            return self._create_lecture(video_count, completed_count)
+
+    def _create_lecture(self, video_count, completed_count):
+        lecture = Lecture.objects.create(
+            course=self.course,
+            instructor=self.instructor,
+            title="과목",
+            introduction="소개",
+            learning_objective="목표",
+            progress_rate=0,
+        )
+        chapter = LectureChapter.objects.create(lecture=lecture, title="챕터")
+        for index in range(video_count):
+            video = ChapterVideo.objects.create(lecture_chapter=chapter, title=f"영상 {index}")
+            if index < completed_count:
+                ProgressTracking.objects.create(student=self.student, chapter_video=video, is_completed=True)
+        return lecture
+
+    def get_lectures(self, use_cache=False):
+        if not use_cache:
+            cache.clear()
+        return self.client.get("/api/v1/courses/lecture/")
+
+    def test_progress_rate_is_per_student(self):
+        lecture = self.create_lecture(video_count=4, completed_count=1)
+
+        # 다른 학생의 완료 기록은 진행률에 포함되지 않음
+        other_user = User.objects.create_user(
+            "other@test.com", "password", name="다른 학생", nickname="다른 학생", phone_number="01022222222"
+        )
+        other_student = Student.objects.create(user=other_user)
+        for video in ChapterVideo.objects.filter(lecture_chapter__lecture=lecture):
+            ProgressTracking.objects.create(student=other_student, chapter_video=video, is_completed=True)
+
+        response = self.get_lectures()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["progress_rate"], 25.0)
+
+    def test_query_count_does_not_grow_with_lectures(self):
+        self.create_lecture(completed_count=1)
+        self.get_lectures()  # 인증된 사용자 객체에 student/instructor 조회 결과가 캐시되도록 먼저 한 번 요청
+        with CaptureQueriesContext(connection) as single:
+            self.get_lectures()
+
+        for _ in range(5):
+            self.create_lecture(completed_count=1)
+        with self.assertNumQueries(len(single.captured_queries)):
+            response = self.get_lectures()
+
+        self.assertEqual(len(response.data), 6)
+
+    def test_completion_invalidates_cached_list(self):
+        lecture = self.create_lecture(video_count=2)
+        self.assertEqual(self.get_lectures(use_cache=True).data[0]["progress_rate"], 0.0)
+
+        video = ChapterVideo.objects.filter(lecture_chapter__lecture=lecture).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            ProgressTracking.objects.create(student=self.student, chapter_video=video, is_completed=True)
+
+        self.assertEqual(self.get_lectures(use_cache=True).data[0]["progress_rate"], 50.0)
+
+    def test_enrollment_invalidates_cached_list(self):
+        self.create_lecture()
+        self.assertEqual(len(self.get_lectures(use_cache=True).data), 1)
+
+        other_course = Course.objects.create(title="다른 과정", price=0)
+        with self.captureOnCommitCallbacks(execute=True):
+            Lecture.objects.create(
+                course=other_course,
+                instructor=self.instructor,
+                title="다른 과목",
+                introduction="소개",
+                learning_objective="목표",
+                progress_rate=0,
+            )
+        self.assertEqual(len(self.get_lectures(use_cache=True).data), 1)
+
+        # 수강 승인 시 과목 목록 캐시가 무효화되어 새 과정의 과목이 바로 보임
+        with self.captureOnCommitCallbacks(execute=True):
+            Enrollment.objects.create(course=other_course, student=self.student, is_active=True)
+
+        self.assertEqual(len(self.get_lectures(use_cache=True).data), 2)
+
+
+class LectureChapterMoveTest(TestCase):
+    """챕터를 다른 과목으로 옮길 때 캐시 무효화 및 과목별 집계 테스트"""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            "student@test.com", "password", name="학생", nickname="학생", phone_number="01011111111"
+        )
+        self.student = Student.objects.create(user=user)
+        course = Course.objects.create(title="과정", price=0)
+        self.old_lecture, self.new_lecture = (
+            Lecture.objects.create(
+                course=course, title=title, introduction="소개", learning_objective="목표", progress_rate=0
+            )
+            for title in ("이전 과목", "새 과목")
+        )
+        self.chapter = LectureChapter.objects.create(lecture=self.old_lecture, title="챕터")
+        self.video = ChapterVideo.objects.create(lecture_chapter=self.chapter, title="영상")
+        ProgressTracking.objects.create(student=self.student, chapter_video=self.video, is_completed=True)
+
+    def test_move_invalidates_both_lectures(self):
+        scopes = [
+            (cache_keys.LECTURE, self.old_lecture.id),
+            (cache_keys.LECTURE, self.new_lecture.id),
+            (cache_keys.CONTENT, cache_keys.ALL),
+        ]
+        before = cache_keys.get_generations(*scopes)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chapter.lecture = self.new_lecture
+            self.chapter.save()
+
+        after = cache_keys.get_generations(*scopes)
+        self.assertTrue(all(new > old for old, new in zip(before, after)), (before, after))
+
+    def test_move_recounts_videos_of_both_lectures(self):
+        self.chapter.lecture = self.new_lecture
+        self.chapter.save()
+
+        self.old_lecture.refresh_from_db()
+        self.new_lecture.refresh_from_db()
+        self.assertEqual((self.old_lecture.video_count, self.new_lecture.video_count), (0, 1))
+        self.assertEqual(
+            dict(LectureProgress.objects.filter(student=self.student).values_list("lecture_id", "completed_count")),
+            {self.new_lecture.id: 1},
+        )
+
+    def test_completed_video_moved_to_another_lecture(self):
+        ChapterVideo.objects.create(lecture_chapter=self.chapter, title="남은 영상")
+        new_chapter = LectureChapter.objects.create(lecture=self.new_lecture, title="새 챕터")
+
+        self.video.lecture_chapter = new_chapter
+        self.video.save()
+
+        # 완료한 영상이 옮겨간 과목의 완료 영상 수로 집계되고 이전 과목에서는 빠짐
+        self.old_lecture.refresh_from_db()
+        self.new_lecture.refresh_from_db()
+        self.assertEqual((self.old_lecture.video_count, self.new_lecture.video_count), (1, 1))
+        self.assertEqual(
+            dict(LectureProgress.objects.filter(student=self.student).values_list("lecture_id", "completed_count")),
+            {self.new_lecture.id: 1},
+        )
+
+
+class AncestorIdsTest(TestCase):
+    """강의 영상, 과제에 복사해 둔 상위 객체 ID(lecture_id, course_id) 일관성 테스트"""
+
+    def setUp(self):
+        self.courses = [Course.objects.create(title=f"과정 {index}", price=0) for index in range(2)]
+        self.lectures = [
+            Lecture.objects.create(
+                course=course, title="과목", introduction="소개", learning_objective="목표", progress_rate=0
+            )
+            for course in self.courses
+        ]
+        self.chapters = [LectureChapter.objects.create(lecture=lecture, title="챕터") for lecture in self.lectures]
+        self.video = ChapterVideo.objects.create(lecture_chapter=self.chapters[0], title="영상")
+        self.assignment = Assignment.objects.create(chapter_video=self.video, title="과제", content="내용")
+
+    def assertAncestors(self, chapter, lecture, course):
+        video = ChapterVideo.objects.get(pk=self.video.pk)
+        assignment = Assignment.objects.get(pk=self.assignment.pk)
+        self.assertEqual(
+            (video.lecture_chapter_id, video.lecture_id, video.course_id), (chapter.id, lecture.id, course.id)
+        )
+        self.assertEqual(
+            (assignment.lecture_chapter_id, assignment.lecture_id, assignment.course_id),
+            (chapter.id, lecture.id, course.id),
+        )
+
+    def test_ids_are_copied_on_create(self):
+        self.assertAncestors(self.chapters[0], self.lectures[0], self.courses[0])
+
+    def test_video_moved_to_another_chapter(self):
+        self.video.lecture_chapter = self.chapters[1]
+        self.video.save()
+
+        self.assertAncestors(self.chapters[1], self.lectures[1], self.courses[1])
+
+    def test_chapter_moved_to_another_lecture(self):
+        chapter = self.chapters[0]
+        chapter.lecture = self.lectures[1]
+        chapter.save()
+
+        self.assertAncestors(chapter, self.lectures[1], self.courses[1])
+
+    def test_lecture_moved_to_another_course(self):
+        lecture = self.lectures[0]
+        lecture.course = self.courses[1]
+        lecture.save()
+
+        self.assertAncestors(self.chapters[0], lecture, self.courses[1])
+
+    def test_migration_backfills_existing_videos(self):
+        # 컬럼 추가 전부터 있던 행처럼 잘못된 값을 넣은 뒤 0006 마이그레이션의 backfill 실행
+        ChapterVideo.objects.filter(pk=self.video.pk).update(lecture=self.lectures[1], course=self.courses[1])
+        migration = importlib.import_module("apps.courses.migrations.0006_chaptervideo_lecture_course")
+
+        migration.backfill_chapter_video_ancestors(apps, None)
+
+        video = ChapterVideo.objects.get(pk=self.video.pk)
+        self.assertEqual((video.lecture_id, video.course_id), (self.lectures[0].id, self.courses[0].id))
+
+
+class ProgressBufferTest(TestCase):
+    """학습 진행률 heartbeat 버퍼 flush 및 조회 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            "student@test.com", "password", name="학생", nickname="학생", phone_number="01011111111"
+        )
+        self.student = Student.objects.create(user=self.user)
+        course = Course.objects.create(title="과정", price=0)
+        lecture = Lecture.objects.create(
+            course=course, title="과목", introduction="소개", learning_objective="목표", progress_rate=0
+        )
+        chapter = LectureChapter.objects.create(lecture=lecture, title="챕터")
+        self.video = ChapterVideo.objects.create(lecture_chapter=chapter, title="영상")
+        self.deleted_video_id = self.video.id + 1000
+
+        self.clear_buffer()
+        self.addCleanup(self.clear_buffer)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def clear_buffer(self):
+        redis_client.delete(
+            PROGRESS_BUFFER_DIRTY_KEY,
+            *(
+                PROGRESS_BUFFER_KEY.format(student_id=self.student.id, chapter_video_id=chapter_video_id)
+                for chapter_video_id in (self.video.id, self.deleted_video_id)
+            ),
+        )
+
+    def test_flush_drops_rows_of_deleted_video(self):
+        buffer_progress(self.student.id, self.video.id, 30, 100)
+        buffer_progress(self.student.id, self.deleted_video_id, 30, 100)
+
+        batches = []
+
+        def upsert_progress(rows):
+            batches.append(sorted(row[1] for row in rows))
+            if len(batches) == 1:
+                raise IntegrityError("FOREIGN KEY constraint failed")
+            return [{} for _ in rows]
+
+        with mock.patch("apps.courses.progress_buffer.upsert_progress", side_effect=upsert_progress):
+            flushed = flush_progress_buffer()
+
+        # 삭제된 강의 영상의 행만 버리고 나머지는 다시 저장하며, 버퍼에 다시 넣지 않음
+        self.assertEqual(flushed, 1)
+        self.assertEqual(batches, [sorted([self.video.id, self.deleted_video_id]), [self.video.id]])
+        self.assertEqual(get_progress_buffer_size(), 0)
+
+    def test_flush_requeues_rows_on_database_error(self):
+        buffer_progress(self.student.id, self.video.id, 30, 100)
+
+        with mock.patch("apps.courses.progress_buffer.upsert_progress", side_effect=OperationalError):
+            with self.assertRaises(OperationalError):
+                flush_progress_buffer()
+
+        self.assertEqual(get_progress_buffer_size(), 1)
+
+    def test_state_merges_buffered_last_watched_time(self):
+        ProgressTracking.objects.create(
+            student=self.student, chapter_video=self.video, last_watched_time=10, progress=10
+        )
+        buffer_progress(self.student.id, self.video.id, 60, 100)
+
+        response = self.client.get(f"/api/v1/courses/chapter_video/{self.video.id}/state/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["last_watched_time"], 60)
+        self.assertEqual(response.data["progress"], "60.00")
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "INSERT ... ON CONFLICT 쿼리는 PostgreSQL 전용")
+class UpsertProgressTest(TestCase):
+    """upsert_progress (INSERT ... ON CONFLICT) 테스트"""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            "student@test.com", "password", name="학생", nickname="학생", phone_number="01011111111"
+        )
+        self.student = Student.objects.create(user=user)
+        course = Course.objects.create(title="과정", price=0)
+        self.lecture = Lecture.objects.create(
+            course=course, title="과목", introduction="소개", learning_objective="목표", progress_rate=0
+        )
+        chapter = LectureChapter.objects.create(lecture=self.lecture, title="챕터")
+        self.video = ChapterVideo.objects.create(lecture_chapter=chapter, title="영상")
+
+    def upsert(self, last_watched_time, progress, is_completed=False):
+        return upsert_progress([(self.student.id, self.video.id, last_watched_time, progress, is_completed)])[0]
+
+    def test_repeated_upsert_is_idempotent(self):
+        first = self.upsert(30, 30)
+        second = self.upsert(30, 30)
+
+        self.assertEqual(first["id"], second["id"])
+        self.assertEqual(ProgressTracking.objects.filter(student=self.student, chapter_video=self.video).count(), 1)
+        self.assertEqual((second["last_watched_time"], float(second["progress"])), (30, 30))
+
+    def test_progress_never_decreases(self):
+        self.upsert(60, 60)
+        saved = self.upsert(20, 20)
+
+        self.assertEqual((saved["last_watched_time"], float(saved["progress"])), (60, 60))
+        progress = ProgressTracking.objects.get(student=self.student, chapter_video=self.video)
+        self.assertEqual((progress.last_watched_time, float(progress.progress)), (60, 60))
+
+    def test_duplicate_rows_in_one_call_keep_largest_value(self):
+        saved = upsert_progress(
+            [
+                (self.student.id, self.video.id, 40, 40, False),
+                (self.student.id, self.video.id, 10, 10, False),
+            ]
+        )
+
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(saved[0]["last_watched_time"], 40)
+
+    def test_is_completed_is_sticky(self):
+        self.upsert(99, 99, is_completed=True)
+        saved = self.upsert(100, 100, is_completed=False)
+
+        self.assertTrue(saved["is_completed"])
+        self.assertTrue(ProgressTracking.objects.get(student=self.student, chapter_video=self.video).is_completed)
+        # 완료 여부가 처음 바뀐 시점에만 과목별 완료 영상 수를 다시 계산
+        self.assertEqual(LectureProgress.objects.get(student=self.student, lecture=self.lecture).completed_count, 1)
+
+
+class ProbeVideoDurationTest(SimpleTestCase):
+    """Object Storage 영상의 길이 계산 테스트"""
+
+    @mock.patch("apps.courses.video_upload.get_s3_client")
+    def test_truncated_moov_is_reported_as_failure(self, get_s3_client):
+        # mvhd 헤더는 108 byte라고 기록되어 있지만 본문이 10 byte만 남은 파일
+        data = struct.pack(">I4s", 26, b"moov") + struct.pack(">I4s", 108, b"mvhd") + bytes(10)
+        get_s3_client.return_value.get_object.side_effect = lambda Range, **kwargs: {
+            "Body": mock.Mock(read=mock.Mock(return_value=data[int(Range[6:].split("-")[0]) :]))
+        }
+
+        self.assertIsNone(probe_video_duration("classes/1/lectures/1/video.mp4"))
+
+    @mock.patch("apps.courses.video_upload.read_mp4_duration", side_effect=struct.error("unpack requires a buffer"))
+    @mock.patch("apps.courses.video_upload.get_s3_client")
+    def test_parser_error_does_not_escape(self, get_s3_client, read_mp4_duration):
+        # 파서가 처리하지 못한 손상된 파일도 예외 대신 None을 반환해서 워커가 다음 영상을 계속 처리
+        self.assertIsNone(probe_video_duration("classes/1/lectures/1/video.mp4"))
@@ -22,4 +22,19 @@ urlpatterns = [
         name="chapter-video-progress-update",
     ),
     path("chapter_video/<int:chapter_video_id>/", views.ChapterVideoDetailView.as_view()),
+    path(
+        "chapter_video/<int:chapter_video_id>/upload/",
+        views.ChapterVideoUploadView.as_view(),
+        name="chapter-video-upload",
+    ),
+    path(
+        "chapter_video/<int:chapter_video_id>/upload/parts/",
+        views.ChapterVideoUploadPartsView.as_view(),
+        name="chapter-video-upload-parts",
+    ),
+    path(
+        "chapter_video/<int:chapter_video_id>/upload/complete/",
+        views.ChapterVideoUploadCompleteView.as_view(),
+        name="chapter-video-upload-complete",
+    ),
 ]
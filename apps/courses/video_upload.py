@@ -0,0 +1,195 @@
+import math
+import os
+import struct
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+
+from apps.common.mp4 import read_mp4_duration
+from apps.common.presigner import get_presigner
+from apps.common.utils import class_lecture_file_path, get_s3_client, redis_client
+from apps.courses.progress_buffer import clear_video_duration_cache
+
+# S3 Multipart Upload 제약 (파트 번호 1 ~ 10000, 마지막 파트를 제외한 최소 파트 크기 5MiB)
+MAX_PARTS = 10000
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+UPLOAD_SESSION_KEY = "chapter_video_upload:{upload_id}"
+
+
+def get_part_size(file_size=None):
+    """파트 수가 MAX_PARTS를 넘지 않도록 파일 크기에 맞는 파트 크기를 계산."""
+    part_size = max(settings.CHAPTER_VIDEO_UPLOAD_PART_SIZE, MIN_PART_SIZE)
+    if file_size:
+        part_size = max(part_size, math.ceil(file_size / MAX_PARTS))
+    return part_size
+
+
+def start_video_upload(video, filename, content_type, user_id, file_size=None):
+    """class_lecture_file_path 경로에 Multipart Upload를 시작하고 업로드 세션을 Redis에 저장.
+
+    Args:
+        video (ChapterVideo): 영상을 연결할 강의 영상.
+        filename (str): 업로드할 원본 파일명.
+        content_type (str): 영상 파일의 Content-Type.
+        user_id (int): 업로드를 시작한 사용자 ID.
+        file_size (int, optional): 전체 파일 크기 (byte). 있으면 파트 크기와 파트 수를 계산해서 반환.
+
+    Returns:
+        dict: upload_id, object_key, part_size, part_count.
+    """
+    object_key = class_lecture_file_path(video, os.path.basename(filename))
+    response = get_s3_client().create_multipart_upload(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=object_key, ContentType=content_type
+    )
+    upload_id = response["UploadId"]
+
+    session_key = UPLOAD_SESSION_KEY.format(upload_id=upload_id)
+    pipeline = redis_client.pipeline()
+    pipeline.hset(session_key, mapping={"chapter_video_id": video.id, "object_key": object_key, "user_id": user_id})
+    pipeline.expire(session_key, settings.CHAPTER_VIDEO_UPLOAD_SESSION_TTL)
+    pipeline.execute()
+
+    part_size = get_part_size(file_size)
+    return {
+        "upload_id": upload_id,
+        "object_key": object_key,
+        "part_size": part_size,
+        "part_count": math.ceil(file_size / part_size) if file_size else None,
+    }
+
+
+def get_video_upload(video, upload_id):
+    """강의 영상에 속한 업로드 세션을 반환. 없거나 다른 영상의 업로드면 None."""
+    session = redis_client.hgetall(UPLOAD_SESSION_KEY.format(upload_id=upload_id))
+    if not session or session.get("chapter_video_id") != str(video.id):
+        return None
+    return {"upload_id": upload_id, **session}
+
+
+def presign_video_upload_parts(session, part_numbers):
+    """파트별 PUT Signed URL을 한 번에 생성. 영상 데이터는 클라이언트가 Object Storage로 직접 업로드.
+
+    Args:
+        session (dict): get_video_upload로 조회한 업로드 세션.
+        part_numbers (list[int]): 서명할 파트 번호 목록.
+
+    Returns:
+        list[dict]: part_number, url 목록.
+    """
+    signed_urls = get_presigner().presign_upload_parts(
+        session["object_key"],
+        session["upload_id"],
+        part_numbers,
+        expiration=settings.CHAPTER_VIDEO_UPLOAD_URL_EXPIRATION,
+    )
+    return [{"part_number": part_number, "url": url} for part_number, url in zip(part_numbers, signed_urls)]
+
+
+def list_video_upload_parts(session):
+    """Object Storage에 업로드가 끝난 파트 목록을 조회 (연결이 끊긴 업로드를 이어서 진행할 때 사용).
+
+    Returns:
+        list[dict]: part_number, etag, size 목록 (파트 번호 순).
+    """
+    paginator = get_s3_client().get_paginator("list_parts")
+    parts = []
+    for page in paginator.paginate(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=session["object_key"], UploadId=session["upload_id"]
+    ):
+        parts.extend(
+            {"part_number": part["PartNumber"], "etag": part["ETag"], "size": part["Size"]}
+            for part in page.get("Parts", [])
+        )
+    return parts
+
+
+def complete_video_upload(video, session, parts=None):
+    """Multipart Upload를 완료하고 업로드된 객체를 ChapterVideo.video_url에 연결.
+
+    기존 영상 파일은 ChapterVideo.save()에서 삭제 outbox에 기록됨.
+
+    Args:
+        video (ChapterVideo): 영상을 연결할 강의 영상.
+        session (dict): get_video_upload로 조회한 업로드 세션.
+        parts (list[dict], optional): 클라이언트가 받은 part_number, etag 목록. 없으면 Object Storage에서 조회.
+
+    Returns:
+        ChapterVideo: video_url이 갱신된 강의 영상.
+    """
+    if not parts:
+        parts = list_video_upload_parts(session)
+
+    get_s3_client().complete_multipart_upload(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=session["object_key"],
+        UploadId=session["upload_id"],
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": part["part_number"], "ETag": part["etag"]}
+                for part in sorted(parts, key=lambda part: part["part_number"])
+            ]
+        },
+    )
+
+    video.video_url = session["object_key"]
+    video.save(update_fields=["video_url", "duration_seconds", "updated_at"])
+    redis_client.delete(UPLOAD_SESSION_KEY.format(upload_id=session["upload_id"]))
+    return video
+
+
+def abort_video_upload(session):
+    """Multipart Upload를 취소해서 업로드된 파트를 Object Storage에서 정리하고 세션을 삭제."""
+    get_s3_client().abort_multipart_upload(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=session["object_key"], UploadId=session["upload_id"]
+    )
+    redis_client.delete(UPLOAD_SESSION_KEY.format(upload_id=session["upload_id"]))
+
+
+def probe_video_duration(object_key):
+    """Object Storage에 있는 MP4/MOV 영상의 길이(초) 를 계산.
+
+    ranged GET으로 최상위 박스 헤더와 moov 박스만 읽으므로 영상 전체를 다운로드하지 않음.
+
+    Args:
+        object_key (str): 버킷 내 영상 경로.
+
+    Returns:
+        float | None: 영상 길이 (초). 읽을 수 없거나 MP4/MOV 형식이 아니면 None.
+    """
+    client = get_s3_client()
+
+    def read_range(start, end):
+        try:
+            response = client.get_object(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=object_key, Range=f"bytes={start}-{end}"
+            )
+        except ClientError as e:
+            # 파일 끝을 넘어서는 구간은 빈 값으로 처리
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b""
+            raise
+        return response["Body"].read()
+
+    try:
+        return read_mp4_duration(read_range)
+    except (BotoCoreError, ClientError, ValueError, struct.error, IndexError) as e:
+        # 잘리거나 손상된 파일도 실패로 처리 (probe_video_durations 워커가 종료되지 않도록)
+        print(f"영상 길이 계산 실패: {object_key} - {e}")
+        return None
+
+
+def update_video_duration(chapter_video_id):
+    """강의 영상의 길이를 계산해서 duration_seconds에 저장하고 계산한 값을 반환."""
+    from apps.courses.models import ChapterVideo
+
+    video_name = ChapterVideo.objects.filter(id=chapter_video_id).values_list("video_url", flat=True).first()
+    if not video_name:
+        return None
+
+    duration = probe_video_duration(video_name)
+    if duration:
+        # 계산하는 동안 영상이 다시 바뀌었으면 저장하지 않음
+        ChapterVideo.objects.filter(id=chapter_video_id, video_url=video_name).update(duration_seconds=duration)
+        clear_video_duration_cache(chapter_video_id)
+    return duration
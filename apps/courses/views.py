@@ -1,31 +1,64 @@
-import json
-
+from botocore.exceptions import ClientError
 from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from drf_spectacular.utils import (
+    OpenApiParameter,
     OpenApiResponse,
     extend_schema,
 )
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.common.permissions import IsActiveStudentOrInstructor
+from apps.common import cache_keys
+from apps.common.cache_fill import get_or_fill
+from apps.common.permissions import IsActiveStudentOrInstructor, IsInstructor
 from apps.common.utils import (
-    generate_download_signed_url,
+    attach_download_urls,
+    copy_download_infos,
     generate_ncp_signed_url,
-    redis_client,
 )
-from apps.courses.models import ChapterVideo, Lecture, LectureChapter, ProgressTracking
+from apps.courses.models import (
+    ChapterVideo,
+    Lecture,
+    LectureChapter,
+    LectureProgress,
+    ProgressTracking,
+)
+from apps.courses.progress import (
+    calculate_progress,
+    calculate_progress_rate,
+    upsert_progress,
+)
+from apps.courses.progress_buffer import (
+    buffer_progress,
+    get_buffered_progress,
+    get_video_duration,
+)
 from apps.courses.serializers import (
     ChapterVideoSerializer,
+    ChapterVideoUploadCompleteSerializer,
+    ChapterVideoUploadPartsSerializer,
+    ChapterVideoUploadStartSerializer,
     LectureChapterSerializer,
     LectureDetailSerializer,
     LectureListSerializer,
-    ProgressTrackingCreateSerializer,
     ProgressTrackingSerializer,
     ProgressTrackingUpdateSerializer,
 )
+from apps.courses.video_upload import (
+    abort_video_upload,
+    complete_video_upload,
+    get_video_upload,
+    list_video_upload_parts,
+    presign_video_upload_parts,
+    start_video_upload,
+)
 from apps.users.models import Student
+from apps.users.roles import get_role
 
 
 class LectureListView(APIView):
@@ -45,41 +78,45 @@ class LectureListView(APIView):
     )
     def get(self, request):
         user = request.user
-        is_student = hasattr(user, "student")
-        is_instructor = hasattr(user, "instructor")
+        role = get_role(request)
 
-        # Redis 캐싱 키 설정
-        cache_key = f"user_{user.id}_lectures"
+        # 캐싱 키 설정 (과목 변경, 학생의 완료/수강 상태 변경 시 세대 번호가 바뀌어 이전 캐시는 사용되지 않음)
+        owner_scope = (cache_keys.STUDENT, role.student.id) if role.is_student else (cache_keys.USER, user.id)
+        cache_key = cache_keys.make_cache_key("lectures", owner_scope, (cache_keys.LECTURE, cache_keys.ALL))
         cached_data = cache.get(cache_key)
 
         if cached_data:
             return Response(cached_data, status=status.HTTP_200_OK)
 
-        if is_student:
+        if role.is_student:
             lectures = Lecture.objects.filter(
-                course__enrollment__student=user.student, course__enrollment__is_active=True
-            )
-        elif is_instructor:
-            lectures = Lecture.objects.filter(instructor=user.instructor)
+                course__enrollment__student=role.student, course__enrollment__is_active=True
+            ).distinct()
+        elif role.is_instructor:
+            lectures = Lecture.objects.filter(instructor=role.instructor)
         else:
             return Response({"error": "접근 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        response_data = []
-        for lecture in lectures:
-            serialized_lecture = LectureListSerializer(lecture, context={"request": request}).data
+        fields = ["id", "title", "thumbnail"]
+        if role.is_student:
+            # 전체 영상 수는 Lecture.video_count, 학생의 완료 영상 수는 LectureProgress에서 가져오므로 과목 수와 관계없이 쿼리 한 번
+            completed_count = LectureProgress.objects.filter(student=role.student, lecture=OuterRef("pk")).values(
+                "completed_count"
+            )[:1]
+            lectures = lectures.annotate(completed_count=Coalesce(Subquery(completed_count), Value(0)))
+            fields += ["video_count", "completed_count"]
 
+        response_data = []
+        for row in lectures.order_by("id").values(*fields):
+            lecture_data = {
+                "id": row["id"],
+                "title": row["title"],
+                "thumbnail": default_storage.url(row["thumbnail"]) if row["thumbnail"] else None,
+            }
             # 학생인 경우만 진행률 포함
-            if is_student:
-                total_videos = ChapterVideo.objects.filter(lecture_chapter__lecture=lecture).count()
-                completed_videos = ProgressTracking.objects.filter(
-                    chapter_video__lecture_chapter__lecture=lecture, student=user.student, is_completed=True
-                ).count()
-                progress_rate = (completed_videos / total_videos) * 100 if total_videos > 0 else 0
-                serialized_lecture["progress_rate"] = round(progress_rate, 2)
-            else:
-                serialized_lecture.pop("progress_rate", None)
-
-            response_data.append(serialized_lecture)
+            if role.is_student:
+                lecture_data["progress_rate"] = calculate_progress_rate(row["completed_count"], row["video_count"])
+            response_data.append(lecture_data)
 
         # 캐싱 (1시간)
         cache.set(cache_key, response_data, timeout=3600)
@@ -128,63 +165,23 @@ class LectureChapterListView(APIView):
     )
     def get(self, request, lecture_id):
         try:
-            cache_key = f"lecture_chapters:{lecture_id}"
-            cached_data = redis_client.get(cache_key)
-
-            if cached_data:
-                data = json.loads(cached_data)
-
-                # 캐싱된 데이터에서 download_url을 새로 생성
-                for chapter in data:
-                    material_info = chapter.get("material_info")
-                    if material_info:
-                        object_key = material_info["object_key"]
-                        original_file_name = material_info["file_name"]
 
-                        material_info["download_url"] = generate_download_signed_url(
-                            object_key, original_filename=original_file_name
-                        )
+            def build():
+                # 캐시가 없으면 동시에 들어온 요청 중 한 요청만 DB 조회 (Redis에는 download_url 없는 상태로 저장)
+                chapters = LectureChapter.objects.filter(lecture_id=lecture_id)
+                if not chapters.exists():
+                    return None
+                return LectureChapterSerializer(chapters, many=True, context={"request": request}).data
 
-                return Response(data, status=status.HTTP_200_OK)
-
-            # Redis에 데이터가 없으면 DB 조회
-            chapters = LectureChapter.objects.filter(lecture_id=lecture_id)
-            if not chapters.exists():
+            cached_data = get_or_fill(
+                "lecture_chapters", [(cache_keys.LECTURE, lecture_id)], build, timeout=18000, stale_timeout=86400
+            )
+            if cached_data is None:
                 return Response({"error": "해당 챕터를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-            serializer = LectureChapterSerializer(chapters, many=True, context={"request": request})
-            response_data = serializer.data
-
-            # 캐싱할 때 download_url을 제외
-            for chapter in response_data:
-                material_info = chapter.get("material_info")
-                if material_info:
-                    object_key = material_info.get("object_key")
-                    original_file_name = material_info.get("file_name")
-
-                    if object_key and original_file_name:
-                        material_info["download_url"] = generate_download_signed_url(
-                            object_key,
-                            original_filename=original_file_name,
-                        )
-
-                    # 캐시 저장용: download_url 제거
-                    material_info.pop("download_url", None)
-
-            # Redis에는 download_url 없는 상태로 저장
-            redis_client.setex(cache_key, 18000, json.dumps(response_data))
-
-            # 응답 직전: 다시 download_url 붙여주기
-            for chapter in response_data:
-                material_info = chapter.get("material_info")
-                if material_info:
-                    object_key = material_info["object_key"]
-                    original_file_name = material_info["file_name"]
-
-                    material_info["download_url"] = generate_download_signed_url(
-                        object_key,
-                        original_filename=original_file_name,
-                    )
+            # 응답 직전: 캐시된 객체를 복사한 뒤 모든 학습 자료의 download_url을 한 번에 서명해서 붙여주기
+            response_data = copy_download_infos(cached_data, "material_info")
+            attach_download_urls([chapter.get("material_info") for chapter in response_data])
 
             return Response(response_data, status=status.HTTP_200_OK)
 
@@ -205,6 +202,7 @@ class ChapterVideoProgressRetrieveView(APIView):
             "** 특정 강의 영상(chapter_video)에 대한 학생의 학습 진행률을 조회합니다. 학생만 해당 강의 영상의 학습 진행률을 조회할 수 있습니다.**\n\n"
             "- `progress`: 영상 학습 진행률 (%)\n"
             "- `is_completed`: 영상 학습 완료 여부 (98% 이상이면 True)\n"
+            "- `last_watched_time`: 마지막 시청 시간 (초 단위). 아직 DB에 저장되지 않은 heartbeat까지 반영\n"
             "- `student_id`: 진행률을 조회하는 학생의 ID"
         ),
         responses={
@@ -217,75 +215,141 @@ class ChapterVideoProgressRetrieveView(APIView):
     )
     def get(self, request, chapter_video_id):
         # 강사라면 pass
-        if hasattr(request.user, "instructor"):
+        role = get_role(request)
+        if role.is_instructor:
             return Response(status=status.HTTP_204_NO_CONTENT)
 
-        student = getattr(request.user, "student", None)
+        student = role.student
         if not student:
             return Response({"error": "학생 정보가 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        try:
-            progress_tracking = ProgressTracking.objects.get(student=student, chapter_video_id=chapter_video_id)
-            return Response(ProgressTrackingSerializer(progress_tracking).data, status=status.HTTP_200_OK)
-        except ProgressTracking.DoesNotExist:
+        # 아직 DB에 저장되지 않은 heartbeat가 있으면 더 최신 값으로 합쳐서 반환
+        buffered = get_buffered_progress(student.id, chapter_video_id)
+        progress_tracking = ProgressTracking.objects.filter(student=student, chapter_video_id=chapter_video_id).first()
+
+        if not progress_tracking and not buffered:
             return Response(
                 {"error": "이 강의 영상에 대한 학습 기록이 없습니다. 학습을 시작하세요."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        data = (
+            ProgressTrackingSerializer(progress_tracking).data
+            if progress_tracking
+            else {
+                "id": None,
+                "student_id": student.id,
+                "progress": "0.00",
+                "is_completed": False,
+                "last_watched_time": 0.0,
+            }
+        )
+        if buffered:
+            data["progress"] = max(data["progress"], buffered["progress"], key=float)
+            data["is_completed"] = data["is_completed"] or buffered["is_completed"]
+            data["last_watched_time"] = max(data["last_watched_time"], buffered["last_watched_time"])
+        return Response(data, status=status.HTTP_200_OK)
+
 
 class ChapterVideoProgressCreateView(APIView):
-    """강의 영상 학습 진행률 생성 API (POST)"""
+    """강의 영상 학습 진행률 저장 API (PUT, POST)
+
+    진행 기록이 없으면 생성하고 있으면 갱신하는 upsert 한 번으로 처리하므로
+    POST 후 PATCH 순서를 지키지 않거나 여러 탭에서 동시에 요청해도 충돌하지 않음.
+    """
 
     permission_classes = [IsActiveStudentOrInstructor]
 
+    def save_progress(self, request, chapter_video_id, success_status):
+        """INSERT ... ON CONFLICT 한 번으로 진행 기록을 저장하고 응답을 반환."""
+        role = get_role(request)
+        if role.is_instructor:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        student = role.student
+        if not student:
+            return Response({"error": "학생 계정을 찾을 수 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            serializer = ProgressTrackingUpdateSerializer(
+                data=request.data, context={"duration_seconds": get_video_duration(chapter_video_id)}
+            )
+            serializer.is_valid(raise_exception=True)
+
+            last_watched_time = serializer.validated_data["last_watched_time"]
+            progress, is_completed = calculate_progress(last_watched_time, serializer.validated_data["total_duration"])
+            saved = upsert_progress([(student.id, chapter_video_id, last_watched_time, progress, is_completed)])[0]
+            return Response(
+                {
+                    "id": saved["id"],
+                    "student_id": saved["student_id"],
+                    "progress": f"{saved['progress']:.2f}",
+                    "is_completed": saved["is_completed"],
+                    "last_watched_time": saved["last_watched_time"],
+                },
+                status=success_status,
+            )
+        except ChapterVideo.DoesNotExist:
+            return Response({"error": "해당 강의 영상을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        except ValidationError:
+            raise
+        except Exception as e:
+            return Response(
+                {"error": "서버 내부 오류", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @extend_schema(
+        summary="강의 영상 학습 진행률 저장",
+        description=(
+            "** 강의 영상을 학습한 기록을 저장합니다. 기록이 없으면 생성하고 있으면 갱신합니다.**\n\n"
+            "- `last_watched_time` : 사용자가 마지막으로 시청한 시간 (초 단위)\n"
+            "- `total_duration` : 전체 영상 길이 (초 단위). 서버에 영상 길이가 저장된 영상은 생략 가능\n"
+            "- `progress`는 자동 계산되며 (최대 100), 기존 값보다 작아지지 않습니다.\n"
+            "- `is_completed`는 98% 이상이면 자동으로 `True` 처리되며, 한 번 완료되면 유지됩니다.\n"
+        ),
+        request={
+            "application/json": {
+                "example": {
+                    "last_watched_time": 120,  # 사용자가 마지막으로 본 위치 (초 단위)
+                }
+            }
+        },
+        responses={
+            200: OpenApiResponse(description="id, student_id, progress, is_completed, last_watched_time"),
+            400: OpenApiResponse(description="잘못된 요청 데이터"),
+            404: OpenApiResponse(description="해당 강의 영상을 찾을 수 없음"),
+            500: OpenApiResponse(description="서버 내부 오류"),
+        },
+        tags=["Course"],
+    )
+    def put(self, request, chapter_video_id):
+        return self.save_progress(request, chapter_video_id, status.HTTP_200_OK)
+
     @extend_schema(
         summary="강의 영상 학습 진행률 생성",
         description=(
             "** 강의 영상을 학습한 기록을 저장합니다. 학생만 강의 영상을 시청한 기록을 생성할 수 있습니다.**\n\n"
+            "- PUT 요청과 동일하게 처리되며, 이미 기록이 있어도 오류 없이 갱신합니다.\n"
             "- `last_watched_time` : 사용자가 마지막으로 시청한 시간 (초 단위)\n"
-            "- `total_duration` : 전체 영상 길이 (초 단위, 프론트엔드 제공)\n"
-            "- `progress`는 자동 계산되며, 999.99 이상이면 최대 99.99로 제한됩니다.\n"
-            "- `is_completed`는 98% 이상이면 자동으로 `True` 처리됩니다.\n"
+            "- `total_duration` : 전체 영상 길이 (초 단위). 서버에 영상 길이가 저장된 영상은 생략 가능\n"
         ),
         request={
             "application/json": {
                 "example": {
                     "last_watched_time": 120,  # 사용자가 마지막으로 본 위치 (초 단위)
-                    "total_duration": 600,  # 영상 전체 길이 (초 단위, 프론트에서 제공해야 함)
                 }
             }
         },
         responses={
-            201: ProgressTrackingSerializer,
+            201: OpenApiResponse(description="id, student_id, progress, is_completed, last_watched_time"),
             400: OpenApiResponse(description="잘못된 요청 데이터"),
+            404: OpenApiResponse(description="해당 강의 영상을 찾을 수 없음"),
             500: OpenApiResponse(description="서버 내부 오류"),
         },
         tags=["Course"],
     )
     def post(self, request, chapter_video_id):
-        if hasattr(request.user, "instructor"):
-            return Response(status=status.HTTP_204_NO_CONTENT)
-
-        student = getattr(request.user, "student", None)
-        if not student:
-            return Response({"error": "학생 계정을 찾을 수 없습니다."}, status=status.HTTP_403_FORBIDDEN)
-
-        try:
-            chapter_video = ChapterVideo.objects.get(id=chapter_video_id)
-
-            serializer = ProgressTrackingCreateSerializer(
-                data=request.data, context={"request": request, "chapter_video_id": chapter_video_id}
-            )
-            serializer.is_valid(raise_exception=True)
-            progress_tracking = serializer.save()
-            return Response(ProgressTrackingSerializer(progress_tracking).data, status=status.HTTP_201_CREATED)
-        except ChapterVideo.DoesNotExist:
-            return Response({"error": "해당 강의 영상을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response(
-                {"error": "서버 내부 오류", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.save_progress(request, chapter_video_id, status.HTTP_201_CREATED)
 
 
 class ChapterVideoProgressUpdateView(APIView):
@@ -298,47 +362,47 @@ class ChapterVideoProgressUpdateView(APIView):
         description=(
             "특정 강의 영상(chapter_video)의 학습 진행률을 수정합니다. 학생만 학습 진행률을 수정할 수 있습니다.\n\n"
             "** 주의:**\n"
-            "- `total_duration` 값은 **프론트엔드에서 제공 합니다.**\n"
-            "- `total_duration`은 백엔드에서 저장되지 않으며, `progress` 및 `is_completed` 계산을 위해 사용됩니다."
+            "- 영상 길이는 업로드 시 서버에서 계산해서 저장하므로 `total_duration`은 생략할 수 있습니다.\n"
+            "- 영상 길이가 아직 저장되지 않은 영상만 `total_duration` 값을 `progress` 및 `is_completed` 계산에 사용합니다.\n"
+            "- 진행률은 Redis에 모았다가 몇 초 간격으로 DB에 저장되며, 더 큰 `last_watched_time`만 반영됩니다."
         ),
         request={
             "application/json": {
                 "example": {
                     "last_watched_time": 120,  # 사용자가 마지막으로 시청한 시간 (초 단위)
-                    "total_duration": 600,  # 영상 전체 길이 (초 단위, 프론트엔드 제공)
                 }
             }
         },
         responses={
-            200: ProgressTrackingSerializer,
+            200: OpenApiResponse(description="student_id, last_watched_time, progress, is_completed"),
             400: OpenApiResponse(description="잘못된 요청 데이터"),
-            404: OpenApiResponse(description="진행 데이터를 찾을 수 없음"),
+            404: OpenApiResponse(description="해당 강의 영상을 찾을 수 없음"),
             500: OpenApiResponse(description="서버 내부 오류"),
         },
         tags=["Course"],
     )
     def patch(self, request, chapter_video_id):
-        if hasattr(request.user, "instructor"):
+        role = get_role(request)
+        if role.is_instructor:
             return Response(status=status.HTTP_204_NO_CONTENT)
 
-        student = getattr(request.user, "student", None)
+        student = role.student
         if not student:
             return Response({"error": "학생 정보가 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         try:
-            progress_tracking = ProgressTracking.objects.get(student=student, chapter_video_id=chapter_video_id)
-
             serializer = ProgressTrackingUpdateSerializer(
-                progress_tracking, data=request.data, context={"request": request}
+                data=request.data, context={"duration_seconds": get_video_duration(chapter_video_id)}
             )
             serializer.is_valid(raise_exception=True)
-            progress_tracking = serializer.save()
-            return Response(ProgressTrackingSerializer(progress_tracking).data, status=status.HTTP_200_OK)
-        except ProgressTracking.DoesNotExist:
-            return Response(
-                {"error": "진행 데이터를 찾을 수 없습니다. 먼저 POST 요청을 보내주세요."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+
+            # DB에 바로 쓰지 않고 Redis에 모아두었다가 flush_progress_buffer 워커가 한 번에 저장
+            state = buffer_progress(student.id, chapter_video_id, **serializer.validated_data)
+            return Response({"student_id": student.id, **state}, status=status.HTTP_200_OK)
+        except ChapterVideo.DoesNotExist:
+            return Response({"error": "해당 강의 영상을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        except ValidationError:
+            raise
         except Exception as e:
             return Response(
                 {"error": "서버 내부 오류", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -364,7 +428,6 @@ class ChapterVideoDetailView(APIView):
     )
     def get(self, request, chapter_video_id):
         try:
-            user = request.user
             video = ChapterVideo.objects.get(id=chapter_video_id)
 
             # Referrer 확인 (일부 요청에는 HTTP_REFERER가 없을 수 있음)
@@ -380,16 +443,13 @@ class ChapterVideoDetailView(APIView):
             if referrer and not any(referrer.startswith(allowed) for allowed in allowed_referrers):
                 return Response({"error": "잘못된 접근입니다."}, status=status.HTTP_403_FORBIDDEN)
 
-            # 사용자 ID 식별: student 또는 instructor
-            if hasattr(user, "student"):
-                user_id = user.student.id
-            elif hasattr(user, "instructor"):
-                user_id = user.instructor.id
-            else:
+            # 학생 또는 강사만 접근 가능
+            role = get_role(request)
+            if not role.is_student and not role.is_instructor:
                 return Response({"error": "학생 또는 강사만 접근할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-            # Signed URL 생성
-            signed_url = generate_ncp_signed_url(video.video_url.name, user_id)
+            # Signed URL 생성 (URL에 사용자 정보가 들어가지 않으므로 같은 영상은 캐시된 URL을 공유)
+            signed_url = generate_ncp_signed_url(video.video_url.name)
 
             response_data = {
                 "id": video.id,
@@ -404,3 +464,189 @@ class ChapterVideoDetailView(APIView):
             return Response(
                 {"error": "서버 내부 오류", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class ChapterVideoUploadBaseView(APIView):
+    """강의 영상 Multipart Upload API 공통 처리 (담당 강사만 접근 가능)"""
+
+    permission_classes = [IsInstructor]
+
+    def get_video(self, request, chapter_video_id):
+        """강의 영상을 조회하고 담당 강사인지 확인. 없으면 None."""
+        video = ChapterVideo.objects.select_related("lecture").filter(id=chapter_video_id).first()
+        if video:
+            self.check_object_permissions(request, video)
+        return video
+
+    def get_upload(self, request, chapter_video_id, upload_id):
+        """(강의 영상, 업로드 세션) 을 반환. 찾을 수 없으면 404 Response를 함께 반환."""
+        video = self.get_video(request, chapter_video_id)
+        if not video:
+            return (
+                None,
+                None,
+                Response({"error": "해당 강의 영상을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND),
+            )
+
+        session = get_video_upload(video, upload_id) if upload_id else None
+        if not session:
+            return video, None, Response({"error": "업로드 정보를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return video, session, None
+
+
+class ChapterVideoUploadView(ChapterVideoUploadBaseView):
+    """강의 영상 Multipart Upload 시작 (POST) / 업로드된 파트 조회 (GET) / 취소 (DELETE)"""
+
+    @extend_schema(
+        summary="강의 영상 업로드 시작",
+        description=(
+            "Object Storage에 Multipart Upload를 시작합니다. 영상 파일은 서버를 거치지 않고 "
+            "파트 URL 발급 API로 받은 Signed URL에 `part_size` 단위로 나누어 직접 PUT 요청으로 업로드합니다."
+        ),
+        request=ChapterVideoUploadStartSerializer,
+        responses={
+            201: OpenApiResponse(description="upload_id, object_key, part_size, part_count"),
+            403: OpenApiResponse(description="담당 강사가 아님"),
+            404: OpenApiResponse(description="해당 강의 영상을 찾을 수 없음"),
+            502: OpenApiResponse(description="Object Storage 요청 실패"),
+        },
+        tags=["Course"],
+    )
+    def post(self, request, chapter_video_id):
+        video = self.get_video(request, chapter_video_id)
+        if not video:
+            return Response({"error": "해당 강의 영상을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = ChapterVideoUploadStartSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload = start_video_upload(video, user_id=request.user.id, **serializer.validated_data)
+        except ClientError as e:
+            return Response(
+                {"error": "업로드를 시작할 수 없습니다.", "details": str(e)}, status=status.HTTP_502_BAD_GATEWAY
+            )
+        return Response(upload, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        summary="강의 영상 업로드된 파트 조회",
+        description="연결이 끊긴 업로드를 이어서 진행할 수 있도록 이미 업로드된 파트 목록을 반환합니다.",
+        parameters=[OpenApiParameter("upload_id", str, required=True)],
+        responses={
+            200: OpenApiResponse(description="upload_id, object_key, parts (part_number, etag, size)"),
+            404: OpenApiResponse(description="업로드 정보를 찾을 수 없음"),
+            502: OpenApiResponse(description="Object Storage 요청 실패"),
+        },
+        tags=["Course"],
+    )
+    def get(self, request, chapter_video_id):
+        video, session, error_response = self.get_upload(
+            request, chapter_video_id, request.query_params.get("upload_id")
+        )
+        if error_response:
+            return error_response
+
+        try:
+            parts = list_video_upload_parts(session)
+        except ClientError as e:
+            return Response(
+                {"error": "파트 목록을 조회할 수 없습니다.", "details": str(e)}, status=status.HTTP_502_BAD_GATEWAY
+            )
+        return Response(
+            {"upload_id": session["upload_id"], "object_key": session["object_key"], "parts": parts},
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        summary="강의 영상 업로드 취소",
+        description="Multipart Upload를 취소하고 업로드된 파트를 삭제합니다.",
+        parameters=[OpenApiParameter("upload_id", str, required=True)],
+        responses={
+            204: OpenApiResponse(description="취소 완료"),
+            404: OpenApiResponse(description="업로드 정보를 찾을 수 없음"),
+            502: OpenApiResponse(description="Object Storage 요청 실패"),
+        },
+        tags=["Course"],
+    )
+    def delete(self, request, chapter_video_id):
+        video, session, error_response = self.get_upload(
+            request, chapter_video_id, request.query_params.get("upload_id")
+        )
+        if error_response:
+            return error_response
+
+        try:
+            abort_video_upload(session)
+        except ClientError as e:
+            return Response(
+                {"error": "업로드를 취소할 수 없습니다.", "details": str(e)}, status=status.HTTP_502_BAD_GATEWAY
+            )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ChapterVideoUploadPartsView(ChapterVideoUploadBaseView):
+    """강의 영상 파트 Signed URL 일괄 발급 (POST)"""
+
+    @extend_schema(
+        summary="강의 영상 파트 업로드 URL 발급",
+        description=(
+            "요청한 파트 번호들의 PUT Signed URL을 한 번에 발급합니다. "
+            "각 파트 업로드 응답의 `ETag` 헤더 값을 완료 요청에 함께 보냅니다."
+        ),
+        request=ChapterVideoUploadPartsSerializer,
+        responses={
+            200: OpenApiResponse(description="upload_id, parts (part_number, url)"),
+            404: OpenApiResponse(description="업로드 정보를 찾을 수 없음"),
+        },
+        tags=["Course"],
+    )
+    def post(self, request, chapter_video_id):
+        serializer = ChapterVideoUploadPartsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        video, session, error_response = self.get_upload(
+            request, chapter_video_id, serializer.validated_data["upload_id"]
+        )
+        if error_response:
+            return error_response
+
+        part_numbers = sorted(set(serializer.validated_data["part_numbers"]))
+        return Response(
+            {"upload_id": session["upload_id"], "parts": presign_video_upload_parts(session, part_numbers)},
+            status=status.HTTP_200_OK,
+        )
+
+
+class ChapterVideoUploadCompleteView(ChapterVideoUploadBaseView):
+    """강의 영상 Multipart Upload 완료 (POST)"""
+
+    @extend_schema(
+        summary="강의 영상 업로드 완료",
+        description=(
+            "Multipart Upload를 완료하고 업로드된 영상을 강의 영상에 연결합니다. "
+            "`parts`를 생략하면 Object Storage에 업로드된 파트 목록으로 완료합니다. 기존 영상 파일은 삭제됩니다."
+        ),
+        request=ChapterVideoUploadCompleteSerializer,
+        responses={
+            200: ChapterVideoSerializer,
+            404: OpenApiResponse(description="업로드 정보를 찾을 수 없음"),
+            502: OpenApiResponse(description="Object Storage 요청 실패 (누락되거나 ETag가 다른 파트 포함)"),
+        },
+        tags=["Course"],
+    )
+    def post(self, request, chapter_video_id):
+        serializer = ChapterVideoUploadCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        video, session, error_response = self.get_upload(
+            request, chapter_video_id, serializer.validated_data["upload_id"]
+        )
+        if error_response:
+            return error_response
+
+        try:
+            video = complete_video_upload(video, session, serializer.validated_data.get("parts"))
+        except ClientError as e:
+            return Response(
+                {"error": "업로드를 완료할 수 없습니다.", "details": str(e)}, status=status.HTTP_502_BAD_GATEWAY
+            )
+        return Response(ChapterVideoSerializer(video).data, status=status.HTTP_200_OK)
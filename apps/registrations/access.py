@@ -0,0 +1,160 @@
+from django.conf import settings
+
+from apps.assignments.models import Assignment
+from apps.common import cache_keys
+from apps.common.utils import redis_client
+from apps.courses.models import ChapterVideo, Course, Lecture, LectureChapter
+
+from .models import Enrollment
+
+# 학생의 활성 과정 ID 집합 (Enrollment 변경 시 ENROLLMENT 세대 번호가 바뀌어 새 키로 다시 채움)
+ACTIVE_COURSES = "active_courses"
+# 객체("lecture:3", "chapter_video:5" 등) -> 과정 ID 해시 (객체가 다른 과정으로 옮겨지면 CONTENT 세대 번호가 바뀜)
+COURSE_OF = "course_of"
+# 활성 과정이 없는 학생도 캐시되도록 집합에 항상 넣어두는 값 (과정 ID는 1부터 시작)
+_EMPTY_MEMBER = "0"
+
+# 객체 종류별 과정 ID 조회 방법 (model, 과정 ID 필드), 강의 영상과 과제는 복사해 둔 과정 ID 사용
+COURSE_LOOKUPS = {
+    "lecture": (Lecture, "course_id"),
+    "lecture_chapter": (LectureChapter, "lecture__course_id"),
+    "chapter_video": (ChapterVideo, "course_id"),
+    "assignment": (Assignment, "course_id"),
+}
+OBJECT_KINDS = {
+    Course: "course",
+    Lecture: "lecture",
+    LectureChapter: "lecture_chapter",
+    ChapterVideo: "chapter_video",
+    Assignment: "assignment",
+}
+
+# 반환값: 1(접근 가능), 0(접근 불가), -1(학생의 활성 과정 집합이 캐시에 없음), -2(객체의 과정 ID가 캐시에 없음)
+_CAN_ACCESS_SCRIPT = redis_client.register_script(
+    """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return -1
+end
+local course_id = ARGV[2]
+if ARGV[1] ~= "" then
+    course_id = redis.call("HGET", KEYS[2], ARGV[1])
+    if not course_id then
+        return -2
+    end
+end
+return redis.call("SISMEMBER", KEYS[1], course_id)
+"""
+)
+
+
+def _active_courses_key(student_id):
+    return cache_keys.make_cache_key(ACTIVE_COURSES, (cache_keys.ENROLLMENT, student_id))
+
+
+def _course_of_key():
+    return cache_keys.make_cache_key(COURSE_OF, (cache_keys.CONTENT, cache_keys.ALL))
+
+
+def _load_active_course_ids(student_id, key):
+    """DB에서 학생의 활성 과정 ID를 조회해서 캐시에 저장.
+
+    키는 DB 조회 전에 만든 세대 번호가 들어간 키이므로 조회 도중 수강 정보가 바뀌면 이전 세대 키에 저장되어 읽히지 않음.
+    """
+    course_ids = set(
+        Enrollment.objects.filter(student_id=student_id, is_active=True).values_list("course_id", flat=True)
+    )
+    pipeline = redis_client.pipeline(transaction=True)
+    pipeline.delete(key)
+    pipeline.sadd(key, _EMPTY_MEMBER, *course_ids)
+    pipeline.expire(key, settings.ENROLLMENT_ACCESS_CACHE_TTL)
+    pipeline.execute()
+    return course_ids
+
+
+def _load_course_id(kind, object_id, key):
+    """DB에서 객체의 과정 ID를 조회해서 캐시에 저장 (없는 객체는 None을 반환하고 저장하지 않음)."""
+    model, field = COURSE_LOOKUPS[kind]
+    course_id = model.objects.filter(id=object_id).values_list(field, flat=True).first()
+    if course_id is None:
+        return None
+    pipeline = redis_client.pipeline(transaction=False)
+    pipeline.hset(key, f"{kind}:{object_id}", course_id)
+    pipeline.expire(key, settings.ENROLLMENT_ACCESS_CACHE_TTL)
+    pipeline.execute()
+    return course_id
+
+
+def get_active_course_ids(student_id):
+    """학생이 수강 중인(승인된) 과정 ID 집합을 반환.
+
+    Args:
+        student_id (int): 학생 ID.
+
+    Returns:
+        set[int]: 활성 과정 ID 집합.
+    """
+    key = _active_courses_key(student_id)
+    members = redis_client.smembers(key)
+    if not members:
+        return _load_active_course_ids(student_id, key)
+    return {int(member) for member in members if member != _EMPTY_MEMBER}
+
+
+def has_active_enrollment(student_id):
+    """학생이 수강 중인 과정이 하나라도 있는지 확인 (캐시된 경우 DB 조회 없음)."""
+    key = _active_courses_key(student_id)
+    size = redis_client.scard(key)
+    if not size:
+        return bool(_load_active_course_ids(student_id, key))
+    return size > 1  # _EMPTY_MEMBER 제외
+
+
+def can_access(student_id, kind, object_id):
+    """학생이 객체가 속한 과정을 수강 중인지 확인.
+
+    학생의 활성 과정 집합과 객체 -> 과정 ID 해시가 캐시되어 있으면 Lua 스크립트 한 번(Redis 왕복 한 번)으로
+    DB를 조회하지 않고 판단하며, 캐시에 없는 값만 DB에서 조회해서 채운 뒤 다시 확인.
+
+    Args:
+        student_id (int): 학생 ID.
+        kind (str): 객체 종류 ("course", "lecture", "lecture_chapter", "chapter_video", "assignment").
+        object_id (int): 객체 ID.
+
+    Returns:
+        bool: 수강 중인 과정의 객체이면 True. 객체가 없으면 False.
+    """
+    active_courses_key = _active_courses_key(student_id)
+    course_of_key = _course_of_key()
+    field = "" if kind == "course" else f"{kind}:{object_id}"
+
+    for _ in range(3):
+        result = _CAN_ACCESS_SCRIPT(keys=[active_courses_key, course_of_key], args=[field, object_id])
+        if result == -1:
+            _load_active_course_ids(student_id, active_courses_key)
+        elif result == -2:
+            if _load_course_id(kind, object_id, course_of_key) is None:
+                return False
+        else:
+            return result == 1
+
+    # 채운 캐시가 곧바로 만료/무효화된 경우 DB로 판단
+    course_id = object_id if kind == "course" else _load_course_id(kind, object_id, course_of_key)
+    return course_id is not None and course_id in get_active_course_ids(student_id)
+
+
+def can_access_object(student_id, obj):
+    """모델 인스턴스(Course, Lecture, LectureChapter, ChapterVideo, Assignment)에 대해 can_access를 호출."""
+    kind = OBJECT_KINDS.get(type(obj))
+    if kind is None:
+        return False
+    return can_access(student_id, kind, obj.pk)
+
+
+def clear_student_access(student_id):
+    """학생의 활성 과정 캐시를 무효화 (트랜잭션 커밋 후)."""
+    cache_keys.invalidate((cache_keys.ENROLLMENT, student_id))
+
+
+def clear_course_mapping():
+    """객체 -> 과정 ID 캐시 전체를 무효화 (객체가 다른 상위 객체로 옮겨진 경우, 트랜잭션 커밋 후)."""
+    cache_keys.invalidate((cache_keys.CONTENT, cache_keys.ALL))
@@ -0,0 +1,60 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.courses.models import ChapterVideo
+from apps.registrations.access import can_access, has_active_enrollment
+from apps.registrations.models import Enrollment
+
+
+class Command(BaseCommand):
+    help = "학생 권한 확인의 DB 조회 방식과 Redis 캐시 방식의 지연 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--student", type=int, help="측정할 학생 ID (없으면 활성 수강 신청이 있는 첫 학생)")
+        parser.add_argument("--iterations", type=int, default=1000, help="방식별 반복 횟수")
+
+    def measure(self, label, check, iterations):
+        check()  # 캐시를 채우기 위해 한 번 먼저 실행
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            check()
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(f"{label:<40} p50={statistics.median(timings) * 1e6:>8.1f}us p95={p95 * 1e6:>8.1f}us")
+
+    def handle(self, *args, **options):
+        enrollments = Enrollment.objects.filter(is_active=True)
+        if options["student"]:
+            enrollments = enrollments.filter(student_id=options["student"])
+        enrollment = enrollments.first()
+        if enrollment is None:
+            raise CommandError("활성 수강 신청이 있는 학생이 없습니다.")
+
+        student_id = enrollment.student_id
+        video = ChapterVideo.objects.filter(course_id=enrollment.course_id).first()
+        iterations = options["iterations"]
+
+        self.stdout.write(f"student={student_id} course={enrollment.course_id}, {iterations} iterations")
+        self.measure(
+            "DB: Enrollment.exists() (기존 방식)",
+            lambda: Enrollment.objects.filter(student_id=student_id, is_active=True).exists(),
+            iterations,
+        )
+        self.measure("Redis: has_active_enrollment", lambda: has_active_enrollment(student_id), iterations)
+        if video is not None:
+            self.measure(
+                "DB: 강의 영상의 과정 수강 여부",
+                lambda: Enrollment.objects.filter(
+                    student_id=student_id, is_active=True, course__lecture__lecturechapter__chaptervideo=video.id
+                ).exists(),
+                iterations,
+            )
+            self.measure(
+                "Redis: can_access(chapter_video)",
+                lambda: can_access(student_id, "chapter_video", video.id),
+                iterations,
+            )
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0005_lecture_progress"),
+        ("registrations", "0003_alter_enrollment_student"),
+        ("users", "0005_instructor_deleted_at_instructor_restored_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="enrollment",
+            index=models.Index(
+                fields=["student", "is_active", "created_at", "id"], name="enrollment_student_active_idx"
+            ),
+        ),
+    ]
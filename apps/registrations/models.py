@@ -17,3 +17,7 @@ class Enrollment(BaseModel):
 
     class Meta:
         db_table = "enrollment"
+        # 학생별 수강 중인 수업 목록 keyset 페이지네이션
+        indexes = [
+            models.Index(fields=["student", "is_active", "created_at", "id"], name="enrollment_student_active_idx"),
+        ]
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common import cache_keys
+
+from .models import Enrollment
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def clear_enrollment_cache(sender, instance, **kwargs):
+    """수강 신청이 생성/승인/취소/삭제되면 학생의 과목 목록, 권한 확인용 활성 과정, 과정 관련 캐시를 무효화.
+
+    Args:
+        sender (Model): Enrollment 모델.
+        instance (Enrollment): 변경된 Enrollment 인스턴스.
+        **kwargs: 추가 인자.
+    """
+    cache_keys.invalidate(
+        (cache_keys.STUDENT, instance.student_id),
+        (cache_keys.ENROLLMENT, instance.student_id),
+        (cache_keys.COURSE, instance.course_id),
+    )
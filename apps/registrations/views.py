@@ -3,6 +3,12 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common.pagination import (
+    KEYSET_PAGINATION_PARAMETERS,
+    KeysetPagination,
+    keyset_page_schema,
+)
+
 from .models import Enrollment
 from .serializers import EnrollmentDetailSerializer, EnrollmentSerializer
 
@@ -72,9 +78,10 @@ class EnrollmentInProgressView(APIView):
 
     @extend_schema(
         summary="수강 중인 수업 조회",
-        description="현재 수강 중인 수업을 조회합니다.",
+        description="현재 수강 중인 수업을 최근 신청순으로 조회합니다. 다음 페이지는 응답의 next로 요청합니다.",
+        parameters=KEYSET_PAGINATION_PARAMETERS,
         responses={
-            200: EnrollmentDetailSerializer(many=True),
+            200: keyset_page_schema("EnrollmentInProgressPage", EnrollmentDetailSerializer(many=True)),
             404: OpenApiExample("오류 예시", value={"detail": "수강 중인 클래스가 없습니다."}),
         },
         tags=["Enrollment"],
@@ -82,7 +89,7 @@ class EnrollmentInProgressView(APIView):
     def get(self, request):
         """현재 수강 중인 수업 목록을 조회.
 
-        로그인한 사용자의 학생 정보를 확인한 후, 활성화된 수강 신청 정보를 반환.
+        로그인한 사용자의 학생 정보를 확인한 후, 활성화된 수강 신청 정보를 한 페이지씩 반환.
 
         Args:
             request (Request): 요청 객체.
@@ -97,9 +104,12 @@ class EnrollmentInProgressView(APIView):
             return Response({"detail": "학생 정보가 없습니다."}, status=status.HTTP_403_FORBIDDEN)
         student = request.user.student
 
-        enrollments = Enrollment.objects.filter(is_active=True, student=student)
-        if not enrollments.exists():
+        paginator = KeysetPagination()
+        enrollments = paginator.paginate_queryset(
+            Enrollment.objects.filter(is_active=True, student=student).select_related("course"), request, self
+        )
+        if not enrollments and not request.query_params.get(paginator.cursor_query_param):
             return Response({"detail": "수강 중인 클래스가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
         serializer = EnrollmentDetailSerializer(enrollments, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serializer.data)
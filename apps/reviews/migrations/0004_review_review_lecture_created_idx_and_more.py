@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0005_lecture_progress"),
+        ("reviews", "0003_alter_review_student"),
+        ("users", "0005_instructor_deleted_at_instructor_restored_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(fields=["lecture", "created_at", "id"], name="review_lecture_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(fields=["student", "created_at", "id"], name="review_student_created_idx"),
+        ),
+    ]
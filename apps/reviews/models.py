@@ -19,3 +19,8 @@ class Review(BaseModel):
 
     class Meta:
         db_table = "review"
+        # 강의별/학생별 후기 목록 keyset 페이지네이션 ((created_at, id) 순 범위 스캔)
+        indexes = [
+            models.Index(fields=["lecture", "created_at", "id"], name="review_lecture_created_idx"),
+            models.Index(fields=["student", "created_at", "id"], name="review_student_created_idx"),
+        ]
@@ -3,10 +3,15 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.pagination import (
+    KEYSET_PAGINATION_PARAMETERS,
+    KeysetPagination,
+    keyset_page_schema,
+)
 from apps.courses.models import Lecture
 from apps.registrations.models import Enrollment
+from apps.users.authentications import RoleJWTAuthentication
 
 from .models import Review
 from .serializers import (
@@ -28,7 +33,7 @@ class ReviewView(APIView):
             return super().get_authenticators()
         if self.request.method == "GET":
             return []  # GET 요청은 인증하지 않음
-        return [JWTAuthentication()]
+        return [RoleJWTAuthentication()]
 
     def get_permissions(self):
         if self.request.method == "GET":
@@ -37,30 +42,34 @@ class ReviewView(APIView):
 
     @extend_schema(
         summary="수업 후기 조회",
-        description=("특정 강의에 대한 후기를 조회합니다."),
+        description=("특정 강의에 대한 후기를 최신순으로 조회합니다. 다음 페이지는 응답의 next로 요청합니다."),
+        parameters=KEYSET_PAGINATION_PARAMETERS,
         responses={
-            200: ReviewSerializer(many=True),
+            200: keyset_page_schema("ReviewPage", ReviewSerializer(many=True)),
             404: OpenApiExample("후기 없음", value={"error": "강의 후기를 찾을 수 없습니다"}),
         },
         tags=["Review"],
     )
     def get(self, request, lecture_id):
-        """특정 강의의 후기를 조회.
+        """특정 강의의 후기를 한 페이지씩 조회.
 
         Args:
             request (Request): 요청 객체.
             lecture_id (int): 후기를 조회할 강의의 식별자.
 
         Returns:
-            Response: 후기가 존재할 경우 직렬화된 데이터, 없으면 오류 메시지.
+            Response: 후기가 존재할 경우 직렬화된 페이지, 첫 페이지에 후기가 없으면 오류 메시지.
         """
-        reviews = Review.objects.filter(lecture_id=lecture_id)
-        if reviews.exists():
-            serializer = ReviewSerializer(reviews, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        else:
+        paginator = KeysetPagination()
+        reviews = paginator.paginate_queryset(
+            Review.objects.filter(lecture_id=lecture_id).select_related("lecture"), request, self
+        )
+        if not reviews and not request.query_params.get(paginator.cursor_query_param):
             return Response({"error": "강의 후기를 찾을 수 없습니다"}, status=status.HTTP_404_NOT_FOUND)
 
+        serializer = ReviewSerializer(reviews, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
     @extend_schema(
         summary="후기 등록",
         description="강의에 대한 후기를 등록합니다.",
@@ -122,18 +131,19 @@ class MyReviewListView(APIView):
 
     @extend_schema(
         summary="내가 작성한 후기 조회",
-        description="현재 로그인한 사용자가 작성한 후기를 조회합니다.",
-        responses={200: ReviewDetailSerializer(many=True)},
+        description="현재 로그인한 사용자가 작성한 후기를 최신순으로 조회합니다. 다음 페이지는 응답의 next로 요청합니다.",
+        parameters=KEYSET_PAGINATION_PARAMETERS,
+        responses={200: keyset_page_schema("MyReviewPage", ReviewDetailSerializer(many=True))},
         tags=["Review"],
     )
     def get(self, request):
-        """로그인한 학생이 작성한 후기를 조회.
+        """로그인한 학생이 작성한 후기를 한 페이지씩 조회.
 
         Args:
             request (Request): 요청 객체.
 
         Returns:
-            Response: 후기가 존재할 경우 직렬화된 데이터 없으면 오류 메시지.
+            Response: 후기가 존재할 경우 직렬화된 페이지, 첫 페이지에 후기가 없으면 오류 메시지.
         """
         if not request.user or not request.user.is_authenticated:
             return Response({"detail": "유효하지 않은 요청입니다."}, status=status.HTTP_400_BAD_REQUEST)
@@ -142,9 +152,12 @@ class MyReviewListView(APIView):
             return Response({"detail": "학생 정보가 없습니다."}, status=status.HTTP_403_FORBIDDEN)
         student = request.user.student
 
-        reviews = Review.objects.filter(student=student)
-        if reviews.exists():
-            serializer = ReviewDetailSerializer(reviews, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        else:
+        paginator = KeysetPagination()
+        reviews = paginator.paginate_queryset(
+            Review.objects.filter(student=student).select_related("lecture"), request, self
+        )
+        if not reviews and not request.query_params.get(paginator.cursor_query_param):
             return Response({"error": "작성한 후기가 없습니다"}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = ReviewDetailSerializer(reviews, many=True)
+        return paginator.get_paginated_response(serializer.data)
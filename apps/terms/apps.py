@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TermsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.terms"
+
+    def ready(self):
+        import apps.terms.signals  # 시그널을 등록
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common import cache_keys
+
+from .models import Terms
+
+
+@receiver([post_save, post_delete], sender=Terms)
+def clear_terms_cache(sender, instance, **kwargs):
+    """약관이 추가/수정/삭제되면 활성 약관 목록 캐시를 무효화.
+
+    Args:
+        sender (Model): Terms 모델.
+        instance (Terms): 변경된 Terms 인스턴스.
+        **kwargs: 추가 인자.
+    """
+    cache_keys.invalidate((cache_keys.TERMS, cache_keys.ALL))
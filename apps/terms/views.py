@@ -4,6 +4,9 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common import cache_keys
+from apps.common.utils import near_cache
+
 from .models import Terms
 from .serializers import TermsSerializer
 
@@ -20,6 +23,11 @@ class TermsView(APIView):
         summary="약관 조회", description="약관의 내용을 확인할 수 있습니다", request=TermsSerializer, tags=["Terms"]
     )
     def get(self, request):
-        terms = Terms.objects.filter(is_active=True)
-        serializer = TermsSerializer(terms, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 약관은 거의 바뀌지 않으므로 프로세스 내 캐시 -> Redis 순서로 조회하고 변경 시 시그널에서 무효화
+        cache_key = cache_keys.make_cache_key("terms", (cache_keys.TERMS, cache_keys.ALL))
+        terms_data = near_cache.get(cache_key)
+        if terms_data is None:
+            terms = Terms.objects.filter(is_active=True)
+            serializer = TermsSerializer(terms, many=True)
+            terms_data = near_cache.set(cache_key, serializer.data, 60 * 60 * 24)
+        return Response(terms_data, status=status.HTTP_200_OK)
@@ -4,28 +4,51 @@ from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidTok
 from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.utils import get_md5_hash_password
 
+from .roles import Role
+
+
+class RoleJWTAuthentication(JWTAuthentication):
+    """사용자를 학생/강사 정보와 함께 한 번의 쿼리로 조회하고 요청에 역할(request.role)을 붙이는 JWT 인증.
+
+    기본 JWTAuthentication은 사용자만 조회하므로 이후 hasattr(user, "student"), hasattr(user, "instructor")를
+    확인할 때마다 역방향 one-to-one 쿼리가 추가로 실행됨.
+    """
+
+    # 비활성 사용자의 인증을 거부할지 여부 (api_settings.CHECK_USER_IS_ACTIVE와 함께 확인)
+    check_user_is_active = True
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is not None:
+            request.role = Role.from_user(result[0])
+        return result
 
-class AllowInactiveUserJWTAuthentication(JWTAuthentication):
     def get_user(self, validated_token):
-        """
-        is_active가 false여도 JWT 인증이 통과될 수 있게 오버라이딩
-        """
         try:
             user_id = validated_token[api_settings.USER_ID_CLAIM]
         except KeyError:
             raise InvalidToken(_("Token contained no recognizable user identification"))
 
         try:
-            user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            user = self.user_model.objects.select_related("student", "instructor").get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
         except self.user_model.DoesNotExist:
             raise AuthenticationFailed(_("User not found"), code="user_not_found")
 
-        # is_active가 true인지 검사하는 부분 주석처리
-        # if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
-        #     raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if self.check_user_is_active and api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
 
         if api_settings.CHECK_REVOKE_TOKEN:
             if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
                 raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
 
         return user
+
+
+class AllowInactiveUserJWTAuthentication(RoleJWTAuthentication):
+    """
+    is_active가 false여도 JWT 인증이 통과될 수 있게 오버라이딩
+    """
+
+    check_user_is_active = False
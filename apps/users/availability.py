@@ -0,0 +1,64 @@
+from django.conf import settings
+
+from apps.common.bloom_filter import RedisBloomFilter
+
+from .models import User
+from .utils import find_identity_conflicts
+
+# 가입한 적 있는(소프트 삭제 포함) 유저의 닉네임, 휴대폰 번호 Bloom filter
+IDENTITY_FILTERS = {
+    field: RedisBloomFilter(
+        f"user_identity_filter:{field}",
+        num_bits=settings.USER_IDENTITY_FILTER_BITS,
+        num_hashes=settings.USER_IDENTITY_FILTER_HASHES,
+    )
+    for field in ("nickname", "phone_number")
+}
+
+
+def check_availability(**values):
+    """닉네임, 휴대폰 번호를 사용할 수 있는지 확인.
+
+    Bloom filter에 없는 값은 DB를 조회하지 않고 바로 사용 가능으로 판단하고,
+    필터에 있을 수 있는 값(사용 중이거나 오탐)만 find_identity_conflicts 쿼리 한 번으로 확인.
+    필터를 아직 만들지 않았으면(rebuild_identity_filters 커맨드) 모두 DB로 확인.
+
+    Args:
+        **values (str): 필드 이름("nickname", "phone_number")과 확인할 값.
+
+    Returns:
+        dict[str, bool]: 필드별 사용 가능 여부.
+    """
+    result = {}
+    unknown = {}
+    for field, value in values.items():
+        might_contain = IDENTITY_FILTERS[field].might_contain_many([value])
+        if might_contain is not None and not might_contain[0]:
+            result[field] = True
+        else:
+            unknown[field] = value
+
+    if unknown:
+        conflicts = find_identity_conflicts(**unknown)
+        result.update({field: field not in conflicts for field in unknown})
+    return result
+
+
+def add_user_identity(user):
+    """유저의 닉네임, 휴대폰 번호를 Bloom filter에 추가."""
+    for field, bloom_filter in IDENTITY_FILTERS.items():
+        value = getattr(user, field)
+        if value:
+            bloom_filter.add_many([value])
+
+
+def rebuild_identity_filters():
+    """모든 유저(소프트 삭제 포함)의 닉네임, 휴대폰 번호로 Bloom filter를 새로 만듦.
+
+    Returns:
+        dict[str, int]: 필드별로 필터에 넣은 값 수.
+    """
+    return {
+        field: bloom_filter.rebuild(User.global_objects.values_list(field, flat=True).iterator(chunk_size=2000))
+        for field, bloom_filter in IDENTITY_FILTERS.items()
+    }
@@ -0,0 +1,101 @@
+import random
+
+from django.conf import settings
+
+from apps.common.utils import redis_client
+
+from .utils import RedisKeys
+
+# issue_verification_code 결과
+ISSUED = "issued"  # 새 인증 코드를 저장함
+ALREADY_VERIFIED = "verified"  # 이미 인증이 완료된 이메일
+RATE_LIMITED = "limited"  # 재요청 제한 시간이 남아 있음
+CODE_EXISTS = "exists"  # 아직 만료되지 않은 인증 코드가 있음
+
+# verify_email_code 결과
+VERIFIED = "verified"  # 인증 성공 (인증 완료 표시를 저장하고 인증 코드를 삭제함)
+CODE_MISSING = "missing"  # 인증 코드가 없음 (만료되었거나 이미 인증에 사용됨)
+CODE_MISMATCH = "mismatch"  # 인증 코드가 다름
+
+# KEYS: 인증 완료 표시, 재요청 제한, 인증 코드 / ARGV: 새 인증 코드, 인증 코드 TTL, 재요청 제한 TTL
+# 반환값: {결과, 재요청까지 남은 시간(초)}
+_ISSUE_SCRIPT = redis_client.register_script(
+    """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return {"verified", 0}
+end
+local remaining = redis.call("TTL", KEYS[2])
+if remaining > 0 then
+    return {"limited", remaining}
+end
+if redis.call("EXISTS", KEYS[3]) == 1 then
+    return {"exists", 0}
+end
+redis.call("SET", KEYS[3], ARGV[1], "EX", ARGV[2])
+redis.call("SET", KEYS[2], "1", "EX", ARGV[3])
+return {"issued", 0}
+"""
+)
+
+# KEYS: 인증 코드, 인증 완료 표시 / ARGV: 입력한 인증 코드, 인증 완료 표시 TTL
+_VERIFY_SCRIPT = redis_client.register_script(
+    """
+local stored = redis.call("GET", KEYS[1])
+if not stored then
+    return "missing"
+end
+if stored ~= ARGV[1] then
+    return "mismatch"
+end
+redis.call("SET", KEYS[2], "true", "EX", ARGV[2])
+redis.call("DEL", KEYS[1])
+return "verified"
+"""
+)
+
+
+def issue_verification_code(email):
+    """인증 완료 여부, 재요청 제한, 기존 코드 확인과 새 코드 저장을 Lua 스크립트 한 번으로 처리.
+
+    여러 번의 GET/TTL/SET 사이에 다른 요청이 끼어들 수 없으므로
+    동시에 들어온 요청이 서로 다른 코드를 저장하거나 재요청 제한을 건너뛰지 않음.
+
+    Args:
+        email (str): 인증 코드를 받을 이메일.
+
+    Returns:
+        tuple[str, str | int | None]: (결과, 값). 결과가 ISSUED이면 새 인증 코드,
+            RATE_LIMITED이면 재요청까지 남은 시간(초), 나머지는 None.
+    """
+    verification_code = str(random.randint(100000, 999999))
+    result, remaining = _ISSUE_SCRIPT(
+        keys=[
+            RedisKeys.get_verified_email_key(email),
+            RedisKeys.get_email_request_limit_key(email),
+            RedisKeys.get_email_verification_key(email),
+        ],
+        args=[verification_code, settings.EMAIL_VERIFICATION_CODE_TTL, settings.EMAIL_REQUEST_LIMIT_TTL],
+    )
+    if result == ISSUED:
+        return result, verification_code
+    if result == RATE_LIMITED:
+        return result, remaining
+    return result, None
+
+
+def verify_email_code(email, code):
+    """인증 코드 비교, 인증 완료 표시 저장, 사용한 코드 삭제를 Lua 스크립트 한 번으로 처리.
+
+    같은 코드로 동시에 들어온 요청 중 한 요청만 VERIFIED를 받음.
+
+    Args:
+        email (str): 인증할 이메일.
+        code (str): 사용자가 입력한 인증 코드.
+
+    Returns:
+        str: VERIFIED, CODE_MISSING, CODE_MISMATCH 중 하나.
+    """
+    return _VERIFY_SCRIPT(
+        keys=[RedisKeys.get_email_verification_key(email), RedisKeys.get_verified_email_key(email)],
+        args=["" if code is None else str(code), settings.VERIFIED_EMAIL_TTL],
+    )
@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session = None
+_session_pid = None
+_lock = threading.Lock()
+_stats = {}
+
+
+def _create_session():
+    """keep-alive 연결 풀과 재시도 정책을 설정한 Session을 생성.
+
+    연결 실패는 요청이 카카오에 전달되지 않은 것이므로 POST도 재시도하지만,
+    응답 지연(read)과 5xx 응답은 인가 코드처럼 한 번만 쓸 수 있는 값을 두 번 보내지 않도록 GET만 재시도.
+    """
+    retry = Retry(
+        total=settings.KAKAO_HTTP_MAX_RETRIES,
+        connect=settings.KAKAO_HTTP_MAX_RETRIES,
+        read=settings.KAKAO_HTTP_MAX_RETRIES,
+        status=settings.KAKAO_HTTP_MAX_RETRIES,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        backoff_factor=settings.KAKAO_HTTP_BACKOFF_FACTOR,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=2,  # kauth.kakao.com, kapi.kakao.com
+        pool_maxsize=settings.KAKAO_HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """워커 프로세스마다 하나의 Session을 만들어 재사용 (fork 이후 부모의 연결을 공유하지 않도록 pid 확인)."""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session_pid != pid:
+        with _lock:
+            if _session_pid != pid:
+                _session = _create_session()
+                _session_pid = pid
+    return _session
+
+
+def _record(name, elapsed, failed):
+    with _lock:
+        stats = _stats.setdefault(name, {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+        stats["count"] += 1
+        stats["errors"] += int(failed)
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+
+def _request(name, method, url, **kwargs):
+    """카카오 API를 호출하고 지연 시간을 기록. 연결 실패, 시간 초과 시 None을 반환.
+
+    Args:
+        name (str): 지연 시간 통계에 사용할 API 이름.
+        method (str): HTTP 메서드.
+        url (str): 요청 URL.
+        **kwargs: requests에 전달할 인자 (data, headers 등).
+
+    Returns:
+        requests.Response | None: 응답. 요청에 실패하면 None.
+    """
+    timeout = (settings.KAKAO_HTTP_CONNECT_TIMEOUT, settings.KAKAO_HTTP_READ_TIMEOUT)
+    started = time.perf_counter()
+    try:
+        response = get_session().request(method, url, timeout=timeout, **kwargs)
+    except requests.RequestException as e:
+        _record(name, time.perf_counter() - started, failed=True)
+        print(f"Kakao {name} request failed: {e}")
+        return None
+    _record(name, time.perf_counter() - started, failed=response.status_code >= 500)
+    return response
+
+
+def request_token(code):
+    """인가 코드로 카카오 액세스/리프레시 토큰을 발급."""
+    data = {
+        "grant_type": "authorization_code",
+        "client_id": settings.KAKAO_CLIENT_ID,
+        "client_secret": settings.KAKAO_SECRET,
+        "redirect_uri": settings.KAKAO_REDIRECT_URI,
+        "code": code,
+    }
+    return _request("token", "POST", f"{settings.KAKAO_AUTH_URL}/oauth/token", data=data)
+
+
+def refresh_token(kakao_refresh_token):
+    """리프레시 토큰으로 카카오 액세스 토큰을 재발급."""
+    data = {
+        "grant_type": "refresh_token",
+        "client_id": settings.KAKAO_CLIENT_ID,
+        "client_secret": settings.KAKAO_SECRET,
+        "refresh_token": kakao_refresh_token,
+    }
+    return _request("refresh", "POST", f"{settings.KAKAO_AUTH_URL}/oauth/token", data=data)
+
+
+def get_user_info(access_token):
+    """액세스 토큰으로 카카오 사용자 정보를 조회."""
+    headers = {"Authorization": f"Bearer {access_token}"}
+    return _request("user_info", "GET", f"{settings.KAKAO_API_URL}/v2/user/me", headers=headers)
+
+
+def logout(access_token):
+    """카카오 로그아웃 (액세스/리프레시 토큰 만료)."""
+    headers = {"Authorization": f"Bearer {access_token}"}
+    return _request("logout", "POST", f"{settings.KAKAO_API_URL}/v1/user/logout", headers=headers)
+
+
+def unlink(access_token):
+    """카카오 계정 연결 끊기."""
+    headers = {"Authorization": f"Bearer {access_token}"}
+    return _request("unlink", "POST", f"{settings.KAKAO_API_URL}/v1/user/unlink", headers=headers)
+
+
+def get_kakao_stats():
+    """이 워커 프로세스에서 호출한 카카오 API별 호출 수, 실패 수, 평균/최대 지연 시간 (ms)."""
+    with _lock:
+        snapshot = {name: dict(stats) for name, stats in _stats.items()}
+    return {
+        name: {
+            "count": stats["count"],
+            "errors": stats["errors"],
+            "avg_ms": stats["total_seconds"] * 1000 / stats["count"],
+            "max_ms": stats["max_seconds"] * 1000,
+        }
+        for name, stats in snapshot.items()
+    }
+
+
+def reset_kakao_stats():
+    """지연 시간 통계를 초기화."""
+    with _lock:
+        _stats.clear()
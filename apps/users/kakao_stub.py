@@ -0,0 +1,70 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class KakaoStubHandler(BaseHTTPRequestHandler):
+    """카카오 OAuth/사용자 API를 흉내 내는 로컬 서버의 요청 핸들러 (오프라인 부하 테스트용).
+
+    모든 인가 코드와 토큰을 유효한 것으로 보고, 인가 코드마다 다른 카카오 ID를 반환.
+    """
+
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    disable_nagle_algorithm = True  # 헤더와 본문을 나눠 보낼 때 keep-alive 연결에서 생기는 지연 방지
+    latency = 0.0  # 응답마다 추가할 지연 시간 (초)
+
+    def _respond(self, payload):
+        if self.latency:
+            time.sleep(self.latency)
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length).decode() if length else ""
+
+    def do_POST(self):
+        body = self._read_body()
+        if self.path == "/oauth/token":
+            # 인가 코드(code=...)를 토큰에 넣어두고 사용자 정보 조회 시 카카오 ID로 사용
+            code = dict(pair.split("=", 1) for pair in body.split("&") if "=" in pair).get("code", "refresh")
+            self._respond(
+                {"access_token": f"stub-{code}", "refresh_token": f"stub-refresh-{code}", "expires_in": 21599}
+            )
+        elif self.path in ("/v1/user/logout", "/v1/user/unlink"):
+            self._respond({"id": 1})
+        else:
+            self.send_error(404)
+
+    def do_GET(self):
+        if self.path == "/v2/user/me":
+            token = self.headers.get("Authorization", "").removeprefix("Bearer stub-")
+            self._respond({"id": abs(hash(token)) % 10**10 + 1})
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(host="127.0.0.1", port=0, latency=0.0):
+    """카카오 stub 서버를 백그라운드 스레드에서 실행.
+
+    Args:
+        host (str): 바인딩할 주소.
+        port (int): 바인딩할 포트 (0이면 빈 포트).
+        latency (float): 응답마다 추가할 지연 시간 (초).
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (server_address로 주소 확인, shutdown()으로 종료).
+    """
+    handler = type("KakaoStubHandler", (KakaoStubHandler,), {"latency": latency})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,74 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.common.utils import redis_client
+from apps.users.email_verification import issue_verification_code, verify_email_code
+from apps.users.utils import RedisKeys
+
+BENCHMARK_EMAIL = "benchmark-{index}@example.invalid"
+
+
+def legacy_issue_and_verify(email):
+    """Lua 스크립트 적용 전 뷰와 같은 순서로 Redis 명령을 하나씩 보내는 방식 (발급 8번 + 확인 3번 왕복)."""
+    verified_key = RedisKeys.get_verified_email_key(email)
+    limit_key = RedisKeys.get_email_request_limit_key(email)
+    code_key = RedisKeys.get_email_verification_key(email)
+
+    if redis_client.get(verified_key) or redis_client.ttl(limit_key) > 0:
+        return
+    if redis_client.get(code_key) or not redis_client.ttl(code_key) <= 0:
+        return
+    redis_client.delete(code_key)
+    code = "123456"
+    if not redis_client.set(code_key, code, ex=settings.EMAIL_VERIFICATION_CODE_TTL, nx=True):
+        code = redis_client.get(code_key)
+    redis_client.setex(limit_key, settings.EMAIL_REQUEST_LIMIT_TTL, "1")
+
+    if redis_client.get(code_key) == code:
+        redis_client.setex(verified_key, settings.VERIFIED_EMAIL_TTL, "true")
+        redis_client.delete(code_key)
+
+
+def script_issue_and_verify(email):
+    """Lua 스크립트 방식 (발급 1번 + 확인 1번 왕복)."""
+    _, code = issue_verification_code(email)
+    verify_email_code(email, code)
+
+
+class Command(BaseCommand):
+    help = "이메일 인증 코드 발급/확인의 Redis 명령 방식과 Lua 스크립트 방식의 초당 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="방식별 인증 요청(발급 + 확인) 수")
+        parser.add_argument("--concurrency", type=int, default=8, help="동시에 요청을 보내는 스레드 수")
+
+    def cleanup(self, count):
+        keys = []
+        for index in range(count):
+            email = BENCHMARK_EMAIL.format(index=index)
+            keys += [
+                RedisKeys.get_verified_email_key(email),
+                RedisKeys.get_email_request_limit_key(email),
+                RedisKeys.get_email_verification_key(email),
+            ]
+        for start in range(0, len(keys), 1000):
+            redis_client.delete(*keys[start : start + 1000])
+
+    def measure(self, label, flow, count, concurrency):
+        self.cleanup(count)
+        emails = [BENCHMARK_EMAIL.format(index=index) for index in range(count)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(flow, emails))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{label:<32} {count / elapsed:>10.1f} req/s ({elapsed * 1000 / count:.3f}ms/req)")
+        self.cleanup(count)
+
+    def handle(self, *args, **options):
+        count, concurrency = options["requests"], options["concurrency"]
+        self.stdout.write(f"{count} requests, concurrency={concurrency}")
+        self.measure("Redis 명령 (11 round trips)", legacy_issue_and_verify, count, concurrency)
+        self.measure("Lua 스크립트 (2 round trips)", script_issue_and_verify, count, concurrency)
@@ -0,0 +1,63 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from apps.users import kakao
+from apps.users.kakao_stub import start_stub_server
+
+
+def unpooled_login(base_url):
+    """kakao 클라이언트 적용 전 방식 (요청마다 새 연결, 타임아웃 없음)."""
+    token_response = requests.post(f"{base_url}/oauth/token", data={"code": uuid.uuid4().hex})
+    access_token = token_response.json()["access_token"]
+    requests.get(f"{base_url}/v2/user/me", headers={"Authorization": f"Bearer {access_token}"})
+
+
+def pooled_login(base_url):
+    """kakao 클라이언트 방식 (워커 프로세스의 Session 연결 풀 재사용)."""
+    token_response = kakao.request_token(uuid.uuid4().hex)
+    kakao.get_user_info(token_response.json()["access_token"])
+
+
+class Command(BaseCommand):
+    help = "카카오 로그인의 외부 API 호출(토큰 발급 + 사용자 정보 조회)을 stub 서버에 보내 초당 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", help="카카오 stub 서버 주소 (없으면 빈 포트에 stub 서버를 띄움)")
+        parser.add_argument("--latency", type=float, default=0.0, help="stub 서버 응답 지연 시간 (초)")
+        parser.add_argument("--requests", type=int, default=500, help="방식별 로그인 수")
+        parser.add_argument("--concurrency", type=int, default=8, help="동시에 로그인하는 스레드 수")
+
+    def measure(self, label, login, base_url, count, concurrency):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lambda _: login(base_url), range(count)))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{label:<28} {count / elapsed:>10.1f} logins/s ({elapsed * 1000 / count:.2f}ms/login)")
+
+    def handle(self, *args, **options):
+        server = None
+        base_url = options["url"]
+        if base_url is None:
+            server = start_stub_server(latency=options["latency"])
+            base_url = "http://{}:{}".format(*server.server_address[:2])
+
+        count, concurrency = options["requests"], options["concurrency"]
+        self.stdout.write(f"{base_url}, {count} logins, concurrency={concurrency}")
+        try:
+            with override_settings(KAKAO_AUTH_URL=base_url, KAKAO_API_URL=base_url):
+                self.measure("requests.post/get (no pool)", unpooled_login, base_url, count, concurrency)
+                kakao.reset_kakao_stats()
+                self.measure("kakao client (pooled)", pooled_login, base_url, count, concurrency)
+            for name, stats in kakao.get_kakao_stats().items():
+                self.stdout.write(
+                    f"  {name:<10} count={stats['count']} errors={stats['errors']} "
+                    f"avg={stats['avg_ms']:.2f}ms max={stats['max_ms']:.2f}ms"
+                )
+        finally:
+            if server is not None:
+                server.shutdown()
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.users.kakao_stub import start_stub_server
+
+
+class Command(BaseCommand):
+    help = (
+        "카카오 OAuth/사용자 API를 흉내 내는 로컬 서버를 실행합니다 (KAKAO_AUTH_URL, KAKAO_API_URL을 이 주소로 설정)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1", help="바인딩할 주소")
+        parser.add_argument("--port", type=int, default=8765, help="바인딩할 포트")
+        parser.add_argument("--latency", type=float, default=0.0, help="응답마다 추가할 지연 시간 (초)")
+
+    def handle(self, *args, **options):
+        server = start_stub_server(options["host"], options["port"], options["latency"])
+        host, port = server.server_address[:2]
+        self.stdout.write(f"Kakao stub server: http://{host}:{port}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
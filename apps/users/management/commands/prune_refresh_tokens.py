@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from apps.users.tokens import DatabaseTokenStore, get_token_store
+
+
+class Command(BaseCommand):
+    help = (
+        "token_blacklist 테이블(OutstandingToken, BlacklistedToken)을 정리합니다. "
+        "--import 사용 시 만료되지 않은 토큰 상태를 REFRESH_TOKEN_STORE 저장소(Redis)로 먼저 옮깁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--import", action="store_true", dest="import_tokens", help="만료되지 않은 발급/폐기 토큰을 저장소로 복사"
+        )
+        parser.add_argument(
+            "--all", action="store_true", help="만료 여부와 관계없이 모든 행 삭제 (--import와 함께 사용)"
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 삭제할 최대 행 수")
+
+    def handle(self, *args, **options):
+        store = get_token_store()
+        if (options["import_tokens"] or options["all"]) and isinstance(store, DatabaseTokenStore):
+            raise CommandError("REFRESH_TOKEN_STORE가 DatabaseTokenStore이면 --import, --all을 사용할 수 없습니다.")
+        if options["all"] and not options["import_tokens"]:
+            raise CommandError("--all은 만료되지 않은 토큰 상태를 옮기는 --import와 함께 사용해야 합니다.")
+
+        now = timezone.now()
+        if options["import_tokens"]:
+            outstanding = revoked = 0
+            rows = (
+                OutstandingToken.objects.filter(expires_at__gt=now)
+                .values_list("jti", "user_id", "expires_at", "blacklistedtoken__id")
+                .iterator(chunk_size=options["batch_size"])
+            )
+            for jti, user_id, expires_at, blacklisted_id in rows:
+                exp = int(expires_at.timestamp())
+                if blacklisted_id is None:
+                    store.outstand(jti, user_id, exp)
+                    outstanding += 1
+                else:
+                    store.revoke(jti, exp)
+                    revoked += 1
+            self.stdout.write(f"imported outstanding={outstanding} revoked={revoked}")
+
+        queryset = (
+            OutstandingToken.objects.all() if options["all"] else OutstandingToken.objects.filter(expires_at__lte=now)
+        )
+        deleted = 0
+        while True:
+            # BlacklistedToken은 CASCADE로 함께 삭제
+            ids = list(queryset.order_by("id").values_list("id", flat=True)[: options["batch_size"]])
+            if not ids:
+                break
+            OutstandingToken.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+        self.stdout.write(self.style.SUCCESS(f"deleted outstanding tokens={deleted}"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.users.availability import rebuild_identity_filters
+
+
+class Command(BaseCommand):
+    help = "닉네임, 휴대폰 번호 사용 가능 여부 확인에 쓰는 Redis Bloom filter를 모든 유저로 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        for field, count in rebuild_identity_filters().items():
+            self.stdout.write(self.style.SUCCESS(f"{field}: {count}"))
@@ -0,0 +1,52 @@
+class Role:
+    """요청한 사용자의 역할 (학생/강사).
+
+    인증 시점에 한 번 확인한 학생/강사 정보를 요청 동안 재사용해서
+    뷰와 퍼미션에서 hasattr(user, "student") 같은 역방향 one-to-one 조회를 반복하지 않기 위함.
+
+    Attributes:
+        user (User | None): 역할을 확인한 사용자.
+        student (Student | None): 학생 정보 (학생이 아니면 None).
+        instructor (Instructor | None): 강사 정보 (강사가 아니면 None).
+    """
+
+    __slots__ = ("user", "student", "instructor")
+
+    def __init__(self, user=None, student=None, instructor=None):
+        self.user = user
+        self.student = student
+        self.instructor = instructor
+
+    @classmethod
+    def from_user(cls, user):
+        """사용자의 학생/강사 정보로 역할을 생성 (select_related로 함께 조회한 사용자면 쿼리 없음)."""
+        if user is None or not user.is_authenticated:
+            return cls(user)
+        return cls(user, getattr(user, "student", None), getattr(user, "instructor", None))
+
+    @property
+    def is_student(self):
+        return self.student is not None
+
+    @property
+    def is_instructor(self):
+        return self.instructor is not None
+
+
+def get_role(request):
+    """요청에 붙은 역할을 반환.
+
+    RoleJWTAuthentication이 인증하면서 붙인 request.role을 그대로 사용하고,
+    다른 방식으로 인증된 요청(예: 테스트의 force_authenticate)은 처음 호출될 때 한 번만 확인해서 요청에 붙임.
+
+    Args:
+        request (Request): 요청 객체.
+
+    Returns:
+        Role: 요청한 사용자의 역할.
+    """
+    role = getattr(request, "role", None)
+    if role is None or role.user is not request.user:
+        role = Role.from_user(request.user)
+        request.role = role
+    return role
@@ -59,7 +59,14 @@ class SignupSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("email", "password", "name", "nickname", "phone_number", "terms_agreements")
-        extra_kwargs = {"password": {"write_only": True}}
+        # 중복 여부는 SignUpView에서 find_identity_conflicts로 한 번에 확인하므로 필드별 UniqueValidator 조회를 생략
+        # (동시에 가입한 경우는 unique 제약 조건의 IntegrityError로 처리)
+        extra_kwargs = {
+            "password": {"write_only": True},
+            "email": {"validators": []},
+            "nickname": {"validators": []},
+            "phone_number": {"validators": []},
+        }
 
     def validate_email(self, email):
         return validate_user_email(email)
@@ -68,7 +75,7 @@ class SignupSerializer(serializers.ModelSerializer):
         return validate_user_password(password)
 
     def validate_phone_number(self, phone_number):
-        return validate_user_phone_number(phone_number)
+        return validate_user_phone_number(phone_number, check_duplicate=False)
 
     def validate_terms_agreements(self, value):
         return validate_signup_terms_agreements(value)
@@ -114,9 +121,11 @@ class SocialSignupSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "name", "nickname", "phone_number", "terms_agreements")
+        # 중복 여부는 SocialSignupCompleteView에서 find_identity_conflicts로 한 번에 확인
+        extra_kwargs = {"nickname": {"validators": []}, "phone_number": {"validators": []}}
 
     def validate_phone_number(self, phone_number):
-        return validate_user_phone_number(phone_number)
+        return validate_user_phone_number(phone_number, check_duplicate=False)
 
     def validate_terms_agreements(self, value):
         return validate_signup_terms_agreements(value)
@@ -1,9 +1,11 @@
-from django.db.models.signals import pre_delete
+import redis
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 
 from apps.courses.models import Lecture, ProgressTracking
 from apps.registrations.models import Enrollment
 from apps.reviews.models import Review
+from apps.users.availability import add_user_identity
 from apps.users.models import User
 
 
@@ -28,3 +30,22 @@ def delete_related_table(sender, instance, **kwargs):
 
         if lecture.exists():
             lecture.delete()
+
+
+IDENTITY_FIELDS = {"nickname", "phone_number"}
+
+
+@receiver(post_save, sender=User)
+def add_identity_to_filter(sender, instance, created=False, update_fields=None, **kwargs):
+    """가입/정보 수정 시 닉네임, 휴대폰 번호를 사용 가능 여부 확인용 Bloom filter에 추가.
+
+    로그인 시 last_login만 저장하는 경우 등 닉네임, 휴대폰 번호를 저장하지 않는 경우는 건너뜀.
+    Bloom filter는 DB 조회를 줄이기 위한 힌트이고 회원가입 시 DB로 다시 확인하므로
+    Redis 오류가 나도 유저 저장은 실패시키지 않음.
+    """
+    if not created and update_fields is not None and not IDENTITY_FIELDS & set(update_fields):
+        return
+    try:
+        add_user_identity(instance)
+    except redis.RedisError as e:
+        print(f"Identity filter update failed: {e}")
@@ -1,3 +1,269 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+import redis
+from django.contrib.auth.models import update_last_login
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.common.bloom_filter import RedisBloomFilter
+from apps.common.utils import redis_client
+from apps.courses.models import Course, Lecture
+from apps.registrations.models import Enrollment
+from apps.users import availability
+from apps.users.authentications import RoleJWTAuthentication
+from apps.users.models import Instructor, Student, User
+from apps.users.tokens import USER_TOKENS_KEY, RefreshToken, get_token_store
+from apps.users.utils import find_identity_conflicts
+
+
+class RoleJWTAuthenticationTest(TestCase):
+    """JWT 인증 시 사용자와 역할을 한 번의 쿼리로 조회하는지 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            "student@test.com", "password", name="학생", nickname="학생", phone_number="01011111111"
+        )
+        self.student = Student.objects.create(user=self.user)
+
+    def authorization(self, user):
+        return f"Bearer {AccessToken.for_user(user)}"
+
+    def test_authenticate_resolves_role_in_one_query(self):
+        request = Request(RequestFactory().get("/", HTTP_AUTHORIZATION=self.authorization(self.user)))
+
+        with self.assertNumQueries(1):
+            user, _ = RoleJWTAuthentication().authenticate(request)
+            # select_related로 함께 조회했으므로 역할 확인에 추가 쿼리가 없음
+            self.assertTrue(request.role.is_student)
+            self.assertFalse(request.role.is_instructor)
+            self.assertEqual(user.student, self.student)
+            self.assertFalse(hasattr(user, "instructor"))
+
+    def test_instructor_role(self):
+        instructor_user = User.objects.create_user(
+            "instructor@test.com", "password", name="강사", nickname="강사", phone_number="01000000000"
+        )
+        instructor = Instructor.objects.create(user=instructor_user)
+        request = Request(RequestFactory().get("/", HTTP_AUTHORIZATION=self.authorization(instructor_user)))
+
+        RoleJWTAuthentication().authenticate(request)
+
+        self.assertTrue(request.role.is_instructor)
+        self.assertEqual(request.role.instructor, instructor)
+        self.assertIsNone(request.role.student)
+
+    def test_authenticated_request_query_count(self):
+        course = Course.objects.create(title="과정", price=0)
+        Enrollment.objects.create(course=course, student=self.student, is_active=True)
+        Lecture.objects.create(
+            course=course, title="과목", introduction="소개", learning_objective="목표", progress_rate=0
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=self.authorization(self.user))
+        client.get("/api/v1/courses/lecture/")  # 권한 확인용 수강 정보와 과목 목록 캐시를 채움
+
+        # 인증(사용자 + 학생/강사 조회) 한 번 외에는 역할 확인, 권한 확인 모두 DB를 조회하지 않음
+        with self.assertNumQueries(1):
+            response = client.get("/api/v1/courses/lecture/")
+
+        self.assertEqual(response.status_code, 200)
+
+
+class RedisTokenStoreTest(TestCase):
+    """refresh token 발급/폐기 상태 저장소 테스트 (RedisTokenStore)"""
+
+    store_path = "apps.users.tokens.RedisTokenStore"
+
+    def setUp(self):
+        override = override_settings(REFRESH_TOKEN_STORE=self.store_path)
+        override.enable()
+        self.addCleanup(override.disable)
+        get_token_store.cache_clear()
+        self.addCleanup(get_token_store.cache_clear)
+
+        self.user = User.objects.create_user(
+            "student@test.com", "password", name="학생", nickname="학생", phone_number="01011111111"
+        )
+        Student.objects.create(user=self.user)
+        redis_client.delete(USER_TOKENS_KEY.format(user_id=self.user.id))
+        self.addCleanup(redis_client.delete, USER_TOKENS_KEY.format(user_id=self.user.id))
+
+        self.client = APIClient()
+
+    def is_outstanding(self, token):
+        """발급한 토큰이 사용자의 토큰 목록에 기록되어 있는지 확인"""
+        return redis_client.zscore(USER_TOKENS_KEY.format(user_id=self.user.id), token["jti"]) is not None
+
+    def is_revoked(self, token):
+        return get_token_store().is_revoked(token["jti"])
+
+    def test_for_user_writes_to_store(self):
+        token = RefreshToken.for_user(self.user)
+
+        self.assertTrue(self.is_outstanding(token))
+        self.assertFalse(self.is_revoked(token))
+
+    def test_blacklisted_token_fails_verification(self):
+        token = RefreshToken.for_user(self.user)
+        RefreshToken(str(token))  # 폐기 전에는 검증 통과
+
+        token.blacklist()
+
+        with self.assertRaises(TokenError):
+            RefreshToken(str(token))
+
+    def test_token_refresh_revokes_old_token(self):
+        old_token = RefreshToken.for_user(self.user)
+        self.client.cookies["refresh_token"] = str(old_token)
+
+        response = self.client.post("/api/v1/users/token-refresh/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.is_revoked(old_token))
+        new_token = RefreshToken(response.cookies["refresh_token"].value)
+        self.assertNotEqual(new_token["jti"], old_token["jti"])
+        self.assertTrue(self.is_outstanding(new_token))
+
+        # 폐기된 refresh token으로는 다시 발급받을 수 없음
+        self.client.cookies["refresh_token"] = str(old_token)
+        self.assertEqual(self.client.post("/api/v1/users/token-refresh/").status_code, 403)
+
+    def test_withdrawal_revokes_every_outstanding_token(self):
+        # 여러 기기에서 로그인해서 발급받은 refresh token
+        tokens = [RefreshToken.for_user(self.user) for _ in range(3)]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.client.cookies["refresh_token"] = str(tokens[0])
+
+        response = self.client.delete("/api/v1/users/withdrawal/")
+
+        self.assertEqual(response.status_code, 200)
+        for token in tokens:
+            self.assertTrue(self.is_revoked(token))
+            with self.assertRaises(TokenError):
+                RefreshToken(str(token))
+
+
+class DatabaseTokenStoreTest(RedisTokenStoreTest):
+    """refresh token 발급/폐기 상태 저장소 테스트 (DatabaseTokenStore)"""
+
+    store_path = "apps.users.tokens.DatabaseTokenStore"
+
+    def is_outstanding(self, token):
+        return OutstandingToken.objects.filter(jti=token["jti"], user=self.user).exists()
+
+
+class FindIdentityConflictsTest(TestCase):
+    """이메일, 닉네임, 휴대폰 번호 중복 확인 테스트"""
+
+    def setUp(self):
+        User.objects.create_user(
+            "live@test.com", "password", name="유저", nickname="사용중", phone_number="01011111111"
+        )
+        deleted_user = User.objects.create_user(
+            "deleted@test.com", "password", name="탈퇴", nickname="탈퇴유저", phone_number="01022222222"
+        )
+        deleted_user.delete()  # soft delete
+
+    def test_live_user_conflicts_on_every_field(self):
+        with self.assertNumQueries(1):
+            conflicts = find_identity_conflicts(email="live@test.com", nickname="사용중", phone_number="01011111111")
+
+        self.assertEqual(conflicts, {"email", "nickname", "phone_number"})
+
+    def test_soft_deleted_user_conflicts_on_nickname_and_phone_number_only(self):
+        # 탈퇴한 유저의 이메일로는 재가입할 수 있지만 닉네임, 휴대폰 번호는 계속 사용 중으로 봄
+        conflicts = find_identity_conflicts(email="deleted@test.com", nickname="탈퇴유저", phone_number="01022222222")
+
+        self.assertEqual(conflicts, {"nickname", "phone_number"})
+
+    def test_only_conflicting_fields_are_returned(self):
+        conflicts = find_identity_conflicts(email="new@test.com", nickname="사용중", phone_number="01099999999")
+
+        self.assertEqual(conflicts, {"nickname"})
+
+    def test_no_values_skips_query(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(find_identity_conflicts(), set())
+
+
+class IdentityAvailabilityViewTest(TestCase):
+    """닉네임, 휴대폰 번호 사용 가능 여부 확인 API 테스트"""
+
+    def setUp(self):
+        # 실제 필터를 건드리지 않도록 테스트용 키의 작은 Bloom filter로 교체
+        filters = {
+            field: RedisBloomFilter(f"test:user_identity_filter:{field}", num_bits=1024, num_hashes=3)
+            for field in availability.IDENTITY_FILTERS
+        }
+        for bloom_filter in filters.values():
+            redis_client.delete(bloom_filter.key, bloom_filter.ready_key)
+            self.addCleanup(redis_client.delete, bloom_filter.key, bloom_filter.ready_key)
+        patcher = mock.patch.dict(availability.IDENTITY_FILTERS, filters)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        User.objects.create_user(
+            "live@test.com", "password", name="유저", nickname="사용중", phone_number="01011111111"
+        )
+        self.client = APIClient()
+
+    def get_availability(self, **params):
+        return self.client.get("/api/v1/users/availability/", params)
+
+    def test_falls_back_to_database_before_filter_is_built(self):
+        # rebuild_identity_filters를 실행하기 전에는 필터에 없는 값도 DB로 확인
+        with self.assertNumQueries(1):
+            response = self.get_availability(nickname="사용중", phone_number="01099999999")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"nickname": False, "phone_number": True})
+
+    def test_filter_miss_skips_database(self):
+        availability.rebuild_identity_filters()
+
+        with self.assertNumQueries(0):
+            response = self.get_availability(nickname="새닉네임", phone_number="01099999999")
+
+        self.assertEqual(response.data, {"nickname": True, "phone_number": True})
+
+    def test_filter_hit_is_checked_in_database(self):
+        availability.rebuild_identity_filters()
+        # 필터에는 있지만 DB에는 없는 값 (오탐) 은 DB 확인 후 사용 가능으로 응답
+        availability.IDENTITY_FILTERS["nickname"].add_many(["오탐닉네임"])
+
+        with self.assertNumQueries(1):
+            response = self.get_availability(nickname="오탐닉네임", phone_number="01011111111")
+
+        self.assertEqual(response.data, {"nickname": True, "phone_number": False})
+
+    def test_new_user_is_added_to_filter(self):
+        availability.rebuild_identity_filters()
+        User.objects.create_user(
+            "new@test.com", "password", name="신규", nickname="신규유저", phone_number="01033333333"
+        )
+
+        self.assertEqual(self.get_availability(nickname="신규유저").data, {"nickname": False})
+
+    def test_filter_is_updated_only_when_identity_fields_are_saved(self):
+        user = User.objects.get(email="live@test.com")
+
+        with mock.patch("apps.users.signals.add_user_identity") as add_user_identity:
+            update_last_login(None, user)  # 로그인 시 last_login만 저장
+            self.assertFalse(add_user_identity.called)
+
+            user.nickname = "새닉네임"
+            user.save(update_fields=["nickname"])
+            add_user_identity.assert_called_once_with(user)
+
+    def test_redis_error_does_not_fail_user_save(self):
+        user = User.objects.get(email="live@test.com")
+
+        with mock.patch("apps.users.signals.add_user_identity", side_effect=redis.ConnectionError("down")):
+            user.nickname = "새닉네임"
+            user.save()
+
+        self.assertEqual(User.objects.get(pk=user.pk).nickname, "새닉네임")
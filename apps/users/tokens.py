@@ -0,0 +1,144 @@
+import functools
+import time
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from apps.common.utils import redis_client
+
+# 폐기된 refresh token (토큰 만료 시각까지 보관)
+REVOKED_TOKEN_KEY = "refresh_token:revoked:{jti}"
+# 사용자에게 발급한 refresh token의 jti -> 만료 시각 (회원 탈퇴 시 모두 폐기하기 위함)
+USER_TOKENS_KEY = "refresh_token:user:{user_id}"
+
+
+class RedisTokenStore:
+    """발급/폐기된 refresh token 상태를 Redis에 저장.
+
+    모든 키는 토큰 만료 시각에 함께 만료되므로 token_blacklist 테이블처럼 계속 쌓이지 않고,
+    폐기 여부 확인은 EXISTS 한 번으로 끝남.
+    """
+
+    def outstand(self, jti, user_id, exp, token=None):
+        """발급한 토큰을 사용자의 토큰 목록에 추가 (만료된 jti는 함께 정리)."""
+        if user_id is None:
+            return
+        key = USER_TOKENS_KEY.format(user_id=user_id)
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.zadd(key, {jti: exp})
+        pipeline.zremrangebyscore(key, "-inf", int(time.time()))
+        pipeline.expireat(key, exp)
+        pipeline.execute()
+
+    def revoke(self, jti, exp, user_id=None, token=None):
+        """토큰을 폐기 (토큰이 만료되면 폐기 기록도 함께 만료)."""
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.set(REVOKED_TOKEN_KEY.format(jti=jti), "1", ex=max(exp - int(time.time()), 1))
+        if user_id is not None:
+            pipeline.zrem(USER_TOKENS_KEY.format(user_id=user_id), jti)
+        pipeline.execute()
+
+    def is_revoked(self, jti):
+        return bool(redis_client.exists(REVOKED_TOKEN_KEY.format(jti=jti)))
+
+    def revoke_user(self, user_id):
+        """사용자에게 발급한 만료되지 않은 토큰을 모두 폐기."""
+        key = USER_TOKENS_KEY.format(user_id=user_id)
+        now = int(time.time())
+        pipeline = redis_client.pipeline(transaction=False)
+        for jti, exp in redis_client.zrangebyscore(key, now, "+inf", withscores=True):
+            pipeline.set(REVOKED_TOKEN_KEY.format(jti=jti), "1", ex=max(int(exp) - now, 1))
+        pipeline.delete(key)
+        pipeline.execute()
+
+
+class DatabaseTokenStore:
+    """simplejwt token_blacklist 앱의 OutstandingToken/BlacklistedToken 테이블을 사용 (기존 방식)."""
+
+    def outstand(self, jti, user_id, exp, token=None):
+        from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+        OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={"user_id": user_id, "token": token or "", "expires_at": datetime_from_epoch(exp)},
+        )
+
+    def revoke(self, jti, exp, user_id=None, token=None):
+        from rest_framework_simplejwt.token_blacklist.models import (
+            BlacklistedToken,
+            OutstandingToken,
+        )
+
+        outstanding, _ = OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={"user_id": user_id, "token": token or "", "expires_at": datetime_from_epoch(exp)},
+        )
+        BlacklistedToken.objects.get_or_create(token=outstanding)
+
+    def is_revoked(self, jti):
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def revoke_user(self, user_id):
+        from rest_framework_simplejwt.token_blacklist.models import (
+            BlacklistedToken,
+            OutstandingToken,
+        )
+
+        outstanding = OutstandingToken.objects.filter(user_id=user_id, blacklistedtoken__isnull=True)
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token) for token in outstanding])
+
+
+@functools.cache
+def get_token_store():
+    """REFRESH_TOKEN_STORE 설정의 토큰 저장소 (RedisTokenStore 또는 DatabaseTokenStore)."""
+    return import_string(settings.REFRESH_TOKEN_STORE)()
+
+
+class RefreshToken(tokens.RefreshToken):
+    """발급/폐기 상태를 REFRESH_TOKEN_STORE 저장소에 기록하는 refresh token.
+
+    simplejwt의 RefreshToken은 token_blacklist 앱이 설치되어 있으면 발급할 때마다 OutstandingToken 행을
+    INSERT하고 검증할 때마다 BlacklistedToken을 JOIN해서 조회하므로, 이 클래스에서 해당 동작을 저장소 호출로 바꿈.
+    token_blacklist 앱 설치 여부와 관계없이 동작.
+    """
+
+    def verify(self, *args, **kwargs):
+        self.check_blacklist()
+        tokens.Token.verify(self, *args, **kwargs)
+
+    def check_blacklist(self):
+        """폐기된 토큰이면 TokenError를 발생."""
+        if get_token_store().is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        """토큰을 폐기."""
+        get_token_store().revoke(
+            self.payload[api_settings.JTI_CLAIM],
+            self.payload["exp"],
+            user_id=self.payload.get(api_settings.USER_ID_CLAIM),
+            token=str(self),
+        )
+
+    def outstand(self):
+        """발급한 토큰을 저장소에 기록."""
+        get_token_store().outstand(
+            self.payload[api_settings.JTI_CLAIM],
+            self.payload.get(api_settings.USER_ID_CLAIM),
+            self.payload["exp"],
+            token=str(self),
+        )
+
+    @classmethod
+    def for_user(cls, user):
+        # BlacklistMixin.for_user(OutstandingToken INSERT)를 건너뛰고 Token.for_user로 토큰만 생성
+        token = super(tokens.BlacklistMixin, cls).for_user(user)
+        token.outstand()
+        return token
@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     ChangePasswordView,
+    IdentityAvailabilityView,
     KakaoAuthView,
     LoginView,
     LogoutView,
@@ -18,6 +19,7 @@ urlpatterns = [
     path("send-email-verification/", SendEmailVerificationCodeView.as_view(), name="send-email-verification"),
     path("verify-email-code/", VerifyEmailCodeView.as_view(), name="verify-email-code"),
     path("signup/", SignUpView.as_view(), name="signup"),
+    path("availability/", IdentityAvailabilityView.as_view(), name="availability"),
     path("login/", LoginView.as_view(), name="login"),
     path("social-signup-complete/", SocialSignupCompleteView.as_view(), name="social-signup-complete"),
     path("logout/", LogoutView.as_view(), name="logout"),
@@ -1,7 +1,10 @@
 import re
+from functools import reduce
+from operator import or_
 
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db.models import Count, Q
 
 from apps.common.utils import redis_client
 from apps.terms.models import Terms
@@ -10,6 +13,44 @@ from apps.users.models import User
 from .exceptions import UserValidationError
 
 
+class RedisKeys:
+    """
+    Redis 관련 이메일 상수 클래스
+
+    VERIFIED_EMAIL: 이미 인증된 이메일 cache
+    EMAIL_VERIFICATION: 특정 이메일에 보낸 인증코드 cache
+    EMAIL_REQUEST_LIMIT: 인증 요청을 이미 보낸 이메일 검증 cache
+    KAKAO_ACCESS_TOKEN: 카카오에서 발급받은 엑세스 토큰 cache
+    KAKAO_REFRESH_TOKEN: 카카오에서 발급받은 리프레시 토큰 cache
+    """
+
+    VERIFIED_EMAIL = "verified_email_{email}"
+    EMAIL_VERIFICATION = "email_verification_{email}"
+    EMAIL_REQUEST_LIMIT = "email_request_limit_{email}"
+    KAKAO_ACCESS_TOKEN = "kakao_access_token_{provider_id}"
+    KAKAO_REFRESH_TOKEN = "kakao_refresh_token_{provider_id}"
+
+    @staticmethod
+    def get_verified_email_key(email):
+        return RedisKeys.VERIFIED_EMAIL.format(email=email)
+
+    @staticmethod
+    def get_email_verification_key(email):
+        return RedisKeys.EMAIL_VERIFICATION.format(email=email)
+
+    @staticmethod
+    def get_email_request_limit_key(email):
+        return RedisKeys.EMAIL_REQUEST_LIMIT.format(email=email)
+
+    @staticmethod
+    def get_kakao_access_token_key(provider_id):
+        return RedisKeys.KAKAO_ACCESS_TOKEN.format(provider_id=provider_id)
+
+    @staticmethod
+    def get_kakao_refresh_token_key(provider_id):
+        return RedisKeys.KAKAO_REFRESH_TOKEN.format(provider_id=provider_id)
+
+
 def validate_signup_terms_agreements(value):
     """
     value 예시
@@ -43,7 +84,7 @@ def validate_signup_terms_agreements(value):
 
 def validate_user_email(email):
     # 이메일이 인증되었는지 2차 확인
-    if not redis_client.get(f"verified_email_{email}"):
+    if not redis_client.get(RedisKeys.get_verified_email_key(email)):
         raise UserValidationError("이메일 인증을 먼저 완료해야 합니다.")
     return email
 
@@ -60,15 +101,46 @@ def validate_user_password(password):
     return password
 
 
-def validate_user_phone_number(phone_number):
-    """휴대폰 번호가 숫자인지 확인"""
+def find_identity_conflicts(email=None, nickname=None, phone_number=None):
+    """이미 사용 중인 이메일, 닉네임, 휴대폰 번호를 조건부 집계 쿼리 한 번으로 확인.
+
+    닉네임과 휴대폰 번호는 소프트 삭제된 유저도 사용 중으로 보고,
+    이메일은 재가입 시 소프트 삭제된 유저를 완전 삭제하므로 삭제되지 않은 유저만 확인.
+    세 필드 모두 unique 인덱스가 (삭제 여부와 관계없이) 모든 행에 걸려 있으므로 조건마다 인덱스로 조회.
+
+    Args:
+        email (str, optional): 확인할 이메일.
+        nickname (str, optional): 확인할 닉네임.
+        phone_number (str, optional): 확인할 휴대폰 번호.
+
+    Returns:
+        set[str]: 이미 사용 중인 필드 이름 ("email", "nickname", "phone_number").
+    """
+    conditions = {}
+    if email:
+        conditions["email"] = Q(email=email, deleted_at__isnull=True)
+    if nickname:
+        conditions["nickname"] = Q(nickname=nickname)
+    if phone_number:
+        conditions["phone_number"] = Q(phone_number=phone_number)
+    if not conditions:
+        return set()
+
+    counts = User.global_objects.filter(reduce(or_, conditions.values())).aggregate(
+        **{f"{field}_count": Count("id", filter=condition) for field, condition in conditions.items()}
+    )
+    return {field for field in conditions if counts[f"{field}_count"]}
+
+
+def validate_user_phone_number(phone_number, check_duplicate=True):
+    """휴대폰 번호가 숫자인지, 이미 등록된 번호인지 확인
+
+    뷰에서 find_identity_conflicts로 이미 확인한 경우 check_duplicate=False로 중복 조회를 생략
+    """
     if not phone_number.isdigit():
         raise UserValidationError("휴대폰 번호는 숫자만 입력해야 합니다.")
 
-    if (
-        User.objects.filter(phone_number=phone_number).exists()
-        or User.deleted_objects.filter(phone_number=phone_number).exists()
-    ):
+    if check_duplicate and find_identity_conflicts(phone_number=phone_number):
         raise UserValidationError("이미 등록된 휴대폰 번호입니다.")
 
     return phone_number
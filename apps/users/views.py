@@ -1,29 +1,32 @@
-import random
-import smtplib
 import uuid
 
-import requests
 from django.conf import settings
 from django.contrib.auth import authenticate
-from django.core.mail import send_mail
 from django.db import transaction
 from django.db.utils import IntegrityError
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import serializers, status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.common.mail_queue import enqueue_mail
+from apps.common.throttles import SlidingWindowThrottle
 from apps.common.utils import redis_client
-from config.settings.base import (
-    EMAIL_HOST_USER,
-    KAKAO_CLIENT_ID,
-    KAKAO_REDIRECT_URI,
-    KAKAO_SECRET,
-)
+from config.settings.base import EMAIL_HOST_USER
 
+from . import kakao
 from .authentications import AllowInactiveUserJWTAuthentication
+from .availability import check_availability
+from .email_verification import (
+    ALREADY_VERIFIED,
+    CODE_EXISTS,
+    CODE_MISMATCH,
+    CODE_MISSING,
+    RATE_LIMITED,
+    issue_verification_code,
+    verify_email_code,
+)
 from .exceptions import UserValidationError
 from .models import Student, User
 from .serializers import (
@@ -36,45 +39,8 @@ from .serializers import (
     UserSerializer,
     VerifyEmailCodeSerializer,
 )
-from .utils import is_valid_email
-
-
-class RedisKeys:
-    """
-    Redis 관련 이메일 상수 클래스
-
-    VERIFIED_EMAIL: 이미 인증된 이메일 cache
-    EMAIL_VERIFICATION: 특정 이메일에 보낸 인증코드 cache
-    EMAIL_REQUEST_LIMIT: 인증 요청을 이미 보낸 이메일 검증 cache
-    KAKAO_ACCESS_TOKEN: 카카오에서 발급받은 엑세스 토큰 cache
-    KAKAO_REFRESH_TOKEN: 카카오에서 발급받은 리프레시 토큰 cache
-    """
-
-    VERIFIED_EMAIL = "verified_email_{email}"
-    EMAIL_VERIFICATION = "email_verification_{email}"
-    EMAIL_REQUEST_LIMIT = "email_request_limit_{email}"
-    KAKAO_ACCESS_TOKEN = "kakao_access_token_{provider_id}"
-    KAKAO_REFRESH_TOKEN = "kakao_refresh_token_{provider_id}"
-
-    @staticmethod
-    def get_verified_email_key(email):
-        return RedisKeys.VERIFIED_EMAIL.format(email=email)
-
-    @staticmethod
-    def get_email_verification_key(email):
-        return RedisKeys.EMAIL_VERIFICATION.format(email=email)
-
-    @staticmethod
-    def get_email_request_limit_key(email):
-        return RedisKeys.EMAIL_REQUEST_LIMIT.format(email=email)
-
-    @staticmethod
-    def get_kakao_access_token_key(provider_id):
-        return RedisKeys.KAKAO_ACCESS_TOKEN.format(provider_id=provider_id)
-
-    @staticmethod
-    def get_kakao_refresh_token_key(provider_id):
-        return RedisKeys.KAKAO_REFRESH_TOKEN.format(provider_id=provider_id)
+from .tokens import RefreshToken, get_token_store
+from .utils import RedisKeys, find_identity_conflicts, is_valid_email
 
 
 class SendEmailVerificationCodeView(APIView):
@@ -84,6 +50,8 @@ class SendEmailVerificationCodeView(APIView):
 
     authentication_classes = ()
     permission_classes = (AllowAny,)
+    throttle_classes = (SlidingWindowThrottle,)
+    throttle_scope = "email_verification"
 
     @extend_schema(
         summary="이메일 인증 요청",
@@ -99,7 +67,8 @@ class SendEmailVerificationCodeView(APIView):
         2. 이미 인증이 완료된 이메일인지 확인
         3. EMAIL_REQUEST_LIMIT으로 이메일 요청 테러 방지(30초 제한)
         4. 이 이메일key를 가진 캐시된 코드가 있는지 확인
-        5. 인증코드 전송
+        (2~4단계와 새 코드 저장은 Lua 스크립트 한 번으로 원자적으로 처리)
+        5. 인증코드 발송 큐에 등록 (send_queued_mail 워커가 발송하므로 SMTP 응답을 기다리지 않음)
         """
         email = request.data.get("email")
 
@@ -109,59 +78,31 @@ class SendEmailVerificationCodeView(APIView):
         if User.objects.filter(email=email, deleted_at__isnull=True).exists():
             return Response({"error": "이미 존재하는 이메일입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 이미 인증된 이메일인지 확인
-        if redis_client.get(RedisKeys.get_verified_email_key(email)):
+        # 인증 완료 여부, 재요청 제한(30초), 기존 코드 확인과 새 코드 저장(5분)을 Redis 왕복 한 번으로 처리
+        result, value = issue_verification_code(email)
+        if result == ALREADY_VERIFIED:
             return Response({"error": "이미 인증이 완료된 이메일입니다."}, status=status.HTTP_400_BAD_REQUEST)
-
-        # ttl(Time to Live) = 키에 설정된 만료 시간을 관리
         # 이미 인증을 요청한 경우 몇 초 이후에 다시 요청을 보낼 수 있는 지 알려줌(30초 시작)
-        remaining_time = redis_client.ttl(RedisKeys.get_email_request_limit_key(email))
-        if remaining_time > 0:
+        if result == RATE_LIMITED:
             return Response(
-                {"error": f"이메일 인증 요청은 {remaining_time}초 후에 가능합니다."},
+                {"error": f"이메일 인증 요청은 {value}초 후에 가능합니다."},
                 status=status.HTTP_429_TOO_MANY_REQUESTS,
             )
-
-        # 기존 인증 코드가 있는지 확인
-        existing_code = redis_client.get(RedisKeys.get_email_verification_key(email))
-
-        # 기존 코드가 이미 있거나 만료되지 않은 경우
-        if existing_code or not redis_client.ttl(RedisKeys.get_email_verification_key(email)) <= 0:
+        # 기존 코드가 만료되지 않은 경우
+        if result == CODE_EXISTS:
             return Response(
                 {"error": "인증 코드가 이미 존재합니다. 기존 코드를 사용하세요."},
                 status=status.HTTP_200_OK,
             )
+        verification_code = value
 
-        # 기존 코드가 캐시되어 있다면 삭제하는 로직(혹시 모르니까)
-        redis_client.delete(RedisKeys.get_email_verification_key(email))
-
-        # 6자리 랜덤 인증 코드 생성
-        verification_code = str(random.randint(100000, 999999))
-
-        # Redis에 인증 코드 저장 / [email_verification_key]가 저장되는 부분
-        # ex=Expiration Time -> 만료시간 설정(300초)
-        # nx=Not Exists -> 값이 존재하지 않으면 값을 설정
-        success = redis_client.set(RedisKeys.get_email_verification_key(email), verification_code, ex=300, nx=True)
-        # 만약 이미 코드가 존재했다면 기존 코드 사용
-        if not success:
-            verification_code = redis_client.get(RedisKeys.get_email_verification_key(email))
-
-        # 이메일 테러를 방지하기 위해 Rate Limiting 적용 (30초 동안 재요청 불가)
-        redis_client.setex(RedisKeys.get_email_request_limit_key(email), 30, "1")
-
-        # 인증코드 전송
+        # 인증코드 발송 큐에 등록 (SMTP 오류는 워커가 재시도)
         try:
-            send_mail(
+            enqueue_mail(
                 subject="소리상상 이메일 인증 코드입니다",
                 message=f"당신의 이메일 인증 코드는 {verification_code} 입니다.",
                 from_email=EMAIL_HOST_USER,
                 recipient_list=[email],
-                fail_silently=False,
-            )
-        except smtplib.SMTPAuthenticationError:
-            return Response(
-                {"detail": "SMTP 인증 오류: 이메일과 비밀번호를 확인하세요."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
         except Exception:
             return Response(
@@ -178,6 +119,8 @@ class VerifyEmailCodeView(APIView):
 
     authentication_classes = ()
     permission_classes = (AllowAny,)
+    throttle_classes = (SlidingWindowThrottle,)
+    throttle_scope = "email_verify"
 
     @extend_schema(
         summary="이메일 인증 확인",
@@ -190,21 +133,20 @@ class VerifyEmailCodeView(APIView):
         이메일 인증 확인하는 API
 
         1. 요청 이메일과 인증코드를 입력 받아옴
-        2. 요청 이메일을 key로 가진 인증코드를 가져옴
-        3. 인증이 성공되어 cache된 인증코드가 삭제된 상태일 때 400 error
-        4. redis에서 가져온 데이트가 byte type일수도 있어서 decode
-        5. 인증코드가 cache된 코드와 같은지 확인
-        6. 인증코드가 올바르면 요청 이메일을 redis에 cache해서 회원가입 때 인증이 완료된 이메일인지 확인
-        7. 사용된 인증코드는 삭제처리
+        2. 인증이 성공되어 cache된 인증코드가 삭제된 상태일 때 400 error
+        3. 인증코드가 cache된 코드와 같은지 확인
+        4. 인증코드가 올바르면 요청 이메일을 redis에 cache해서 회원가입 때 인증이 완료된 이메일인지 확인
+        5. 사용된 인증코드는 삭제처리
+        (2~5단계는 Lua 스크립트 한 번으로 원자적으로 처리)
         """
         email = request.data.get("email")
         input_code = request.data.get("code")
 
-        # 저장된 인증 코드 가져오기
-        stored_code = redis_client.get(RedisKeys.get_email_verification_key(email))
+        # 코드 비교, 인증 완료 표시 저장(5분), 사용한 코드 삭제를 Redis 왕복 한 번으로 처리
+        result = verify_email_code(email, input_code)
 
-        # Redis에서 가져온 데이터가 None일 경우
-        if stored_code is None:
+        # 인증 코드가 없는 경우 (만료되었거나 이미 인증에 사용됨)
+        if result == CODE_MISSING:
             return Response(
                 {
                     "error": "이미 이메일 인증에 성공하여 인증코드가 삭제된 상태입니다. 회원가입이 안되신다면 5분 후 다시 시도해주세요."
@@ -212,21 +154,49 @@ class VerifyEmailCodeView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Redis에서 가져온 데이터가 bytes일 경우 decode 처리
-        if isinstance(stored_code, bytes):
-            stored_code = stored_code.decode()
-
         # Redis의 코드와 입력코드가 다른 경우
-        if stored_code != input_code:
+        if result == CODE_MISMATCH:
             return Response({"error": "잘못된 인증 코드입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 이메일 인증 완료 여부 저장 / [verified_email_key]가 저장되는 부분
-        redis_client.setex(RedisKeys.get_verified_email_key(email), 300, "true")
+        return Response({"detail": "이메일 인증이 완료되었습니다!"}, status=status.HTTP_200_OK)
 
-        # 사용된 인증코드는 삭제
-        redis_client.delete(RedisKeys.get_email_verification_key(email))
 
-        return Response({"detail": "이메일 인증이 완료되었습니다!"}, status=status.HTTP_200_OK)
+class IdentityAvailabilityView(APIView):
+    """
+    GET 요청: 닉네임, 전화번호 사용 가능 여부 확인 (회원가입 입력 중 실시간 확인용)
+    """
+
+    authentication_classes = ()
+    permission_classes = (AllowAny,)
+    throttle_classes = (SlidingWindowThrottle,)
+    throttle_scope = "availability"
+
+    @extend_schema(
+        summary="닉네임, 전화번호 사용 가능 여부 확인",
+        description="nickname, phone_number 쿼리 파라미터로 받은 값의 사용 가능 여부를 반환합니다",
+        parameters=[
+            OpenApiParameter("nickname", str, required=False),
+            OpenApiParameter("phone_number", str, required=False),
+        ],
+        tags=["User"],
+    )
+    def get(self, request):
+        """
+        닉네임, 전화번호 사용 가능 여부 확인 API
+
+        1. Redis Bloom filter에 없는 값은 DB 조회 없이 사용 가능으로 응답
+        2. 필터에 있을 수 있는 값만 DB에서 쿼리 한 번으로 확인
+        (회원가입 시에는 SignUpView에서 DB로 다시 확인)
+        """
+        values = {
+            field: request.query_params.get(field)
+            for field in ("nickname", "phone_number")
+            if request.query_params.get(field)
+        }
+        if not values:
+            return Response({"error": "nickname 또는 phone_number를 입력하세요."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(check_availability(**values), status=status.HTTP_200_OK)
 
 
 class SignUpView(APIView):
@@ -236,6 +206,8 @@ class SignUpView(APIView):
 
     authentication_classes = ()
     permission_classes = (AllowAny,)
+    throttle_classes = (SlidingWindowThrottle,)
+    throttle_scope = "signup"
 
     @extend_schema(
         summary="회원가입", description="회원정보를 입력받아 새 사용자를 생성", request=SignupSerializer, tags=["User"]
@@ -245,7 +217,10 @@ class SignUpView(APIView):
         nickname = request.data.get("nickname")
         phone_number = request.data.get("phone_number")
 
-        if User.objects.filter(email=email, deleted_at__isnull=True).exists():
+        # 이메일, 닉네임, 전화번호 중복을 쿼리 한 번으로 확인
+        conflicts = find_identity_conflicts(email=email, nickname=nickname, phone_number=phone_number)
+
+        if "email" in conflicts:
             return Response({"detail": "이미 존재하는 이메일입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         # 이메일 인증 여부 확인
@@ -254,13 +229,10 @@ class SignUpView(APIView):
         if is_verified is None:
             return Response({"error": "이메일 인증이 완료되지 않았습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if User.objects.filter(nickname=nickname).exists() or User.deleted_objects.filter(nickname=nickname).exists():
+        if "nickname" in conflicts:
             return Response({"error": "이미 사용 중인 닉네임입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if (
-            User.objects.filter(phone_number=phone_number).exists()
-            or User.deleted_objects.filter(phone_number=phone_number).exists()
-        ):
+        if "phone_number" in conflicts:
             return Response({"error": "이미 사용 중인 전화번호입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         with transaction.atomic():
@@ -302,6 +274,8 @@ class LoginView(APIView):
 
     authentication_classes = ()
     permission_classes = (AllowAny,)
+    throttle_classes = (SlidingWindowThrottle,)
+    throttle_scope = "login"
 
     @extend_schema(
         summary="로그인", description="이메일과 비밀번호를 받아 로그인합니다", request=LoginSerializer, tags=["User"]
@@ -404,27 +378,20 @@ class LogoutView(APIView):
         # 소셜로그인 유저인지 확인 후 소셜 로그아웃 우선 진행
         if request.user.provider_id is not None:
             # 엑세스토큰 refresh 요청
-            kakao_refresh_url = "https://kauth.kakao.com/oauth/token"
-            data = {
-                "grant_type": "refresh_token",
-                "client_id": KAKAO_CLIENT_ID,
-                "client_secret": KAKAO_SECRET,
-                "refresh_token": redis_client.get(RedisKeys.get_kakao_refresh_token_key(request.user.provider_id)),
-            }
-            token_response = requests.post(kakao_refresh_url, data=data)
-            if token_response.status_code != 200:
+            token_response = kakao.refresh_token(
+                redis_client.get(RedisKeys.get_kakao_refresh_token_key(request.user.provider_id))
+            )
+            if token_response is None or token_response.status_code != 200:
                 return Response({"error": "카카오 토큰 재발급에 실패했습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
             # 소셜로그인 유저 로그아웃 요청
-            kakao_logout_url = "https://kapi.kakao.com/v1/user/logout"
             kakao_access_token = token_response.json()["access_token"]
             if kakao_access_token is None:
                 return Response(
                     {"error": "kakao_access_token을 가져오지 못했습니다."}, status=status.HTTP_400_BAD_REQUEST
                 )
-            headers = {"Authorization": f"Bearer {kakao_access_token}"}
-            logout_response = requests.post(url=kakao_logout_url, headers=headers)
-            if logout_response.status_code != 200:
+            logout_response = kakao.logout(kakao_access_token)
+            if logout_response is None or logout_response.status_code != 200:
                 return Response({"error": "카카오 로그아웃 요청에 실패했습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         # 일반 로그인 유저의 경우 여기서부터 진행
@@ -461,23 +428,16 @@ class WithdrawalView(APIView):
         if user.provider_id is not None:
             try:
                 # 엑세스토큰 refresh 요청
-                kakao_refresh_url = "https://kauth.kakao.com/oauth/token"
-                data = {
-                    "grant_type": "refresh_token",
-                    "client_id": KAKAO_CLIENT_ID,
-                    "client_secret": KAKAO_SECRET,
-                    "refresh_token": redis_client.get(RedisKeys.get_kakao_refresh_token_key(request.user.provider_id)),
-                }
-                token_response = requests.post(kakao_refresh_url, data=data)
-                if token_response.status_code != 200:
+                token_response = kakao.refresh_token(
+                    redis_client.get(RedisKeys.get_kakao_refresh_token_key(request.user.provider_id))
+                )
+                if token_response is None or token_response.status_code != 200:
                     return Response({"error": "카카오 토큰 재발급에 실패했습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
                 # 카카오 연결 끊기
-                unlink_url = "https://kapi.kakao.com/v1/user/unlink"
                 kakao_access_token = token_response.json()["access_token"]
-                headers = {"Authorization": f"Bearer {kakao_access_token}"}
-                response = requests.post(unlink_url, headers=headers)
-                if response.status_code != 200:
+                response = kakao.unlink(kakao_access_token)
+                if response is None or response.status_code != 200:
                     return Response({"error": "카카오 계정 연결 해제 실패"}, status=status.HTTP_400_BAD_REQUEST)
 
             except Exception:
@@ -506,6 +466,10 @@ class WithdrawalView(APIView):
         user.is_active = False
         user.save()
 
+        # 다른 기기에서 발급받은 refresh token도 모두 폐기
+        # (soft delete 시 OutstandingToken.user가 NULL로 바뀌므로 DatabaseTokenStore를 위해 삭제 전에 폐기)
+        get_token_store().revoke_user(user.id)
+
         # soft delete 처리
         user.delete()
 
@@ -618,19 +582,9 @@ class KakaoAuthView(APIView):
         if not kakao_code:
             return Response({"error": "인가 코드가 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 인가 코드로 카카오 액세스 토큰 요청
-        kakao_token_url = "https://kauth.kakao.com/oauth/token"
-
-        data = {
-            "grant_type": "authorization_code",
-            "client_id": KAKAO_CLIENT_ID,
-            "client_secret": KAKAO_SECRET,
-            "redirect_uri": KAKAO_REDIRECT_URI,
-            "code": kakao_code,
-        }
-
-        token_response = requests.post(kakao_token_url, data=data)
-        if token_response.status_code != 200:
+        # 인가 코드로 카카오 액세스 토큰 요청 (연결 풀을 재사용하는 kakao 클라이언트, 타임아웃 적용)
+        token_response = kakao.request_token(kakao_code)
+        if token_response is None or token_response.status_code != 200:
             return Response({"error": "카카오 토큰 요청 실패"}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
@@ -643,11 +597,9 @@ class KakaoAuthView(APIView):
             )
 
         # 액세스 토큰으로 카카오 사용자 정보 요청
-        kakao_user_info_url = "https://kapi.kakao.com/v2/user/me"
-        headers = {"Authorization": f"Bearer {kakao_access_token}"}
-        user_info_response = requests.get(kakao_user_info_url, headers=headers)
+        user_info_response = kakao.get_user_info(kakao_access_token)
 
-        if user_info_response.status_code != 200:
+        if user_info_response is None or user_info_response.status_code != 200:
             return Response({"error": "카카오 사용자 정보 요청 실패"}, status=status.HTTP_400_BAD_REQUEST)
 
         kakao_user_info = user_info_response.json()
@@ -758,13 +710,13 @@ class SocialSignupCompleteView(APIView):
         if user.is_active:
             return Response({"error": "이미 활성화 된 유저입니다."})
 
-        if User.objects.filter(nickname=nickname).exists() or User.deleted_objects.filter(nickname=nickname).exists():
+        # 닉네임, 전화번호 중복을 쿼리 한 번으로 확인
+        conflicts = find_identity_conflicts(nickname=nickname, phone_number=phone_number)
+
+        if "nickname" in conflicts:
             return Response({"error": "이미 사용 중인 닉네임입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if (
-            User.objects.filter(phone_number=phone_number).exists()
-            or User.deleted_objects.filter(phone_number=phone_number).exists()
-        ):
+        if "phone_number" in conflicts:
             return Response({"error": "이미 사용 중인 전화번호입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         with transaction.atomic():
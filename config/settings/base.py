@@ -53,7 +53,8 @@ PACKAGE = [
     "drf_spectacular",  # 디버그일 때만 url 추가되도록 할 것
     "rest_framework",
     "rest_framework_simplejwt",
-    "rest_framework_simplejwt.token_blacklist",
+    "rest_framework_simplejwt.token_blacklist",  # DatabaseTokenStore, prune_refresh_tokens 커맨드에서 사용
+    "apps.common.apps.CommonConfig",
     "apps.users.apps.UsersConfig",
     "apps.terms.apps.TermsConfig",
     "apps.courses.apps.CoursesConfig",
@@ -111,6 +112,38 @@ DATABASES = {
     }
 }
 
+# Redis
+# Django 캐시(CACHES)와 apps.common.utils.redis_client가 같은 서버 설정과 커넥션 풀 설정을 사용
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+REDIS_DB = 0  # redis_client가 쓰는 DB (진행률 버퍼, 업로드 세션, 캐시 generation 등)
+REDIS_CACHE_DB = 1  # Django 캐시 DB (cache.clear()가 FLUSHDB로 동작하므로 redis_client 데이터와 분리)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))  # 프로세스당 커넥션 풀 최대 크기
+REDIS_SOCKET_TIMEOUT = 5  # 명령 응답 대기 시간 (초)
+REDIS_SOCKET_CONNECT_TIMEOUT = 3  # 연결 대기 시간 (초)
+REDIS_HEALTH_CHECK_INTERVAL = 30  # 풀에서 꺼낸 커넥션이 이 시간(초) 이상 놀았으면 PING으로 확인 후 사용
+REDIS_CONNECTION_POOL_KWARGS = {
+    "max_connections": REDIS_MAX_CONNECTIONS,
+    "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_CACHE_DB}",
+        "KEY_PREFIX": "cache",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # 목록 응답처럼 큰 값은 pickle 대신 msgpack + zlib으로 저장 (benchmark_cache 커맨드로 비교 가능)
+            "SERIALIZER": "django_redis.serializers.msgpack.MSGPackSerializer",
+            "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
+            "SOCKET_TIMEOUT": REDIS_SOCKET_TIMEOUT,
+            "SOCKET_CONNECT_TIMEOUT": REDIS_SOCKET_CONNECT_TIMEOUT,
+            "CONNECTION_POOL_KWARGS": REDIS_CONNECTION_POOL_KWARGS,
+        },
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -159,10 +192,34 @@ AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("apps.users.authentications.RoleJWTAuthentication",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # nginx 한 대를 거쳐 들어오므로 X-Forwarded-For의 마지막 주소를 클라이언트 IP로 사용 (요청 제한 키)
+    "NUM_PROXIES": 1,
+    # apps.common.throttles.SlidingWindowThrottle 요청 제한 ({scope}_ip: IP별, {scope}_email: 이메일별, {scope}: 전체)
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": "20/min",
+        "login_email": "10/min",
+        "login": "600/min",
+        "email_verification_ip": "10/min",
+        "email_verification_email": "10/hour",
+        "email_verification": "300/min",
+        "email_verify_ip": "30/min",
+        "email_verify_email": "10/min",
+        "email_verify": "600/min",
+        "signup_ip": "10/hour",
+        "signup": "120/min",
+        "availability_ip": "120/min",
+    },
 }
 
+# apps.common.pagination.KeysetPagination 기본/최대 페이지 크기
+KEYSET_PAGE_SIZE = 20
+KEYSET_MAX_PAGE_SIZE = 100
+
+# refresh token 발급/폐기 상태 저장소 (apps.users.tokens.RedisTokenStore 또는 DatabaseTokenStore)
+REFRESH_TOKEN_STORE = os.getenv("REFRESH_TOKEN_STORE", "apps.users.tokens.RedisTokenStore")
+
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = ["http://localhost:3000", "https://api.umdoong.shop"]
 CORS_ALLOW_CREDENTIALS = True  # 쿠키를 포함한 요청 허용
@@ -174,7 +231,16 @@ CSRF_COOKIE_DOMAIN = ".umdoong.shop"
 SESSION_COOKIE_DOMAIN = os.getenv("SESSION_COOKIE_DOMAIN", ".127.0.0.1")
 
 # Email
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+# 로컬 개발, 부하 테스트 시 SMTP 서버 없이 확인할 수 있도록 환경 변수로 백엔드를 바꿀 수 있음
+# (django.core.mail.backends.console.EmailBackend 또는 django.core.mail.backends.filebased.EmailBackend)
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
+EMAIL_FILE_PATH = os.getenv("EMAIL_FILE_PATH", BASE_DIR / "tmp" / "emails")  # filebased 백엔드 사용 시 저장 경로
+EMAIL_TIMEOUT = 10  # SMTP 서버 응답 대기 시간 (초)
+
+# 이메일 인증 설정
+EMAIL_VERIFICATION_CODE_TTL = 60 * 5  # 인증 코드 유효 시간 (초)
+EMAIL_REQUEST_LIMIT_TTL = 30  # 같은 이메일로 인증 코드를 다시 요청할 수 있을 때까지의 시간 (초)
+VERIFIED_EMAIL_TTL = 60 * 5  # 인증 완료 후 회원가입을 마쳐야 하는 시간 (초)
 EMAIL_HOST = "smtp.naver.com"
 EMAIL_USE_TLS = True
 EMAIL_USE_SSL = False
@@ -199,10 +265,69 @@ AWS_STORAGE_BUCKET_NAME = os.getenv("NCP_BUCKET_NAME")  # 버킷 이름
 AWS_S3_ENDPOINT_URL = "https://kr.object.ncloudstorage.com"  # NCP Object Storage 엔드포인트
 AWS_S3_REGION_NAME = "kr-standard"
 AWS_S3_DEFAULT_ACL = "public-read"
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.getenv("NCP_MAX_POOL_CONNECTIONS", 20))  # 워커당 공유 클라이언트의 커넥션 풀 크기
 MEDIA_URL = f"https://{os.getenv('NCP_BUCKET_NAME')}.kr.object.ncloudstorage.com/"
 
+# Signed URL 캐시 설정 (남은 유효 시간이 MIN_REMAINING_RATIO 이상인 URL만 재사용)
+SIGNED_URL_CACHE_MAX_ENTRIES = 10000
+SIGNED_URL_CACHE_MIN_REMAINING_RATIO = 0.5
+SIGNED_URL_CACHE_USE_REDIS = os.getenv("SIGNED_URL_CACHE_USE_REDIS", "true").lower() == "true"
+
+# 2단계 캐시 설정 (Redis 앞에 두는 워커 프로세스 내 LRU, 무효화는 Redis pub/sub으로 전파)
+NEAR_CACHE_MAX_ENTRIES = 1000  # 워커당 보관할 최대 키 수
+NEAR_CACHE_TTL = 60  # 무효화 메시지를 놓친 경우에도 오래된 값이 남아있을 수 있는 최대 시간 (초)
+
+# 캐시 채우기 설정 (apps.common.cache_fill.get_or_fill, 동시에 만료된 캐시를 한 요청만 다시 만듦)
+CACHE_FILL_LOCK_TIMEOUT = 10  # 값을 만드는 요청이 잡는 Redis 잠금의 최대 유지 시간 (초)
+CACHE_FILL_WAIT_TIMEOUT = 2  # stale 값이 없을 때 다른 요청이 값을 채우길 기다리는 최대 시간 (초)
+CACHE_FILL_POLL_INTERVAL = 0.05  # 기다리는 동안 캐시를 다시 확인하는 간격 (초)
+CACHE_FILL_BETA = 1.0  # XFetch 조기 갱신 가중치 (0이면 만료 전에 미리 갱신하지 않음)
+
+# 권한 확인용 캐시 설정 (학생의 활성 과정 ID와 객체 -> 과정 ID, 변경 시 캐시 세대 번호로 무효화)
+ENROLLMENT_ACCESS_CACHE_TTL = 60 * 60 * 24  # 캐시 보관 기간 (초)
+
+# 파일 삭제 outbox 설정 (drain_storage_deletions 커맨드가 처리)
+STORAGE_DELETION_MAX_ATTEMPTS = 8  # 이 횟수 이상 실패한 삭제 요청은 재시도하지 않고 남겨둠
+
+# 닉네임, 휴대폰 번호 사용 가능 여부 확인용 Bloom filter 설정 (rebuild_identity_filters 커맨드로 생성)
+USER_IDENTITY_FILTER_BITS = 2**24  # 필터 크기 (2MB, 유저 100만 명일 때 오탐률 약 0.05%)
+USER_IDENTITY_FILTER_HASHES = 7  # 값마다 설정할 비트 수
+
+# 메일 발송 큐 설정 (send_queued_mail 커맨드가 SMTP 연결을 유지하면서 배치로 발송)
+MAIL_QUEUE_BATCH_SIZE = 50  # 한 번에 꺼내서 보낼 최대 메일 수
+MAIL_QUEUE_POLL_INTERVAL = 1.0  # 큐가 비어있을 때 다시 확인하는 간격 (초)
+MAIL_QUEUE_CONNECTION_IDLE_TIMEOUT = 60  # 보낼 메일이 없을 때 SMTP 연결을 유지하는 시간 (초)
+MAIL_QUEUE_MAX_ATTEMPTS = 5  # 이 횟수 이상 실패한 메일은 dead-letter 목록으로 옮김
+MAIL_QUEUE_RETRY_BASE_DELAY = 5  # 첫 재시도 대기 시간 (초), 실패할 때마다 두 배
+MAIL_QUEUE_RETRY_MAX_DELAY = 60  # 최대 재시도 대기 시간 (초, 인증 코드 유효 시간 5분 안에 재시도가 끝나도록 설정)
+MAIL_QUEUE_DEAD_LETTER_MAX_LENGTH = 1000  # dead-letter 목록에 보관할 최대 메일 수
+MAIL_QUEUE_WORKER_TTL = (
+    300  # 워커 heartbeat 유효 시간 (초), 지나면 다른 워커가 시작할 때 처리 중이던 메일을 큐로 되돌림
+)
+
+# 강의 영상 Multipart Upload 설정 (클라이언트가 파트별 Signed URL로 Object Storage에 직접 업로드)
+CHAPTER_VIDEO_UPLOAD_PART_SIZE = 64 * 1024 * 1024  # 권장 파트 크기 (파일이 크면 파트 수 10000개에 맞춰 늘어남)
+CHAPTER_VIDEO_UPLOAD_MAX_PART_URLS = 100  # 한 번의 요청으로 발급하는 최대 파트 URL 수
+CHAPTER_VIDEO_UPLOAD_URL_EXPIRATION = 60 * 60  # 파트 URL 유효 시간 (초)
+CHAPTER_VIDEO_UPLOAD_SESSION_TTL = 60 * 60 * 24 * 3  # 업로드 세션 보관 기간 (초), 이 기간 안에 이어서 업로드 가능
+
+# 학습 진행률 heartbeat 버퍼 설정 (flush_progress_buffer 커맨드가 주기적으로 DB에 저장)
+PROGRESS_BUFFER_FLUSH_INTERVAL = float(os.getenv("PROGRESS_BUFFER_FLUSH_INTERVAL", 5))  # flush 주기 (초)
+PROGRESS_BUFFER_BATCH_SIZE = 1000  # 한 번의 INSERT로 저장할 최대 행 수
+PROGRESS_BUFFER_TTL = 60 * 60 * 24  # flush 워커가 멈춘 경우에도 버퍼가 무한히 남지 않도록 설정하는 TTL (초)
+PROGRESS_VIDEO_DURATION_CACHE_TTL = 60 * 10  # heartbeat 검증에 쓰는 영상 길이 캐시 TTL (초)
+
 
 # Social
 KAKAO_CLIENT_ID = (os.getenv("KAKAO_CLIENT_ID"),)
 KAKAO_SECRET = (os.getenv("KAKAO_SECRET"),)
 KAKAO_REDIRECT_URI = (os.getenv("KAKAO_REDIRECT_URI"),)
+# 카카오 API 주소 (로컬 부하 테스트 시 kakao_stub_server 주소로 바꿔서 사용)
+KAKAO_AUTH_URL = os.getenv("KAKAO_AUTH_URL", "https://kauth.kakao.com")
+KAKAO_API_URL = os.getenv("KAKAO_API_URL", "https://kapi.kakao.com")
+# 카카오 API HTTP 클라이언트 설정 (워커 프로세스마다 keep-alive 연결 풀을 가진 Session 하나를 재사용)
+KAKAO_HTTP_POOL_SIZE = 10  # 호스트별로 유지할 최대 연결 수
+KAKAO_HTTP_CONNECT_TIMEOUT = 3  # 연결 대기 시간 (초)
+KAKAO_HTTP_READ_TIMEOUT = 5  # 응답 대기 시간 (초)
+KAKAO_HTTP_MAX_RETRIES = 2  # 연결 실패, GET 요청의 502/503/504 응답 시 재시도 횟수
+KAKAO_HTTP_BACKOFF_FACTOR = 0.2  # 재시도 대기 시간 (0.2초, 0.4초 ...)